@@ -1,175 +1,241 @@
-import time
-import tkinter as tk
-from tkinter import messagebox
-
-def simple_hash(data):
-    """Қарапайым хэш функциясы."""
-    hash_value = 0
-    prime = 31  # Хэшті тұрақты ету үшін жай сан
-
-    for i, char in enumerate(data):
-        hash_value += (ord(char) * (i + 1))
-        hash_value = hash_value * prime
-
-    return hash_value & 0xFFFFFFFF  # 32-бит шектеу
-
-class UTXOModel:
-    """UTXO моделі: Аккаунт баланстарын сақтау."""
-    def __init__(self):
-        self.balances = {}
-
-    def update_balance(self, sender, receiver, amount, fee):
-        if sender not in self.balances:
-            self.balances[sender] = 100  # Бастапқы баланс
-        if receiver not in self.balances:
-            self.balances[receiver] = 100  # Бастапқы баланс
-
-        if self.balances[sender] >= amount + fee:
-            self.balances[sender] -= amount + fee
-            self.balances[receiver] += amount
-            return True
-        return False
-
-    def get_balance(self, account):
-        return self.balances.get(account, 100)
-
-class Transaction:
-    """Транзакция құрылымы."""
-    def __init__(self, sender, receiver, amount, fee, utxo_model):
-        self.sender = sender
-        self.receiver = receiver
-        self.amount = amount
-        self.fee = fee
-        # Балансты жаңарту. Егер транзакция дұрыс болмаса, valid=False болады.
-        self.valid = utxo_model.update_balance(sender, receiver, amount, fee)
-        self.tx_hash = self.calculate_hash()
-
-    def calculate_hash(self):
-        return simple_hash(f"{self.sender}{self.receiver}{self.amount}{self.fee}")
-
-class MerkleTree:
-    """Merkle Tree (Меркле ағашы) құрылымы."""
-    def __init__(self, transactions):
-        self.transactions = transactions
-        self.root = self.build_merkle_root()
-
-    def build_merkle_root(self):
-        """Меркле түбірін есептеу."""
-        if not self.transactions:
-            return "Бос"
-
-        tx_hashes = [tx.tx_hash for tx in self.transactions]
-
-        while len(tx_hashes) > 1:
-            if len(tx_hashes) % 2 != 0:
-                tx_hashes.append(tx_hashes[-1])  # Егер тақ болса, соңғыны қайталаймыз
-
-            new_level = []
-            for i in range(0, len(tx_hashes), 2):
-                combined_hash = simple_hash(str(tx_hashes[i]) + str(tx_hashes[i + 1]))
-                new_level.append(combined_hash)
-
-            tx_hashes = new_level
-
-        return tx_hashes[0]
-
-class Block:
-    """Блок құрылымы."""
-    def __init__(self, previous_hash, transactions):
-        self.timestamp = time.strftime('%Y-%m-%d %H:%M:%S')  # Уақыт белгісі
-        self.previous_hash = previous_hash  # Алдыңғы блоктың хэші
-        self.transactions = transactions  # Транзакциялар
-        self.merkle_root = MerkleTree(transactions).root  # Меркле түбірі
-        self.hash = self.calculate_hash()  # Блоктың хэші
-
-    def calculate_hash(self):
-        return simple_hash(f"{self.timestamp}{self.previous_hash}{self.merkle_root}{[tx.tx_hash for tx in self.transactions]}")
-
-class Blockchain:
-    """Блокчейн құрылымы."""
-    def __init__(self):
-        self.chain = [self.create_genesis_block()]
-
-    def create_genesis_block(self):
-        return Block("0", [])
-
-    def add_block(self, transactions):
-        previous_block = self.chain[-1]
-        new_block = Block(previous_block.hash, transactions)
-        self.chain.append(new_block)
-
-    def is_valid_chain(self):
-        """Блокчейннің дұрыстығын тексеру."""
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i - 1]
-
-            if current_block.previous_hash != previous_block.hash:
-                return False  # Хэш дұрыс емес
-
-            if current_block.hash != current_block.calculate_hash():
-                return False  # Деректер өзгертілген
-
-        return True
-
-# === Блокчейн мен UTXO моделін құру ===
-utxo_model = UTXOModel()
-blockchain = Blockchain()
-
-# Бірінші блок транзакциялары
-transactions1 = [
-    Transaction("Alice", "Bob", 10, 0.1, utxo_model),
-    Transaction("Bob", "Charlie", 5, 0.05, utxo_model)
-]
-
-# Екінші блок транзакциялары
-transactions2 = [
-    Transaction("Charlie", "Dave", 15, 0.2, utxo_model)
-]
-
-blockchain.add_block(transactions1)
-blockchain.add_block(transactions2)
-
-# === GUI Интерфейсі ===
-def show_blocks():
-    """Блоктарды GUI-да көрсету."""
-    for widget in frame.winfo_children():
-        widget.destroy()
-
-    for i, block in enumerate(blockchain.chain):
-        validity = "✅ Жарамды" if i == 0 or block.previous_hash == blockchain.chain[i - 1].hash else "❌ Жарамсыз"
-        transactions_info = "\n".join([
-            f"Жіберуші: {tx.sender}, Алушы: {tx.receiver}, Сома: {tx.amount}, Адрес: {tx.tx_hash}"
-            for tx in block.transactions
-        ])
-        block_info = (f"Блок {i}\n"
-                      f"Хэш: {block.hash}\n"
-                      f"Уақыт: {block.timestamp}\n"
-                      f"Меркле түбірі: {block.merkle_root}\n"
-                      f"Транзакциялар:\n{transactions_info}\n"
-                      f"{validity}")
-        
-        label = tk.Label(frame, text=block_info, padx=10, pady=10, borderwidth=2, relief="solid", font=("Arial", 10))
-        label.pack(pady=5, fill="x")
-
-def check_validity():
-    """Блокчейннің дұрыстығын тексеру."""
-    if blockchain.is_valid_chain():
-        messagebox.showinfo("Блокчейн дұрыстығы", "✅ Блокчейн жарамды!")
-    else:
-        messagebox.showerror("Блокчейн қатесі", "❌ Блокчейнде қате бар!")
-
-# === Негізгі GUI терезесі ===
-root = tk.Tk()
-root.title("Блок Эксплорер")
-
-frame = tk.Frame(root)
-frame.pack(padx=10, pady=10)
-
-show_blocks_button = tk.Button(root, text="Блоктарды көрсету", command=show_blocks)
-show_blocks_button.pack(pady=5)
-
-check_validity_button = tk.Button(root, text="Блокчейнді тексеру", command=check_validity)
-check_validity_button.pack(pady=5)
-
-root.mainloop()
+import time
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+def simple_hash(data):
+    """Қарапайым хэш функциясы."""
+    hash_value = 0
+    prime = 31  # Хэшті тұрақты ету үшін жай сан
+
+    for i, char in enumerate(data):
+        hash_value += (ord(char) * (i + 1))
+        hash_value = hash_value * prime
+
+    return hash_value & 0xFFFFFFFF  # 32-бит шектеу
+
+class UTXOModel:
+    """UTXO моделі: Аккаунт баланстарын сақтау."""
+    def __init__(self):
+        self.balances = {}
+
+    def update_balance(self, sender, receiver, amount, fee):
+        if sender not in self.balances:
+            self.balances[sender] = 100  # Бастапқы баланс
+        if receiver not in self.balances:
+            self.balances[receiver] = 100  # Бастапқы баланс
+
+        if self.balances[sender] >= amount + fee:
+            self.balances[sender] -= amount + fee
+            self.balances[receiver] += amount
+            return True
+        return False
+
+    def get_balance(self, account):
+        return self.balances.get(account, 100)
+
+class Transaction:
+    """Транзакция құрылымы."""
+    def __init__(self, sender, receiver, amount, fee, utxo_model):
+        self.sender = sender
+        self.receiver = receiver
+        self.amount = amount
+        self.fee = fee
+        # Балансты жаңарту. Егер транзакция дұрыс болмаса, valid=False болады.
+        self.valid = utxo_model.update_balance(sender, receiver, amount, fee)
+        self.tx_hash = self.calculate_hash()
+
+    def calculate_hash(self):
+        return simple_hash(f"{self.sender}{self.receiver}{self.amount}{self.fee}")
+
+class MerkleTree:
+    """Merkle Tree (Меркле ағашы) құрылымы."""
+    def __init__(self, transactions):
+        self.transactions = transactions
+        self.root = self.build_merkle_root()
+
+    def build_merkle_root(self):
+        """Меркле түбірін есептеу."""
+        if not self.transactions:
+            return "Бос"
+
+        tx_hashes = [tx.tx_hash for tx in self.transactions]
+
+        while len(tx_hashes) > 1:
+            if len(tx_hashes) % 2 != 0:
+                tx_hashes.append(tx_hashes[-1])  # Егер тақ болса, соңғыны қайталаймыз
+
+            new_level = []
+            for i in range(0, len(tx_hashes), 2):
+                combined_hash = simple_hash(str(tx_hashes[i]) + str(tx_hashes[i + 1]))
+                new_level.append(combined_hash)
+
+            tx_hashes = new_level
+
+        return tx_hashes[0]
+
+class Block:
+    """Блок құрылымы."""
+    def __init__(self, previous_hash, transactions):
+        self.timestamp = time.strftime('%Y-%m-%d %H:%M:%S')  # Уақыт белгісі
+        self.previous_hash = previous_hash  # Алдыңғы блоктың хэші
+        self.transactions = transactions  # Транзакциялар
+        self.merkle_root = MerkleTree(transactions).root  # Меркле түбірі
+        self.hash = self.calculate_hash()  # Блоктың хэші
+
+    def calculate_hash(self):
+        return simple_hash(f"{self.timestamp}{self.previous_hash}{self.merkle_root}{[tx.tx_hash for tx in self.transactions]}")
+
+class Blockchain:
+    """Блокчейн құрылымы."""
+    def __init__(self):
+        self.chain = [self.create_genesis_block()]
+
+    def create_genesis_block(self):
+        return Block("0", [])
+
+    def add_block(self, transactions):
+        previous_block = self.chain[-1]
+        new_block = Block(previous_block.hash, transactions)
+        self.chain.append(new_block)
+
+    def is_valid_chain(self):
+        """Блокчейннің дұрыстығын тексеру."""
+        for i in range(1, len(self.chain)):
+            current_block = self.chain[i]
+            previous_block = self.chain[i - 1]
+
+            if current_block.previous_hash != previous_block.hash:
+                return False  # Хэш дұрыс емес
+
+            if current_block.hash != current_block.calculate_hash():
+                return False  # Деректер өзгертілген
+
+        return True
+
+# === Блокчейн мен UTXO моделін құру ===
+utxo_model = UTXOModel()
+blockchain = Blockchain()
+
+# Бірінші блок транзакциялары
+transactions1 = [
+    Transaction("Alice", "Bob", 10, 0.1, utxo_model),
+    Transaction("Bob", "Charlie", 5, 0.05, utxo_model)
+]
+
+# Екінші блок транзакциялары
+transactions2 = [
+    Transaction("Charlie", "Dave", 15, 0.2, utxo_model)
+]
+
+blockchain.add_block(transactions1)
+blockchain.add_block(transactions2)
+
+# === GUI Интерфейсі ===
+# Блоктар виртуалданған тізімде көрсетіледі: Treeview-те тек ағымдағы беттің
+# PAGE_SIZE жолы ғана құрылады, транзакциялар тек таңдалған блок үшін шығарылады.
+PAGE_SIZE = 50
+current_page = 0
+
+def page_count():
+    return max(1, (len(blockchain.chain) + PAGE_SIZE - 1) // PAGE_SIZE)
+
+def block_validity(i):
+    block = blockchain.chain[i]
+    return "✅ Жарамды" if i == 0 or block.previous_hash == blockchain.chain[i - 1].hash else "❌ Жарамсыз"
+
+def render_page(page):
+    """Тек page бетіндегі блоктарды Treeview-ке жазу."""
+    global current_page
+    current_page = max(0, min(page, page_count() - 1))
+    block_tree.delete(*block_tree.get_children())
+    start = current_page * PAGE_SIZE
+    for i in range(start, min(start + PAGE_SIZE, len(blockchain.chain))):
+        block = blockchain.chain[i]
+        block_tree.insert("", "end", iid=str(i),
+                          values=(i, block.hash, block.timestamp, len(block.transactions), block_validity(i)))
+    page_label.config(text=f"Бет {current_page + 1}/{page_count()}")
+
+def show_blocks():
+    """Блоктарды GUI-да көрсету (ағымдағы бет)."""
+    render_page(current_page)
+
+def show_block_details(event=None):
+    """Таңдалған блоктың толық мәліметін көрсету."""
+    selection = block_tree.selection()
+    if not selection:
+        return
+    i = int(selection[0])
+    block = blockchain.chain[i]
+    transactions_info = "\n".join([
+        f"Жіберуші: {tx.sender}, Алушы: {tx.receiver}, Сома: {tx.amount}, Адрес: {tx.tx_hash}"
+        for tx in block.transactions
+    ])
+    block_info = (f"Блок {i}\n"
+                  f"Хэш: {block.hash}\n"
+                  f"Уақыт: {block.timestamp}\n"
+                  f"Меркле түбірі: {block.merkle_root}\n"
+                  f"Транзакциялар:\n{transactions_info}\n"
+                  f"{block_validity(i)}")
+    block_details.delete("1.0", tk.END)
+    block_details.insert(tk.END, block_info)
+
+def jump_to_height():
+    """Берілген биіктіктегі блокқа өту."""
+    try:
+        height = int(entry_height.get())
+    except ValueError:
+        messagebox.showerror("Қате", "Биіктік бүтін сан болуы тиіс.")
+        return
+    if not 0 <= height < len(blockchain.chain):
+        messagebox.showerror("Қате", f"Биіктік 0 мен {len(blockchain.chain) - 1} аралығында болуы тиіс.")
+        return
+    render_page(height // PAGE_SIZE)
+    block_tree.selection_set(str(height))
+    block_tree.see(str(height))
+    show_block_details()
+
+def check_validity():
+    """Блокчейннің дұрыстығын тексеру."""
+    if blockchain.is_valid_chain():
+        messagebox.showinfo("Блокчейн дұрыстығы", "✅ Блокчейн жарамды!")
+    else:
+        messagebox.showerror("Блокчейн қатесі", "❌ Блокчейнде қате бар!")
+
+# === Негізгі GUI терезесі ===
+root = tk.Tk()
+root.title("Блок Эксплорер")
+
+frame = tk.Frame(root)
+frame.pack(padx=10, pady=10, fill="both", expand=True)
+
+nav_frame = tk.Frame(frame)
+nav_frame.pack(fill="x", pady=5)
+
+tk.Button(nav_frame, text="◀", command=lambda: render_page(current_page - 1)).pack(side="left")
+page_label = tk.Label(nav_frame, text="Бет 1/1")
+page_label.pack(side="left", padx=5)
+tk.Button(nav_frame, text="▶", command=lambda: render_page(current_page + 1)).pack(side="left")
+tk.Button(nav_frame, text="Соңғы", command=lambda: render_page(page_count() - 1)).pack(side="left", padx=5)
+tk.Label(nav_frame, text="Биіктік:").pack(side="left", padx=(20, 0))
+entry_height = tk.Entry(nav_frame, width=8)
+entry_height.pack(side="left", padx=5)
+tk.Button(nav_frame, text="Өту", command=jump_to_height).pack(side="left")
+
+block_tree = ttk.Treeview(frame, columns=("height", "hash", "time", "txs", "validity"), show="headings", height=15)
+for column, title, width in (("height", "Блок", 60), ("hash", "Хэш", 120), ("time", "Уақыт", 150),
+                             ("txs", "Транзакциялар", 100), ("validity", "Күйі", 110)):
+    block_tree.heading(column, text=title)
+    block_tree.column(column, width=width, anchor="w")
+block_tree.pack(fill="both", expand=True)
+block_tree.bind("<<TreeviewSelect>>", show_block_details)
+
+block_details = tk.Text(frame, height=8, font=("Arial", 10))
+block_details.pack(fill="x", pady=5)
+
+show_blocks_button = tk.Button(root, text="Блоктарды көрсету", command=show_blocks)
+show_blocks_button.pack(pady=5)
+
+check_validity_button = tk.Button(root, text="Блокчейнді тексеру", command=check_validity)
+check_validity_button.pack(pady=5)
+
+root.mainloop()
@@ -1,428 +1,1104 @@
-import time
-import tkinter as tk
-from tkinter import messagebox, filedialog
-import json
-
-# ===== RSA АСИММЕТРИЯЛЫ ҚЫЛУ ФУНКЦИЯЛАРЫ =====
-def gcd(a, b):
-    """Екі санның ортақ бөлгішін табу."""
-    while b:
-        a, b = b, a % b
-    return a
-
-def egcd(a, b):
-    """Кеңейтілген Эвклид алгоритмі."""
-    if a == 0:
-        return (b, 0, 1)
-    else:
-        g, y, x = egcd(b % a, a)
-        return (g, x - (b // a) * y, y)
-
-def mod_inverse(a, m):
-    """Модульдік кері элементті табу: a * x ≡ 1 (mod m)."""
-    g, x, _ = egcd(a, m)
-    if g != 1:
-        raise Exception("Модульдік кері элемент жоқ.")
-    return x % m
-
-def is_prime(n):
-    """n санының жай сан екенін тексеру."""
-    if n < 2:
-        return False
-    for i in range(2, int(n ** 0.5) + 1):
-        if n % i == 0:
-            return False
-    return True
-
-def generate_keypair(p, q):
-    """
-    RSA кілт жұбын генерациялау:
-      - p және q: екі жай сан.
-      - n = p * q, phi = (p - 1) * (q - 1)
-      - Ашық кілт үшін e таңдалады (1 < e < phi, gcd(e, phi) = 1).
-      - Жеке кілт d есептеледі: e * d ≡ 1 (mod phi).
-    Ашық кілт: (e, n), жеке кілт: (d, n)
-    """
-    if not (is_prime(p) and is_prime(q)):
-        raise ValueError("p және q жай сандар болуы тиіс.")
-    if p == q:
-        raise ValueError("p және q бір-біріне тең болмауы керек.")
-    
-    n = p * q
-    phi = (p - 1) * (q - 1)
-    
-    e = 65537  # Әдетте қолданылатын e мәні
-    if gcd(e, phi) != 1:
-        e = 3
-        while gcd(e, phi) != 1:
-            e += 2
-    d = mod_inverse(e, phi)
-    return (e, n), (d, n)
-
-# ===== Қарапайым Хэш Функциясы =====
-def simple_hash(data):
-    """Қарапайым хэш функциясы."""
-    hash_value = 0
-    prime = 31  # Хэшті тұрақты ету үшін жай сан
-    for i, char in enumerate(data):
-        hash_value += (ord(char) * (i + 1))
-        hash_value = hash_value * prime
-    return hash_value & 0xFFFFFFFF  # 32-бит шектеу
-
-# ===== Wallets (әмияндар) және Аккаунт Адрестері =====
-# Аккаунттың адресі ретінде ашық кілттің хэші пайдаланылады.
-wallets = {}
-
-def create_wallet(name, p, q):
-    """
-    name - пайдаланушы аты,
-    p, q - RSA үшін таңдалған жай сандар.
-    Әмиян құрылып, ашық кілттің хэшінен аккаунт адресі есептеледі.
-    """
-    public_key, private_key = generate_keypair(p, q)
-    address = simple_hash(str(public_key))
-    wallet = {
-        'name': name,
-        'public_key': public_key,
-        'private_key': private_key,
-        'address': address
-    }
-    wallets[address] = wallet
-    return wallet
-
-# ===== UTXO Моделі =====
-class UTXOModel:
-    """UTXO моделі: Аккаунт баланстарын сақтау."""
-    def __init__(self):
-        self.balances = {}
-    
-    def update_balance(self, sender, receiver, amount, fee):
-        if sender not in self.balances:
-            self.balances[sender] = 100  # Бастапқы баланс
-        if receiver not in self.balances:
-            self.balances[receiver] = 100  # Бастапқы баланс
-        
-        if self.balances[sender] >= amount + fee:
-            self.balances[sender] -= (amount + fee)
-            self.balances[receiver] += amount
-            return True
-        return False
-
-    def get_balance(self, account):
-        return self.balances.get(account, 100)
-    
-    def validate_balances(self):
-        """Барлық аккаунттардың балансы теріс болмауы тиіс."""
-        return all(balance >= 0 for balance in self.balances.values())
-
-# ===== Transaction (Транзакция) Класы =====
-class Transaction:
-    """Транзакция құрылымы, сандық қолтаңба қосылған."""
-    def __init__(self, sender, receiver, amount, fee, utxo_model):
-        """
-        sender, receiver - аккаунт адресі (ашық кілттің хэші),
-        amount, fee - сома және комиссия,
-        utxo_model - UTXO моделі арқылы баланс тексеріледі.
-        """
-        self.sender = sender
-        self.receiver = receiver
-        self.amount = amount
-        self.fee = fee
-        self.valid = utxo_model.update_balance(sender, receiver, amount, fee)
-        self.tx_hash = self.calculate_hash()
-        self.signature = None
-        if self.valid and self.sender in wallets:
-            private_key = wallets[self.sender]['private_key']  # (d, n)
-            n = private_key[1]
-            self.signature = pow(self.tx_hash % n, private_key[0], n)
-    
-    def calculate_hash(self):
-        return simple_hash(f"{self.sender}{self.receiver}{self.amount}{self.fee}")
-    
-    def verify_signature(self):
-        """Цифрлық қолтаңбаның жарамдылығын ашық кілт арқылы тексеру."""
-        if self.signature is None or self.sender not in wallets:
-            return False
-        public_key = wallets[self.sender]['public_key']  # (e, n)
-        n = public_key[1]
-        decrypted = pow(self.signature, public_key[0], n)
-        return decrypted == (self.tx_hash % n)
-
-# ===== Merkle Tree (Меркле ағашы) =====
-class MerkleTree:
-    """Merkle Tree (Меркле ағашы) құрылымы."""
-    def __init__(self, transactions):
-        self.transactions = transactions
-        self.root = self.build_merkle_root()
-    
-    def build_merkle_root(self):
-        """Меркле түбірін есептеу."""
-        if not self.transactions:
-            return "Бос"
-        
-        tx_hashes = [tx.tx_hash for tx in self.transactions]
-        while len(tx_hashes) > 1:
-            if len(tx_hashes) % 2 != 0:
-                tx_hashes.append(tx_hashes[-1])
-            new_level = []
-            for i in range(0, len(tx_hashes), 2):
-                combined_hash = simple_hash(str(tx_hashes[i]) + str(tx_hashes[i + 1]))
-                new_level.append(combined_hash)
-            tx_hashes = new_level
-        return tx_hashes[0]
-
-# ===== Block (Блок) Класы =====
-class Block:
-    """Блок құрылымы."""
-    def __init__(self, previous_hash, transactions):
-        self.timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-        self.previous_hash = previous_hash
-        self.transactions = transactions
-        self.merkle_root = MerkleTree(transactions).root
-        self.hash = self.calculate_hash()
-    
-    def calculate_hash(self):
-        return simple_hash(f"{self.timestamp}{self.previous_hash}{self.merkle_root}{[tx.tx_hash for tx in self.transactions]}")
-
-# ===== Blockchain (Блокчейн) Класы =====
-class Blockchain:
-    """Блокчейн құрылымы."""
-    def __init__(self):
-        self.chain = [self.create_genesis_block()]
-    
-    def create_genesis_block(self):
-        return Block("0", [])
-    
-    def add_block(self, transactions):
-        valid_transactions = [tx for tx in transactions if tx.valid and tx.verify_signature()]
-        if not valid_transactions:
-            print("Жарамсыз транзакциялар, блок қосылмады.")
-            return False
-        previous_block = self.chain[-1]
-        new_block = Block(previous_block.hash, valid_transactions)
-        self.chain.append(new_block)
-        return True
-    
-    def is_valid_chain(self):
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i - 1]
-            if current_block.previous_hash != previous_block.hash:
-                return False
-            if current_block.hash != current_block.calculate_hash():
-                return False
-            if MerkleTree(current_block.transactions).root != current_block.merkle_root:
-                return False
-            for tx in current_block.transactions:
-                if not tx.verify_signature():
-                    return False
-        if not utxo_model.validate_balances():
-            return False
-        return True
-
-# ===== Блокчейн мен UTXO Моделін Құру =====
-utxo_model = UTXOModel()
-blockchain = Blockchain()
-
-# Алдын ала мысал транзакциялары (бұл блок эксплорерінде көрсетіледі)
-transactions1 = [
-    Transaction(create_wallet("Alice", 61, 53)['address'], create_wallet("Bob", 47, 43)['address'], 10, 0.1, utxo_model),
-    Transaction(create_wallet("Bob", 47, 43)['address'], create_wallet("Charlie", 59, 53)['address'], 5, 0.05, utxo_model)
-]
-transactions2 = [
-    Transaction(create_wallet("Charlie", 59, 53)['address'], create_wallet("Dave", 61, 59)['address'], 15, 0.2, utxo_model),
-    Transaction(create_wallet("Alice", 61, 53)['address'], create_wallet("Eve", 67, 61)['address'], 200, 0.3, utxo_model)
-]
-
-blockchain.add_block(transactions1)
-blockchain.add_block(transactions2)
-
-# ===== GUI Интерфейсі =====
-
-root = tk.Tk()
-root.title("Блок Эксплорер және Әмиян")
-
-# Әмиян басқару интерфейсі
-wallet_frame = tk.Frame(root, bd=2, relief="groove")
-wallet_frame.pack(padx=10, pady=10, fill="x")
-
-tk.Label(wallet_frame, text="Әмиян Басқару", font=("Arial", 12, "bold")).grid(row=0, column=0, columnspan=4, pady=5)
-
-# Әмиян құру үшін өрістер
-tk.Label(wallet_frame, text="Аты:").grid(row=1, column=0, sticky="e")
-entry_name = tk.Entry(wallet_frame)
-entry_name.grid(row=1, column=1, padx=5)
-
-tk.Label(wallet_frame, text="p:").grid(row=1, column=2, sticky="e")
-entry_p = tk.Entry(wallet_frame, width=5)
-entry_p.grid(row=1, column=3, padx=5)
-entry_p.insert(0, "61")
-
-tk.Label(wallet_frame, text="q:").grid(row=2, column=0, sticky="e")
-entry_q = tk.Entry(wallet_frame, width=5)
-entry_q.grid(row=2, column=1, padx=5)
-entry_q.insert(0, "53")
-
-def create_wallet_gui():
-    name = entry_name.get()
-    try:
-        p = int(entry_p.get())
-        q = int(entry_q.get())
-    except ValueError:
-        messagebox.showerror("Қате", "p және q бүтін сандар болуы тиіс.")
-        return
-    wallet = create_wallet(name, p, q)
-    messagebox.showinfo("Әмиян құрылды", f"Аты: {wallet['name']}\nАдрес: {wallet['address']}\nАшық кілт: {wallet['public_key']}\nЖеке кілт: {wallet['private_key']}")
-    update_wallet_list()
-
-btn_create_wallet = tk.Button(wallet_frame, text="Әмиян құру", command=create_wallet_gui)
-btn_create_wallet.grid(row=2, column=2, columnspan=2, padx=5, pady=5)
-
-# Әмияндарды көрсету (жеңіл түрде тізім ретінде)
-wallet_listbox = tk.Listbox(wallet_frame, width=80)
-wallet_listbox.grid(row=3, column=0, columnspan=4, pady=5)
-
-def update_wallet_list():
-    wallet_listbox.delete(0, tk.END)
-    for addr, wallet in wallets.items():
-        wallet_listbox.insert(tk.END, f"Адрес: {addr} | Аты: {wallet['name']}")
-
-btn_show_wallets = tk.Button(wallet_frame, text="Әмияндарды жаңарту", command=update_wallet_list)
-btn_show_wallets.grid(row=4, column=0, columnspan=4, pady=5)
-
-def save_wallet():
-    # Таңдалған әмиянды файлға сақтау (суық әмиян)
-    selection = wallet_listbox.curselection()
-    if not selection:
-        messagebox.showerror("Қате", "Сақтау үшін әмиянды таңдаңыз.")
-        return
-    index = selection[0]
-    wallet_info = wallet_listbox.get(index)
-    addr = wallet_info.split("|")[0].split(":")[1].strip()
-    wallet = wallets.get(int(addr))
-    if wallet is None:
-        messagebox.showerror("Қате", "Әмиян табылмады.")
-        return
-    filename = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
-    if filename:
-        with open(filename, "w") as f:
-            json.dump(wallet, f)
-        messagebox.showinfo("Сақталды", f"Әмиян файлға сақталды: {filename}")
-
-def load_wallet():
-    filename = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
-    if filename:
-        with open(filename, "r") as f:
-            wallet = json.load(f)
-        # Жүктелген әмиянды wallets-ке қосамыз
-        addr = wallet.get("address")
-        if addr:
-            wallets[addr] = wallet
-            update_wallet_list()
-            messagebox.showinfo("Жүктелді", f"Әмиян жүктелді: {wallet.get('name')}")
-        else:
-            messagebox.showerror("Қате", "Әмиян деректері дұрыс емес.")
-
-btn_save_wallet = tk.Button(wallet_frame, text="Суық әмиянды сақтау", command=save_wallet)
-btn_save_wallet.grid(row=5, column=0, columnspan=2, pady=5)
-
-btn_load_wallet = tk.Button(wallet_frame, text="Суық әмиянды жүктеу", command=load_wallet)
-btn_load_wallet.grid(row=5, column=2, columnspan=2, pady=5)
-
-def show_balances():
-    balances = utxo_model.balances
-    if not balances:
-        messagebox.showinfo("Баланстар", "Әзірге баланс деректері жоқ.")
-    else:
-        info = "\n".join([f"Адрес: {addr} => Баланс: {bal}" for addr, bal in balances.items()])
-        messagebox.showinfo("Баланстар", info)
-
-btn_show_balances = tk.Button(wallet_frame, text="Баланстарды көрсету", command=show_balances)
-btn_show_balances.grid(row=6, column=0, columnspan=4, pady=5)
-
-# Транзакция жіберу интерфейсі
-tk.Label(wallet_frame, text="Транзакция жіберу", font=("Arial", 12, "bold")).grid(row=7, column=0, columnspan=4, pady=5)
-
-tk.Label(wallet_frame, text="Жіберуші Адрес:").grid(row=8, column=0, sticky="e")
-entry_sender = tk.Entry(wallet_frame, width=40)
-entry_sender.grid(row=8, column=1, columnspan=3, padx=5, pady=2)
-
-tk.Label(wallet_frame, text="Алушы Адрес:").grid(row=9, column=0, sticky="e")
-entry_receiver = tk.Entry(wallet_frame, width=40)
-entry_receiver.grid(row=9, column=1, columnspan=3, padx=5, pady=2)
-
-tk.Label(wallet_frame, text="Сома:").grid(row=10, column=0, sticky="e")
-entry_amount = tk.Entry(wallet_frame, width=10)
-entry_amount.grid(row=10, column=1, padx=5, pady=2)
-
-tk.Label(wallet_frame, text="Комиссия:").grid(row=10, column=2, sticky="e")
-entry_fee = tk.Entry(wallet_frame, width=10)
-entry_fee.grid(row=10, column=3, padx=5, pady=2)
-
-def send_transaction():
-    sender = entry_sender.get().strip()
-    receiver = entry_receiver.get().strip()
-    try:
-        amount = float(entry_amount.get())
-        fee = float(entry_fee.get())
-    except ValueError:
-        messagebox.showerror("Қате", "Сома және комиссия сандық мән болуы тиіс.")
-        return
-    tx = Transaction(sender, receiver, amount, fee, utxo_model)
-    if not tx.valid:
-        messagebox.showerror("Қате", "Жіберушіде жеткілікті қаражат жоқ немесе транзакция жарамсыз.")
-        return
-    if not tx.verify_signature():
-        messagebox.showerror("Қате", "Қолтаңба жарамсыз.")
-        return
-    # Жаңа блок ретінде транзакцияны блокчейнге қосамыз.
-    if blockchain.add_block([tx]):
-        messagebox.showinfo("Жіберілді", "Транзакция жіберілді және блокқа қосылды.")
-        show_blocks()  # блок эксплорерін жаңартамыз
-    else:
-        messagebox.showerror("Қате", "Транзакция блокқа қосылмады.")
-
-btn_send_tx = tk.Button(wallet_frame, text="Транзакция жіберу", command=send_transaction)
-btn_send_tx.grid(row=11, column=0, columnspan=4, pady=5)
-
-# Блок эксплорері (GUI)
-explorer_frame = tk.Frame(root, bd=2, relief="groove")
-explorer_frame.pack(padx=10, pady=10, fill="both", expand=True)
-
-tk.Label(explorer_frame, text="Блок Эксплорер", font=("Arial", 12, "bold")).pack(pady=5)
-
-def show_blocks():
-    for widget in explorer_frame.winfo_children():
-        if isinstance(widget, tk.Label) and widget.cget("fg") != "blue":
-            widget.destroy()
-    for i, block in enumerate(blockchain.chain):
-        validity = "✅ Жарамды" if i == 0 or block.previous_hash == blockchain.chain[i-1].hash else "❌ Жарамсыз"
-        transactions_info = "\n".join([
-            f"Жіберуші: {wallets.get(tx.sender, {}).get('name', tx.sender)} ({tx.sender})\n"
-            f"Алушы: {wallets.get(tx.receiver, {}).get('name', tx.receiver)} ({tx.receiver})\n"
-            f"Сома: {tx.amount}\n"
-            f"Tx Хэш: {tx.tx_hash}\n"
-            f"Сигнатура: {tx.signature} ({'жарамды' if tx.verify_signature() else 'жарамсыз'})"
-            for tx in block.transactions
-        ])
-        block_info = (f"Блок {i}\n"
-                      f"Хэш: {block.hash}\n"
-                      f"Уақыт: {block.timestamp}\n"
-                      f"Меркле түбірі: {block.merkle_root}\n"
-                      f"Транзакциялар:\n{transactions_info}\n"
-                      f"{validity}")
-        tk.Label(explorer_frame, text=block_info, padx=10, pady=10, borderwidth=2, relief="solid", font=("Arial", 10)).pack(pady=5, fill="x")
-
-btn_show_blocks = tk.Button(explorer_frame, text="Блоктарды жаңарту", command=show_blocks)
-btn_show_blocks.pack(pady=5)
-
-def check_validity():
-    if blockchain.is_valid_chain():
-        messagebox.showinfo("Блокчейн дұрыстығы", "✅ Блокчейн жарамды!")
-    else:
-        messagebox.showerror("Блокчейн қатесі", "❌ Блокчейнде қате бар!")
-
-btn_check_validity = tk.Button(explorer_frame, text="Блокчейнді тексеру", command=check_validity)
-btn_check_validity.pack(pady=5)
-
-root.mainloop()
\ No newline at end of file
+import time
+import tkinter as tk
+from tkinter import messagebox, filedialog, ttk
+import json
+import os
+import threading
+import queue
+from collections import OrderedDict
+
+# ===== RSA АСИММЕТРИЯЛЫ ҚЫЛУ ФУНКЦИЯЛАРЫ =====
+# Миллер–Рабин тесті, итеративті Эвклид алгоритмі және кілттер пулы keygen.py-да.
+from keygen import gcd, egcd, mod_inverse, generate_keypair, crt_params, sign_crt, KeyPool
+
+KEY_BITS = 1024  # Пулдан алынатын кілттердің өлшемі
+KEY_POOL_SIZE = 32  # Қатарынан осынша әмиян бірден құрылады, қалғаны кілт дайын болғанда аяқталады
+key_pool = KeyPool(bits=KEY_BITS, size=KEY_POOL_SIZE)
+
+# ===== Қарапайым Хэш Функциясы =====
+def simple_hash(data):
+    """Қарапайым хэш функциясы."""
+    hash_value = 0
+    prime = 31  # Хэшті тұрақты ету үшін жай сан
+    for i, char in enumerate(data):
+        hash_value += (ord(char) * (i + 1))
+        hash_value = hash_value * prime
+    return hash_value & 0xFFFFFFFF  # 32-бит шектеу
+
+# ===== Wallets (әмияндар) және Аккаунт Адрестері =====
+# Аккаунттың адресі ретінде ашық кілттің хэші пайдаланылады.
+# Әмияндар бір индекстелген файлда (keystore.py) сақталады: адрес бойынша
+# іздеу O(1), жеке кілттер тек қол қою кезінде жүктеледі.
+from keystore import WalletKeystore
+from snapshot import encode_snapshot, write_file, SnapshotReader, SnapshotError, BodyStore
+from balancewal import BalanceWAL
+
+KEYSTORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "wallets.db")
+keystore = WalletKeystore(KEYSTORE_PATH)
+wallets = keystore.wallets
+
+def create_wallet(name, p=None, q=None, keys=None):
+    """
+    name - пайдаланушы аты,
+    p, q - RSA үшін таңдалған жай сандар (берілмесе, кілт пулдан алынады),
+    keys - дайын (ашық кілт, жеке кілт, CRT) үштігі, мысалы key_pool.get_async() нәтижесі.
+    Әмиян құрылып, ашық кілттің хэшінен аккаунт адресі есептеледі.
+    """
+    if keys is not None:
+        public_key, private_key, crt = keys
+    elif p is None or q is None:
+        public_key, private_key, crt = key_pool.get()
+    else:
+        public_key, private_key = generate_keypair(p, q)
+        crt = crt_params(p, q, private_key[0])
+    address = simple_hash(str(public_key))
+    wallet = {
+        'name': name,
+        'public_key': public_key,
+        'private_key': private_key,
+        'crt': crt,  # (p, q, dP, dQ, qInv) — CRT арқылы жылдам қол қою үшін
+        'address': address
+    }
+    wallets[address] = wallet
+    return wallet
+
+# ===== Қолтаңбаны тексеру кэші =====
+class SignatureCache:
+    """
+    Сәтті тексерілген қолтаңбалардың шектелген LRU кэші.
+    Кілт: (tx_hash, signature, public_key). Қайта тексеру модульдік дәрежеге
+    шығарудың орнына сөздіктен іздеуге айналады.
+    """
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return True
+            return False
+
+    def add(self, key):
+        with self.lock:
+            self.entries[key] = True
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+signature_cache = SignatureCache()
+
+# ===== UTXO Моделі =====
+class UTXOModel:
+    """
+    UTXO моделі: Аккаунт баланстарын сақтау.
+    Баланс өзгерген сайын жазылушыларға (address, old, new) оқиғасы жіберіледі;
+    жаңа аккаунт үшін old = None, жойылған аккаунт үшін new = None.
+    wal берілсе (BalanceWAL), баланстар одан қалпына келтіріледі және әр өзгеріс
+    жадқа түспес бұрын журналға жазылады. commit() шақырылғанға дейінгі
+    өзгерістер журналда бір топ: апаттан кейін олар не түгел, не мүлде қалпына келеді.
+    """
+    def __init__(self, wal=None):
+        self.wal = wal
+        self.balances = wal.recover() if wal is not None else {}
+        self.listeners = []
+
+    def subscribe(self, callback):
+        self.listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def set_balance(self, address, value):
+        old = self.balances.get(address)
+        if self.wal is not None and old != value:
+            self.wal.append(address, old, value)
+        if value is None:
+            self.balances.pop(address, None)
+        else:
+            self.balances[address] = value
+        if old != value:
+            for callback in list(self.listeners):
+                callback(address, old, value)
+
+    def update_balance(self, sender, receiver, amount, fee):
+        if sender not in self.balances:
+            self.set_balance(sender, 100)  # Бастапқы баланс
+        if receiver not in self.balances:
+            self.set_balance(receiver, 100)  # Бастапқы баланс
+        
+        if self.balances[sender] >= amount + fee:
+            self.set_balance(sender, self.balances[sender] - (amount + fee))
+            self.set_balance(receiver, self.balances[receiver] + amount)
+            self.commit()
+            return True
+        self.commit()
+        return False
+
+    def mark_tip(self, tip):
+        """Баланстар tip хэшімен аяқталатын тізбекке сәйкес: журналға белгі қойып, дискке жазу."""
+        if self.wal is not None:
+            self.wal.append_tip(tip)
+            self.commit()
+
+    def reset(self, balances):
+        """Барлық баланстарды balances-пен ауыстыру (журнал мен оқиғалар set_balance арқылы)."""
+        for address in set(self.balances) - set(balances):
+            self.set_balance(address, None)
+        for address, balance in balances.items():
+            self.set_balance(address, balance)
+        self.commit()
+
+    def commit(self):
+        """
+        Соңғы commit-тен бергі өзгерістерді бір топ ретінде журналға бекітіп, дискке
+        жазылғанша күту (group commit). Бақылау нүктесі тек осында, операциялар арасында жазылады.
+        """
+        if self.wal is not None:
+            self.wal.wait_durable(self.wal.commit_batch())
+            if self.wal.needs_checkpoint():
+                self.wal.checkpoint(self.balances)
+
+    def get_balance(self, account):
+        return self.balances.get(account, 100)
+    
+    def validate_balances(self):
+        """Барлық аккаунттардың балансы теріс болмауы тиіс."""
+        return all(balance >= 0 for balance in self.balances.values())
+
+# ===== Transaction (Транзакция) Класы =====
+class Transaction:
+    """Транзакция құрылымы, сандық қолтаңба қосылған."""
+    def __init__(self, sender, receiver, amount, fee, utxo_model):
+        """
+        sender, receiver - аккаунт адресі (ашық кілттің хэші),
+        amount, fee - сома және комиссия,
+        utxo_model - UTXO моделі арқылы баланс тексеріледі.
+        """
+        self.sender = sender
+        self.receiver = receiver
+        self.amount = amount
+        self.fee = fee
+        self.valid = utxo_model.update_balance(sender, receiver, amount, fee)
+        self.tx_hash = self.calculate_hash()
+        self.signature = None
+        if self.valid and self.sender in wallets:
+            wallet = wallets[self.sender]
+            private_key = wallet['private_key']  # (d, n)
+            n = private_key[1]
+            if wallet.get('crt'):
+                self.signature = sign_crt(self.tx_hash % n, wallet['crt'])
+            else:
+                self.signature = pow(self.tx_hash % n, private_key[0], n)
+    
+    def calculate_hash(self):
+        return simple_hash(f"{self.sender}{self.receiver}{self.amount}{self.fee}")
+    
+    def verify_signature(self):
+        """Цифрлық қолтаңбаның жарамдылығын ашық кілт арқылы тексеру."""
+        if self.signature is None or self.sender not in wallets:
+            return False
+        public_key = wallets[self.sender]['public_key']  # (e, n)
+        cache_key = (self.tx_hash, self.signature, tuple(public_key))
+        if cache_key in signature_cache:
+            return True
+        n = public_key[1]
+        decrypted = pow(self.signature, public_key[0], n)
+        if decrypted != (self.tx_hash % n):
+            return False
+        signature_cache.add(cache_key)
+        return True
+
+def restore_transaction(fields):
+    """Снапшоттағы өрістерден транзакцияны баланс өзгертпей және қайта қол қоймай құру."""
+    tx = Transaction.__new__(Transaction)
+    tx.__dict__.update(fields)
+    return tx
+
+# ===== Merkle Tree (Меркле ағашы) =====
+class MerkleTree:
+    """Merkle Tree (Меркле ағашы) құрылымы."""
+    def __init__(self, transactions):
+        self.transactions = transactions
+        self.root = self.build_merkle_root()
+    
+    def build_merkle_root(self):
+        """Меркле түбірін есептеу."""
+        if not self.transactions:
+            return "Бос"
+        
+        tx_hashes = [tx.tx_hash for tx in self.transactions]
+        while len(tx_hashes) > 1:
+            if len(tx_hashes) % 2 != 0:
+                tx_hashes.append(tx_hashes[-1])
+            new_level = []
+            for i in range(0, len(tx_hashes), 2):
+                combined_hash = simple_hash(str(tx_hashes[i]) + str(tx_hashes[i + 1]))
+                new_level.append(combined_hash)
+            tx_hashes = new_level
+        return tx_hashes[0]
+
+EMPTY_MERKLE_ROOT = MerkleTree([]).root
+
+# ===== Block (Блок) Класы =====
+class Block:
+    """
+    Блок құрылымы.
+    Снапшоттан жүктелген блокта тек тақырып жадта тұрады: транзакциялар
+    алғаш сұралғанда body_store-дан (LRU кэші бар) оқылады.
+    """
+    def __init__(self, previous_hash, transactions):
+        self.timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        self.previous_hash = previous_hash
+        self.transactions = transactions
+        self.merkle_root = MerkleTree(transactions).root
+        self.hash = self.calculate_hash()
+        self.pruned = False  # True болса, транзакциялар тасталған, тек тақырып сақталады
+
+    @property
+    def transactions(self):
+        if self.body_store is not None:
+            return self.body_store.body(self.body_height)
+        return self._transactions
+
+    @transactions.setter
+    def transactions(self, transactions):
+        self._transactions = transactions
+        self.body_store = None
+
+    def tx_count(self):
+        """Транзакциялар саны (жүктелмеген денені декодтамай)."""
+        if self.body_store is not None:
+            return self.body_store.tx_count(self.body_height)
+        return len(self._transactions)
+    
+    def calculate_hash(self, transactions=None):
+        if transactions is None:
+            transactions = self.transactions
+        return simple_hash(f"{self.timestamp}{self.previous_hash}{self.merkle_root}{[tx.tx_hash for tx in transactions]}")
+
+# ===== Blockchain (Блокчейн) Класы =====
+# ===== Тізбекті тексеру кезеңдері =====
+# is_valid_chain әр кезеңге жұмсалған уақытты timings сөздігіне жинайды.
+VALIDATION_STAGES = {
+    'links': "Блок байланыстары",
+    'hashes': "Блок хэштері",
+    'merkle': "Меркле түбірлері",
+    'signatures': "Қолтаңбалар",
+    'balances': "Баланстар",
+}
+
+def timed_check(timings, stage, check):
+    """check() нәтижесін қайтарып, оған кеткен уақытты timings[stage]-ке қосу."""
+    start = time.perf_counter()
+    ok = check()
+    timings[stage] += time.perf_counter() - start
+    return ok
+
+def format_timings(timings):
+    return "\n".join(f"{VALIDATION_STAGES[stage]}: {timings.get(stage, 0.0):.3f} сек"
+                     for stage in VALIDATION_STAGES)
+
+class Blockchain:
+    """
+    Блокчейн құрылымы.
+    prune_depth берілсе (кесу режимі), барлық блоктың тақырыбы сақталады, ал
+    транзакциялар тек соңғы prune_depth блокта қалады; баланстар толық сақталады.
+    """
+    def __init__(self, prune_depth=None):
+        self.prune_depth = prune_depth
+        self.pruned_height = 0  # Осы биіктікке дейінгі блоктардың денесі тасталған
+        self.body_store = None  # Снапшоттан жүктелген блок денелерінің қоймасы
+        self.chain = [self.create_genesis_block()]
+        # Іздеу индекстері: tx_hash -> (биіктік, реті), блок хэші -> биіктік,
+        # адрес -> [(биіктік, реті), ...]. add_block кезінде толықтырылады.
+        self.tx_index = {}
+        self.block_index = {}
+        self.address_index = {}
+        self.index_block(0, self.chain[0])
+    
+    def create_genesis_block(self):
+        return Block("0", [])
+    
+    def add_block(self, transactions):
+        valid_transactions = [tx for tx in transactions if tx.valid and tx.verify_signature()]
+        if not valid_transactions:
+            print("Жарамсыз транзакциялар, блок қосылмады.")
+            return False
+        previous_block = self.chain[-1]
+        new_block = Block(previous_block.hash, valid_transactions)
+        self.chain.append(new_block)
+        self.index_block(len(self.chain) - 1, new_block)
+        self.prune()
+        utxo_model.mark_tip(new_block.hash)
+        return True
+
+    def verify_pruned_body(self, height, transactions):
+        """
+        Транзакциялар тізімі height биіктігіндегі блоктың денесі екенін тексеру:
+        Меркле түбірі мен блок хэші тақырыптағы мәндерге сәйкес келуі тиіс.
+        Кесілген блоктың денесін басқа түйіннен алғанда да осылай тексеруге болады.
+        """
+        block = self.chain[height]
+        return (MerkleTree(transactions).root == block.merkle_root
+                and block.calculate_hash(transactions) == block.hash)
+
+    def prune(self):
+        """
+        Соңғы prune_depth блоктан ескі блоктардың транзакцияларын тастау.
+        Тастамас бұрын дене тақырыпқа сәйкес екені тексеріледі, ал индекстерден
+        кесілген транзакцияларға сілтемелер алынады. Қайтарады: кесілген блоктар саны.
+        """
+        if self.prune_depth is None:
+            return 0
+        limit = len(self.chain) - self.prune_depth
+        count = 0
+        while self.pruned_height < limit:
+            height = self.pruned_height
+            block = self.chain[height]
+            if not self.verify_pruned_body(height, block.transactions):
+                print(f"Блок {height} денесі тақырыбына сәйкес емес, кесу тоқтатылды.")
+                break
+            for i, tx in enumerate(block.transactions):
+                if self.tx_index.get(tx.tx_hash) == (height, i):  # Бірдей хэш кейінгі блокта да болуы мүмкін
+                    del self.tx_index[tx.tx_hash]
+                for address in {tx.sender, tx.receiver}:
+                    positions = self.address_index.get(address, [])
+                    stale = 0
+                    while stale < len(positions) and positions[stale][0] <= height:
+                        stale += 1
+                    del positions[:stale]
+                    if not positions:
+                        self.address_index.pop(address, None)
+            block.transactions = []
+            block.pruned = True
+            self.pruned_height += 1
+            count += 1
+        return count
+    
+    def index_block(self, height, block):
+        """Блокты іздеу индекстеріне қосу."""
+        self.block_index[block.hash] = height
+        for i, tx in enumerate(block.transactions):
+            self.tx_index[tx.tx_hash] = (height, i)
+            self.address_index.setdefault(tx.sender, []).append((height, i))
+            if tx.receiver != tx.sender:
+                self.address_index.setdefault(tx.receiver, []).append((height, i))
+
+    def rebuild_indexes(self):
+        """Тізбек толығымен ауыстырылғанда индекстерді қайта құру."""
+        self.tx_index.clear()
+        self.block_index.clear()
+        self.address_index.clear()
+        for height, block in enumerate(self.chain):
+            self.index_block(height, block)
+
+    def find_block(self, block_hash):
+        """Блок хэші бойынша биіктік немесе None."""
+        return self.block_index.get(block_hash)
+
+    def find_transaction(self, tx_hash):
+        """Транзакция хэші бойынша (биіктік, реті) немесе None."""
+        return self.tx_index.get(tx_hash)
+
+    def find_address(self, address):
+        """Адрес қатысқан транзакциялардың орындары [(биіктік, реті), ...]."""
+        return self.address_index.get(address, [])
+
+    def save_snapshot(self, path):
+        """Тізбекті, баланстарды және индекстерді бинарлық снапшотқа жазу. Қайтарады: байт саны."""
+        data = encode_snapshot(self.chain, utxo_model.balances, self.tx_index, self.address_index)
+        if self.body_store is not None and os.path.abspath(path) == self.body_store.reader.path:
+            # Денелер оқылып жатқан файлды ауыстырамыз: жаңа файлда тізбек сол күйінде
+            with self.body_store.replacing():
+                return write_file(path, data)
+        return write_file(path, data)
+
+    def load_snapshot(self, path, restore_balances=True):
+        """
+        Снапшоттан тізбекті қалпына келтіру: блоктар мен транзакциялар қайта
+        есептелмей және қайта қол қойылмай, сақталған өрістерінен құрылады.
+        Жадқа тек тақырыптар оқылады, денелер қажет болғанда файлдан жүктеледі.
+        restore_balances=False болса, баланстар өзгертілмейді (мысалы, олар
+        баланстар журналынан қалпына келген болса); оларды кейін
+        snapshot_balances() арқылы алуға болады.
+        """
+        reader = SnapshotReader(path)
+        try:
+            store = BodyStore(reader, restore_transaction)
+            chain = []
+            for height, header in enumerate(reader.headers()):
+                block = Block.__new__(Block)
+                block.__dict__.update(header)
+                if reader.tx_count(height):
+                    block._transactions = None
+                    block.body_store = store
+                    block.body_height = height
+                    block.pruned = False
+                else:
+                    block.transactions = []
+                    # Денесі бос, бірақ Меркле түбірі бос тізімдікі емес блок — кесілген блок
+                    block.pruned = block.merkle_root != EMPTY_MERKLE_ROOT
+                chain.append(block)
+            balances = reader.balances()
+            tx_index, address_index = reader.indexes()
+        except Exception:
+            reader.close()
+            raise
+        if self.body_store is not None:
+            self.body_store.close()
+        self.body_store = store
+        self.chain = chain
+        self.tx_index = tx_index
+        self.address_index = address_index
+        self.block_index = {block.hash: height for height, block in enumerate(chain)}
+        self.pruned_height = max((height + 1 for height, block in enumerate(chain) if block.pruned), default=0)
+        self.prune()
+        if restore_balances:
+            utxo_model.reset(balances)
+            utxo_model.mark_tip(self.chain[-1].hash)
+        return len(chain)
+
+    def snapshot_balances(self):
+        """Жүктелген снапшоттағы баланстар (снапшот тізбегінің ұшына сәйкес)."""
+        with self.body_store.lock:
+            return self.body_store.reader.balances()
+
+    def is_valid_chain(self, progress=None, cancelled=None, timings=None):
+        """
+        Тізбекті тексеру. Қосымша параметрлер (фондық ағында тексеру үшін):
+          - progress(done, total): тексерілген блоктар саны туралы хабар,
+          - cancelled: threading.Event, орнатылса тексеру тоқтап None қайтарады,
+          - timings: әр кезеңге жұмсалған уақыт жазылатын сөздік.
+        """
+        chain = list(self.chain)  # Тексеру кезінде қосылған блоктар ескерілмейді
+        if timings is None:
+            timings = {}
+        for stage in VALIDATION_STAGES:
+            timings.setdefault(stage, 0.0)
+        total = len(chain) - 1
+        step = max(1, total // 100)  # Кезекті хабарлармен толтырмау үшін ~100 хабар
+        for i in range(1, len(chain)):
+            if cancelled is not None and cancelled.is_set():
+                return None
+            current_block = chain[i]
+            previous_block = chain[i - 1]
+            if not timed_check(timings, 'links', lambda: current_block.previous_hash == previous_block.hash):
+                return False
+            if current_block.pruned:
+                # Кесілген блоктың денесі кесу кезінде тексерілген, енді тек байланыс тексеріледі
+                if progress is not None and (i % step == 0 or i == total):
+                    progress(i, total)
+                continue
+            if not timed_check(timings, 'hashes', lambda: current_block.hash == current_block.calculate_hash()):
+                return False
+            if not timed_check(timings, 'merkle',
+                               lambda: MerkleTree(current_block.transactions).root == current_block.merkle_root):
+                return False
+            if not timed_check(timings, 'signatures', lambda: all(tx.verify_signature() for tx in current_block.transactions)):
+                return False
+            if progress is not None and (i % step == 0 or i == total):
+                progress(i, total)
+        if cancelled is not None and cancelled.is_set():
+            return None
+        if not timed_check(timings, 'balances', utxo_model.validate_balances):
+            return False
+        return True
+
+# ===== Блокчейн мен UTXO Моделін Құру =====
+# Баланстар журналы: апаттан кейін күй соңғы бақылау нүктесі мен журнал құйрығынан қалпына келеді
+BALANCE_WAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "balance_wal")
+utxo_model = UTXOModel(BalanceWAL(BALANCE_WAL_DIR))
+balances_recovered = bool(utxo_model.balances)
+recovered_tip = utxo_model.wal.tip  # Журнал баланстары сәйкес келетін тізбек ұшы
+PRUNE_DEPTH = None  # Мысалы 1000: тек соңғы 1000 блоктың транзакциялары сақталады
+blockchain = Blockchain(PRUNE_DEPTH)
+
+# Снапшот бар болса, тізбек тарихты қайталамай одан жүктеледі
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "chain.snap")
+snapshot_loaded = False
+if os.path.exists(SNAPSHOT_PATH):
+    try:
+        blockchain.load_snapshot(SNAPSHOT_PATH, restore_balances=False)
+        snapshot_loaded = True
+    except (OSError, SnapshotError) as error:
+        print("Снапшот жүктелмеді:", error)
+
+# Журнал баланстары тек сол тізбек ұшына сәйкес болса ғана қолданылады. Апаттан
+# кейін снапшот ескі болуы мүмкін: онда снапшоттың өз баланстары алынады,
+# ал снапшот жоқ болса, баланстар мысал тізбегімен бірге басынан құрылады.
+if snapshot_loaded:
+    if not balances_recovered or recovered_tip != blockchain.chain[-1].hash:
+        if balances_recovered:
+            print("Журнал баланстары снапшот тізбегіне сәйкес емес, снапшот баланстары қолданылады.")
+        utxo_model.reset(blockchain.snapshot_balances())
+elif balances_recovered:
+    print("Снапшот жоқ: журнал баланстары тізбекке сәйкес емес, олар қолданылмайды.")
+    utxo_model.reset({})
+
+if not snapshot_loaded:
+    # Алдын ала мысал транзакциялары (бұл блок эксплорерінде көрсетіледі)
+    transactions1 = [
+        Transaction(create_wallet("Alice", 61, 53)['address'], create_wallet("Bob", 47, 43)['address'], 10, 0.1, utxo_model),
+        Transaction(create_wallet("Bob", 47, 43)['address'], create_wallet("Charlie", 59, 53)['address'], 5, 0.05, utxo_model)
+    ]
+    transactions2 = [
+        Transaction(create_wallet("Charlie", 59, 53)['address'], create_wallet("Dave", 61, 59)['address'], 15, 0.2, utxo_model),
+        Transaction(create_wallet("Alice", 61, 53)['address'], create_wallet("Eve", 67, 61)['address'], 200, 0.3, utxo_model)
+    ]
+
+    blockchain.add_block(transactions1)
+    blockchain.add_block(transactions2)
+
+utxo_model.mark_tip(blockchain.chain[-1].hash)
+
+# ===== GUI Интерфейсі =====
+
+root = tk.Tk()
+root.title("Блок Эксплорер және Әмиян")
+
+# Әмиян басқару интерфейсі
+wallet_frame = tk.Frame(root, bd=2, relief="groove")
+wallet_frame.pack(padx=10, pady=10, fill="x")
+
+tk.Label(wallet_frame, text="Әмиян Басқару", font=("Arial", 12, "bold")).grid(row=0, column=0, columnspan=4, pady=5)
+
+# Әмиян құру үшін өрістер
+tk.Label(wallet_frame, text="Аты:").grid(row=1, column=0, sticky="e")
+entry_name = tk.Entry(wallet_frame)
+entry_name.grid(row=1, column=1, padx=5)
+
+tk.Label(wallet_frame, text="p:").grid(row=1, column=2, sticky="e")
+entry_p = tk.Entry(wallet_frame, width=5)
+entry_p.grid(row=1, column=3, padx=5)
+entry_p.insert(0, "61")
+
+tk.Label(wallet_frame, text="q:").grid(row=2, column=0, sticky="e")
+entry_q = tk.Entry(wallet_frame, width=5)
+entry_q.grid(row=2, column=1, padx=5)
+entry_q.insert(0, "53")
+
+KEY_POLL_MS = 50
+
+def wallet_created(wallet):
+    messagebox.showinfo("Әмиян құрылды", f"Аты: {wallet['name']}\nАдрес: {wallet['address']}\nАшық кілт: {wallet['public_key']}\nЖеке кілт: {wallet['private_key']}")
+    update_wallet_list()
+
+def poll_key_future(name, future):
+    if not future.done():
+        root.after(KEY_POLL_MS, poll_key_future, name, future)
+        return
+    wallet_created(create_wallet(name, keys=future.result()))
+
+def create_wallet_gui():
+    name = entry_name.get()
+    p_text, q_text = entry_p.get().strip(), entry_q.get().strip()
+    if not p_text and not q_text:
+        # p және q бос болса, дайын кілт пулдан алынады. Пул таусылса (қатарынан
+        # KEY_POOL_SIZE-тан көп әмиян), әмиян кілт фондық ағында дайын болғанда аяқталады
+        future = key_pool.get_async()
+        if future.done():
+            wallet_created(create_wallet(name, keys=future.result()))
+        else:
+            root.after(KEY_POLL_MS, poll_key_future, name, future)
+        return
+    try:
+        p = int(p_text)
+        q = int(q_text)
+    except ValueError:
+        messagebox.showerror("Қате", "p және q бүтін сандар болуы тиіс.")
+        return
+    try:
+        wallet = create_wallet(name, p, q)
+    except ValueError as error:
+        messagebox.showerror("Қате", str(error))
+        return
+    wallet_created(wallet)
+
+btn_create_wallet = tk.Button(wallet_frame, text="Әмиян құру", command=create_wallet_gui)
+btn_create_wallet.grid(row=2, column=2, columnspan=2, padx=5, pady=5)
+
+# Әмияндарды көрсету (жеңіл түрде тізім ретінде)
+wallet_listbox = tk.Listbox(wallet_frame, width=80)
+wallet_listbox.grid(row=3, column=0, columnspan=4, pady=5)
+
+def update_wallet_list():
+    wallet_listbox.delete(0, tk.END)
+    for addr, wallet in wallets.items():
+        wallet_listbox.insert(tk.END, f"Адрес: {addr} | Аты: {wallet['name']}")
+
+btn_show_wallets = tk.Button(wallet_frame, text="Әмияндарды жаңарту", command=update_wallet_list)
+btn_show_wallets.grid(row=4, column=0, columnspan=4, pady=5)
+
+def save_wallet():
+    # Таңдалған әмиянды файлға сақтау (суық әмиян)
+    selection = wallet_listbox.curselection()
+    if not selection:
+        messagebox.showerror("Қате", "Сақтау үшін әмиянды таңдаңыз.")
+        return
+    index = selection[0]
+    wallet_info = wallet_listbox.get(index)
+    addr = wallet_info.split("|")[0].split(":")[1].strip()
+    wallet = wallets.get(int(addr))
+    if wallet is None:
+        messagebox.showerror("Қате", "Әмиян табылмады.")
+        return
+    filename = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
+    if filename:
+        # Жеке кілт қоймадан жүктеліп, әмиянмен бірге сақталады
+        wallet = dict(wallet, **keystore.private_fields(wallet['address']))
+        with open(filename, "w") as f:
+            json.dump(wallet, f)
+        messagebox.showinfo("Сақталды", f"Әмиян файлға сақталды: {filename}")
+
+def load_wallet():
+    filename = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
+    if filename:
+        with open(filename, "r") as f:
+            wallet = json.load(f)
+        # Жүктелген әмиянды wallets-ке қосамыз
+        addr = wallet.get("address")
+        if addr:
+            wallets[addr] = wallet
+            update_wallet_list()
+            messagebox.showinfo("Жүктелді", f"Әмиян жүктелді: {wallet.get('name')}")
+        else:
+            messagebox.showerror("Қате", "Әмиян деректері дұрыс емес.")
+
+btn_save_wallet = tk.Button(wallet_frame, text="Суық әмиянды сақтау", command=save_wallet)
+btn_save_wallet.grid(row=5, column=0, columnspan=2, pady=5)
+
+btn_load_wallet = tk.Button(wallet_frame, text="Суық әмиянды жүктеу", command=load_wallet)
+btn_load_wallet.grid(row=5, column=2, columnspan=2, pady=5)
+
+def export_keystore():
+    filename = filedialog.asksaveasfilename(defaultextension=".jsonl", filetypes=[("JSON Lines files", "*.jsonl")])
+    if filename:
+        count = keystore.export_file(filename)
+        messagebox.showinfo("Экспорт", f"{count} әмиян файлға жазылды: {filename}")
+
+def import_keystore():
+    filename = filedialog.askopenfilename(filetypes=[("JSON Lines files", "*.jsonl")])
+    if filename:
+        try:
+            count = keystore.import_file(filename)
+        except (ValueError, KeyError) as error:
+            messagebox.showerror("Қате", f"Файл дұрыс емес: {error}")
+            return
+        update_wallet_list()
+        messagebox.showinfo("Импорт", f"{count} әмиян қоймаға жүктелді.")
+
+btn_export_keystore = tk.Button(wallet_frame, text="Әмияндарды экспорттау", command=export_keystore)
+btn_export_keystore.grid(row=6, column=0, columnspan=2, pady=5)
+
+btn_import_keystore = tk.Button(wallet_frame, text="Әмияндарды импорттау", command=import_keystore)
+btn_import_keystore.grid(row=6, column=2, columnspan=2, pady=5)
+
+# Баланстар кестесі UTXOModel оқиғаларына жазылады: оқиғалар кезекке түсіп,
+# root.after арқылы Tk ағынында өңделеді және тек өзгерген жолдар жаңартылады.
+balance_events = queue.Queue()
+balance_window = None
+balance_tree = None
+balance_sort = ("address", False)
+BALANCE_POLL_MS = 200
+
+def on_balance_change(address, old, new):
+    balance_events.put((address, new))
+
+def balance_row(address, balance):
+    name = wallets[address]['name'] if address in wallets else ""
+    return (address, name, round(balance, 8))
+
+def sort_balances(column):
+    """Кестені баған бойынша сұрыптау (қайта басқанда кері ретпен)."""
+    global balance_sort
+    reverse = balance_sort == (column, False)
+    balance_sort = (column, reverse)
+    index = ("address", "name", "balance").index(column)
+    rows = [(balance_tree.item(iid, "values")[index], iid) for iid in balance_tree.get_children()]
+    key = (lambda row: float(row[0])) if column == "balance" else (lambda row: str(row[0]))
+    for position, (_, iid) in enumerate(sorted(rows, key=key, reverse=reverse)):
+        balance_tree.move(iid, "", position)
+
+def balance_iid(address):
+    # repr: 123 және "123" адрестері әртүрлі аккаунт, олардың жолдары соқтығыспауы керек
+    return repr(address)
+
+def poll_balance_events():
+    if balance_window is None:
+        return
+    latest = {}
+    try:
+        while True:
+            address, balance = balance_events.get_nowait()
+            latest[address] = balance  # Бір аккаунттың бірнеше оқиғасынан соңғысы ғана сызылады
+    except queue.Empty:
+        pass
+    for address, balance in latest.items():
+        iid = balance_iid(address)
+        if balance is None:
+            if balance_tree.exists(iid):
+                balance_tree.delete(iid)
+        elif balance_tree.exists(iid):
+            balance_tree.item(iid, values=balance_row(address, balance))
+        else:
+            balance_tree.insert("", "end", iid=iid, values=balance_row(address, balance))
+    root.after(BALANCE_POLL_MS, poll_balance_events)
+
+def close_balances():
+    global balance_window, balance_tree
+    utxo_model.unsubscribe(on_balance_change)
+    balance_window.destroy()
+    balance_window = balance_tree = None
+
+def show_balances():
+    global balance_window, balance_tree, balance_events
+    if balance_window is not None:
+        balance_window.lift()
+        return
+    balance_window = tk.Toplevel(root)
+    balance_window.title("Баланстар")
+    balance_window.protocol("WM_DELETE_WINDOW", close_balances)
+    balance_tree = ttk.Treeview(balance_window, columns=("address", "name", "balance"), show="headings", height=20)
+    for column, title in (("address", "Адрес"), ("name", "Аты"), ("balance", "Баланс")):
+        balance_tree.heading(column, text=title, command=lambda c=column: sort_balances(c))
+        balance_tree.column(column, width=150, anchor="w")
+    balance_tree.pack(fill="both", expand=True)
+
+    # Алдымен жазыламыз, содан кейін ағымдағы күйді саламыз: арадағы өзгерістер жоғалмайды
+    balance_events = queue.Queue()  # Алдыңғы терезеден қалған ескі оқиғалар ескерілмейді
+    utxo_model.subscribe(on_balance_change)
+    for address, balance in list(utxo_model.balances.items()):
+        balance_tree.insert("", "end", iid=balance_iid(address), values=balance_row(address, balance))
+    root.after(BALANCE_POLL_MS, poll_balance_events)
+
+btn_show_balances = tk.Button(wallet_frame, text="Баланстарды көрсету", command=show_balances)
+btn_show_balances.grid(row=7, column=0, columnspan=4, pady=5)
+
+# Транзакция жіберу интерфейсі
+tk.Label(wallet_frame, text="Транзакция жіберу", font=("Arial", 12, "bold")).grid(row=8, column=0, columnspan=4, pady=5)
+
+tk.Label(wallet_frame, text="Жіберуші Адрес:").grid(row=9, column=0, sticky="e")
+entry_sender = tk.Entry(wallet_frame, width=40)
+entry_sender.grid(row=9, column=1, columnspan=3, padx=5, pady=2)
+
+tk.Label(wallet_frame, text="Алушы Адрес:").grid(row=10, column=0, sticky="e")
+entry_receiver = tk.Entry(wallet_frame, width=40)
+entry_receiver.grid(row=10, column=1, columnspan=3, padx=5, pady=2)
+
+tk.Label(wallet_frame, text="Сома:").grid(row=11, column=0, sticky="e")
+entry_amount = tk.Entry(wallet_frame, width=10)
+entry_amount.grid(row=11, column=1, padx=5, pady=2)
+
+tk.Label(wallet_frame, text="Комиссия:").grid(row=11, column=2, sticky="e")
+entry_fee = tk.Entry(wallet_frame, width=10)
+entry_fee.grid(row=11, column=3, padx=5, pady=2)
+
+def send_transaction():
+    try:
+        # Әмиян адрестері бүтін сандар: жолды сол күйі берсек, UTXOModel "123" деген жаңа аккаунт ашар еді
+        sender = int(entry_sender.get().strip())
+        receiver = int(entry_receiver.get().strip())
+    except ValueError:
+        messagebox.showerror("Қате", "Адрес бүтін сан болуы тиіс.")
+        return
+    try:
+        amount = float(entry_amount.get())
+        fee = float(entry_fee.get())
+    except ValueError:
+        messagebox.showerror("Қате", "Сома және комиссия сандық мән болуы тиіс.")
+        return
+    tx = Transaction(sender, receiver, amount, fee, utxo_model)
+    if not tx.valid:
+        messagebox.showerror("Қате", "Жіберушіде жеткілікті қаражат жоқ немесе транзакция жарамсыз.")
+        return
+    if not tx.verify_signature():
+        messagebox.showerror("Қате", "Қолтаңба жарамсыз.")
+        return
+    # Жаңа блок ретінде транзакцияны блокчейнге қосамыз.
+    if blockchain.add_block([tx]):
+        messagebox.showinfo("Жіберілді", "Транзакция жіберілді және блокқа қосылды.")
+        show_blocks()  # блок эксплорерін жаңартамыз
+    else:
+        messagebox.showerror("Қате", "Транзакция блокқа қосылмады.")
+
+btn_send_tx = tk.Button(wallet_frame, text="Транзакция жіберу", command=send_transaction)
+btn_send_tx.grid(row=12, column=0, columnspan=4, pady=5)
+
+# Блок эксплорері (GUI)
+explorer_frame = tk.Frame(root, bd=2, relief="groove")
+explorer_frame.pack(padx=10, pady=10, fill="both", expand=True)
+
+tk.Label(explorer_frame, text="Блок Эксплорер", font=("Arial", 12, "bold")).pack(pady=5)
+
+# Эксплорер Treeview-і блоктарды қосымша түрде жаңартады: rendered_hashes —
+# кестеге жазылған блоктардың хэштері, row_validity — әр жолда көрсетілген күй.
+# show_blocks тек жаңа блоктарды қосады, сондықтан жаңарту құны O(жаңа блоктар).
+# rendered_pruned_height — кестеде "кесілген" деп белгіленген жолдардың шекарасы:
+# кесу шекарасы жылжығанда тек аралықтағы жолдар қайта салынады.
+rendered_hashes = []
+row_validity = {}
+rendered_pruned_height = 0
+
+def block_validity(chain, i):
+    return "✅ Жарамды" if i == 0 or chain[i].previous_hash == chain[i - 1].hash else "❌ Жарамсыз"
+
+def repaint_validity(chain, heights):
+    """Көрсетілген жолдардың ішінен күйі өзгергендерін ғана қайта салу."""
+    for i in heights:
+        validity = block_validity(chain, i)
+        if row_validity.get(i) != validity:
+            row_validity[i] = validity
+            block_tree.set(str(i), "validity", validity)
+
+def repaint_pruned(chain, keep):
+    """Кесу шекарасы жылжыған соң кестедегі жолдардың транзакция бағанын жаңарту."""
+    global rendered_pruned_height
+    # Шекара жүктелген тізбекпен кері де жылжуы мүмкін, сондықтан екі бағытты да қараймыз
+    start = min(rendered_pruned_height, blockchain.pruned_height, keep)
+    end = min(max(rendered_pruned_height, blockchain.pruned_height), keep)
+    for i in range(start, end):
+        block_tree.set(str(i), "txs", "кесілген" if chain[i].pruned else chain[i].tx_count())
+    rendered_pruned_height = blockchain.pruned_height
+    selection = block_tree.selection()
+    if selection and start <= int(selection[0]) < end:
+        show_block_details()  # Ашық тұрған блоктың транзакциялары енді жүктелмейді
+
+def show_blocks():
+    chain = blockchain.chain
+    # Тізбек ауыстырылған болса (мысалы, жүктелген), тек айырмашылық басталған жерден бастап қайта саламыз
+    keep = min(len(rendered_hashes), len(chain))
+    while keep and rendered_hashes[keep - 1] != chain[keep - 1].hash:
+        keep -= 1
+    for i in range(keep, len(rendered_hashes)):
+        block_tree.delete(str(i))
+        row_validity.pop(i, None)
+    del rendered_hashes[keep:]
+    repaint_pruned(chain, keep)
+
+    for i in range(keep, len(chain)):
+        block = chain[i]
+        block_tree.insert("", "end", iid=str(i),
+                          values=(i, block.hash, block.timestamp,
+                                  "кесілген" if block.pruned else block.tx_count(), ""))
+        rendered_hashes.append(block.hash)
+    # Жаңа блоктар мен олардың алдындағы блоктың күйін ғана тексереміз
+    repaint_validity(chain, range(max(0, keep - 1), len(chain)))
+    if len(chain) > keep:
+        block_tree.see(str(len(chain) - 1))
+
+# Іздеу нәтижесінің жазбасы: (биіктік, мәтін). show_block_details оны блок
+# мәліметінің соңына қосады, сондықтан <<TreeviewSelect>> оқиғасы іздеуден
+# кейін өңделіп, мәліметті қайта сызса да, жазба өшпейді.
+search_note = None
+
+def show_block_details(event=None):
+    selection = block_tree.selection()
+    if not selection:
+        return
+    i = int(selection[0])
+    block = blockchain.chain[i]
+    transactions_info = "\n".join([
+        f"Жіберуші: {wallets.get(tx.sender, {}).get('name', tx.sender)} ({tx.sender})\n"
+        f"Алушы: {wallets.get(tx.receiver, {}).get('name', tx.receiver)} ({tx.receiver})\n"
+        f"Сома: {tx.amount}\n"
+        f"Tx Хэш: {tx.tx_hash}\n"
+        f"Сигнатура: {tx.signature} ({'жарамды' if tx.verify_signature() else 'жарамсыз'})"
+        for tx in block.transactions
+    ])
+    if block.pruned:
+        transactions_info = "(кесілген: тек тақырып сақталған)"
+    block_info = (f"Блок {i}\n"
+                  f"Хэш: {block.hash}\n"
+                  f"Уақыт: {block.timestamp}\n"
+                  f"Меркле түбірі: {block.merkle_root}\n"
+                  f"Транзакциялар:\n{transactions_info}\n"
+                  f"{block_validity(blockchain.chain, i)}")
+    if search_note is not None and search_note[0] == i:
+        block_info += search_note[1]
+    block_details.delete("1.0", tk.END)
+    block_details.insert(tk.END, block_info)
+
+block_tree = ttk.Treeview(explorer_frame, columns=("height", "hash", "time", "txs", "validity"), show="headings", height=10)
+for column, title, width in (("height", "Блок", 60), ("hash", "Хэш", 120), ("time", "Уақыт", 150),
+                             ("txs", "Транзакциялар", 100), ("validity", "Күйі", 110)):
+    block_tree.heading(column, text=title)
+    block_tree.column(column, width=width, anchor="w")
+block_tree.pack(fill="both", expand=True)
+block_tree.bind("<<TreeviewSelect>>", show_block_details)
+
+block_details = tk.Text(explorer_frame, height=8, font=("Arial", 10))
+block_details.pack(fill="x", pady=5)
+
+def select_block(height, note=None):
+    """Блоктың жолын кестеде таңдап, мәліметін көрсету. note — мәліметтің соңына қосылатын іздеу нәтижесі."""
+    global search_note
+    search_note = (height, note) if note else None
+    show_blocks()
+    block_tree.selection_set(str(height))
+    block_tree.see(str(height))
+    show_block_details()  # Жол бұрыннан таңдалған болса, оқиға келмейді
+
+SEARCH_LIST_LIMIT = 20  # Адрес бойынша іздегенде көрсетілетін соңғы орындар саны
+
+def search_chain():
+    """Блок хэші, транзакция хэші немесе адрес бойынша индекстен іздеп, жолға өту."""
+    query = entry_search.get().strip()
+    if not query:
+        return
+    keys = [query]
+    try:
+        keys.insert(0, int(query))  # Хэштер мен адрестер бүтін сан ретінде сақталады
+    except ValueError:
+        pass
+    for key in keys:
+        height = blockchain.find_block(key)
+        if height is not None:
+            select_block(height)
+            return
+        position = blockchain.find_transaction(key)
+        if position is not None:
+            select_block(position[0], f"\nІзделген транзакция: блок {position[0]}, №{position[1]}")
+            return
+        positions = blockchain.find_address(key)
+        if positions:
+            listing = ", ".join(f"{height}/{index}" for height, index in positions[-SEARCH_LIST_LIMIT:])
+            select_block(positions[-1][0], f"\nАдрес {key}: {len(positions)} транзакция (блок/№): {listing}")
+            return
+    messagebox.showinfo("Іздеу", f"'{query}' табылмады.")
+
+search_frame = tk.Frame(explorer_frame)
+search_frame.pack(fill="x", pady=5)
+
+tk.Label(search_frame, text="Іздеу (блок/tx хэші, адрес):").pack(side="left")
+entry_search = tk.Entry(search_frame, width=30)
+entry_search.pack(side="left", padx=5)
+tk.Button(search_frame, text="Іздеу", command=search_chain).pack(side="left")
+
+btn_show_blocks = tk.Button(explorer_frame, text="Блоктарды жаңарту", command=show_blocks)
+btn_show_blocks.pack(pady=5)
+
+def save_snapshot():
+    filename = filedialog.asksaveasfilename(defaultextension=".snap", filetypes=[("Snapshot", "*.snap")])
+    if filename:
+        size = blockchain.save_snapshot(filename)
+        messagebox.showinfo("Снапшот", f"{len(blockchain.chain)} блок сақталды ({size} байт).")
+
+def load_snapshot():
+    filename = filedialog.askopenfilename(filetypes=[("Snapshot", "*.snap")])
+    if filename:
+        try:
+            count = blockchain.load_snapshot(filename)
+        except (OSError, SnapshotError) as error:
+            messagebox.showerror("Қате", f"Снапшот жүктелмеді: {error}")
+            return
+        show_blocks()
+        messagebox.showinfo("Снапшот", f"{count} блок жүктелді.")
+
+snapshot_frame = tk.Frame(explorer_frame)
+snapshot_frame.pack(pady=5)
+
+tk.Button(snapshot_frame, text="Снапшот сақтау", command=save_snapshot).pack(side="left", padx=5)
+tk.Button(snapshot_frame, text="Снапшот жүктеу", command=load_snapshot).pack(side="left", padx=5)
+
+# Тізбекті тексеру фондық ағында жүреді: прогресс validation_queue арқылы
+# беріліп, root.after көмегімен оқылады, сондықтан терезе қатып қалмайды.
+validation_queue = queue.Queue()
+validation_cancel = None
+VALIDATION_POLL_MS = 100
+
+def validation_worker(cancelled):
+    timings = {}
+    try:
+        result = blockchain.is_valid_chain(
+            progress=lambda done, total: validation_queue.put(("progress", done, total)),
+            cancelled=cancelled, timings=timings)
+        validation_queue.put(("done", result, timings))
+    except Exception as e:
+        validation_queue.put(("error", e, timings))
+
+def check_validity():
+    global validation_cancel
+    if validation_cancel is not None:
+        return  # Тексеру жүріп жатыр
+    validation_cancel = threading.Event()
+    btn_check_validity.config(state="disabled")
+    btn_cancel_validity.config(state="normal")
+    validation_progress.config(value=0)
+    validation_label.config(text="Тексерілуде...")
+    threading.Thread(target=validation_worker, args=(validation_cancel,), daemon=True).start()
+    root.after(VALIDATION_POLL_MS, poll_validation)
+
+def cancel_validity():
+    if validation_cancel is not None:
+        validation_cancel.set()
+        validation_label.config(text="Тоқтатылуда...")
+
+def poll_validation():
+    global validation_cancel
+    finished = None
+    try:
+        while True:
+            message = validation_queue.get_nowait()
+            if message[0] == "progress":
+                _, done, total = message
+                validation_progress.config(value=100 * done / total)
+                validation_label.config(text=f"Тексерілді: {done}/{total} блок")
+            else:
+                finished = message
+    except queue.Empty:
+        pass
+    if finished is None:
+        root.after(VALIDATION_POLL_MS, poll_validation)
+        return
+
+    validation_cancel = None
+    btn_check_validity.config(state="normal")
+    btn_cancel_validity.config(state="disabled")
+    kind, result, timings = finished
+    summary = format_timings(timings)
+    if kind == "error":
+        validation_label.config(text="Тексеру қатемен аяқталды")
+        messagebox.showerror("Блокчейн қатесі", f"Тексеру кезінде қате: {result}\n\n{summary}")
+    elif result is None:
+        validation_label.config(text="Тексеру тоқтатылды")
+        messagebox.showinfo("Блокчейн дұрыстығы", f"Тексеру тоқтатылды.\n\n{summary}")
+    elif result:
+        validation_progress.config(value=100)
+        validation_label.config(text="✅ Блокчейн жарамды")
+        messagebox.showinfo("Блокчейн дұрыстығы", f"✅ Блокчейн жарамды!\n\n{summary}")
+    else:
+        validation_label.config(text="❌ Блокчейнде қате бар")
+        messagebox.showerror("Блокчейн қатесі", f"❌ Блокчейнде қате бар!\n\n{summary}")
+
+validation_frame = tk.Frame(explorer_frame)
+validation_frame.pack(pady=5, fill="x")
+
+btn_check_validity = tk.Button(validation_frame, text="Блокчейнді тексеру", command=check_validity)
+btn_check_validity.pack(side="left", padx=5)
+
+btn_cancel_validity = tk.Button(validation_frame, text="Тоқтату", command=cancel_validity, state="disabled")
+btn_cancel_validity.pack(side="left", padx=5)
+
+validation_progress = ttk.Progressbar(validation_frame, length=200, maximum=100)
+validation_progress.pack(side="left", padx=5)
+
+validation_label = tk.Label(validation_frame, text="")
+validation_label.pack(side="left", padx=5)
+
+def on_close():
+    # Келесі іске қосу тарихты қайталамауы үшін тізбек снапшотқа жазылады
+    try:
+        blockchain.save_snapshot(SNAPSHOT_PATH)
+    except OSError as error:
+        print("Снапшот сақталмады:", error)
+    utxo_model.wal.checkpoint(utxo_model.balances)
+    utxo_model.wal.close()
+    root.destroy()
+
+root.protocol("WM_DELETE_WINDOW", on_close)
+
+root.mainloop()
@@ -0,0 +1,285 @@
+import os
+import struct
+import threading
+import time
+import zlib
+from snapshot import encode_value, decode_value, SnapshotError
+
+# ===== Баланстардың алдын ала жазу журналы (WAL) =====
+# Әр баланс өзгерісі жадтағы сөздікке түспес бұрын журналға жазылады:
+# (lsn, түрі, адрес, ескі мән, жаңа мән; None — аккаунт жоқ). Жаңа мән
+# сақталатындықтан, қайталау дәл (float қателігі жиналмайды) және
+# идемпотентті. Бір операцияның жазбалары (мысалы, аударымның екі жағы)
+# бір топ болып жиналады да, commit_batch() топты COMMIT белгісімен бірге
+# ғана жазу кезегіне береді: дискке не бүкіл топ түседі, не ешнәрсе.
+# Қалпына келгенде COMMIT белгісіне жетпеген соңғы топ ескерілмейді.
+# Журнал фондық ағында топтап (group commit) fsync жасалады, ал әр
+# CHECKPOINT_EVERY жазбадан кейін операциялар арасында барлық баланстар
+# бақылау нүктесіне жазылып, журнал қысқартылады.
+# Қалпына келтіру: соңғы бақылау нүктесі + журналдың құйрығы ғана.
+# Тізбекке блок қосылған сайын журналға тізбек ұшының хэші де жазылады
+# (TIP жазбасы), ал бақылау нүктесі оны сақтайды. Қалпына келгенде
+# tip баланстар қай тізбек күйіне сәйкес екенін көрсетеді: тізбектің ұшы
+# басқа болса, баланстарды қолдануға болмайды.
+
+LOG_NAME = "balances.wal"
+CHECKPOINT_NAME = "balances.ckpt"
+CHECKPOINT_MAGIC = b"BCWALCK2"
+CHECKPOINT_EVERY = 10000     # Бақылау нүктесіне дейінгі жазбалар саны
+GROUP_COMMIT_DELAY = 0.002   # Бір fsync-ке жазбаларды жинау уақыты (сек)
+
+RECORD_HEADER = struct.Struct("<I")   # жазба ұзындығы
+RECORD_LSN = struct.Struct("<QB")     # lsn, жазба түрі
+RECORD_BALANCE, RECORD_TIP, RECORD_COMMIT = 0, 1, 2
+CRC = struct.Struct("<I")
+CHECKPOINT_HEADER = struct.Struct("<8sQI")  # magic, lsn, баланс саны
+
+
+def encode_record(lsn, kind, address=None, old=None, new=None):
+    payload = bytearray(RECORD_LSN.pack(lsn, kind))
+    for value in (address, old, new):
+        encode_value(payload, value)
+    return RECORD_HEADER.pack(len(payload)) + payload + CRC.pack(zlib.crc32(payload))
+
+
+def read_records(data):
+    """
+    Журнал байттарынан аяқталған топтарды оқу. Қайтарады: (топтар, жарамды ұзындық);
+    әр топ — (lsn, түрі, адрес, ескі, жаңа) жазбалар тізімі, соңғысы COMMIT белгісі.
+    Жазба жартылай жазылса немесе CRC сәйкес келмесе, оқу сонда тоқтайды; COMMIT
+    белгісіне жетпеген соңғы топ жарамды ұзындыққа кірмейді.
+    """
+    batches = []
+    records = []
+    pos = valid_length = 0
+    while pos + RECORD_HEADER.size <= len(data):
+        length = RECORD_HEADER.unpack_from(data, pos)[0]
+        end = pos + RECORD_HEADER.size + length + CRC.size
+        if end > len(data):
+            break
+        payload = data[pos + RECORD_HEADER.size:end - CRC.size]
+        if zlib.crc32(payload) != CRC.unpack_from(data, end - CRC.size)[0]:
+            break
+        try:
+            lsn, kind = RECORD_LSN.unpack_from(payload, 0)
+        except struct.error:
+            break
+        values = []
+        offset = RECORD_LSN.size
+        try:
+            for _ in range(3):
+                value, offset = decode_value(payload, offset)
+                values.append(value)
+        except (SnapshotError, struct.error):
+            break
+        records.append((lsn, kind, *values))
+        pos = end
+        if kind == RECORD_COMMIT:
+            batches.append(records)
+            records = []
+            valid_length = pos
+    return batches, valid_length
+
+
+class BalanceWAL:
+    """
+    Баланстар журналы. Қолдану тәртібі:
+        wal = BalanceWAL(directory)
+        balances = wal.recover()          # іске қосылғанда бір рет
+        wal.append(address, old, new)     # ашық топқа қосу
+        wal.append_tip(block_hash)        # блок қосылғанда: тізбектің жаңа ұшы
+        lsn = wal.commit_batch()          # топты бүтін күйінде жазу кезегіне беру
+        wal.wait_durable(lsn)             # fsync болғанша күту (group commit)
+        wal.checkpoint(balances)          # журналды қысқарту (топтар арасында ғана)
+    """
+    def __init__(self, directory, checkpoint_every=CHECKPOINT_EVERY, group_commit_delay=GROUP_COMMIT_DELAY):
+        os.makedirs(directory, exist_ok=True)
+        self.log_path = os.path.join(directory, LOG_NAME)
+        self.checkpoint_path = os.path.join(directory, CHECKPOINT_NAME)
+        self.checkpoint_every = checkpoint_every
+        self.group_commit_delay = group_commit_delay
+        self.lock = threading.Lock()
+        self.written = threading.Condition(self.lock)
+        self.batch = bytearray()    # Әлі COMMIT белгісі жоқ ашық топ
+        self.pending = bytearray()  # Аяқталған, дискке жазылуын күтетін топтар
+        self.lsn = 0
+        self.committed_lsn = 0
+        self.durable_lsn = 0
+        self.checkpoint_lsn = 0
+        self.tip = None  # Баланстар сәйкес келетін тізбек ұшының хэші
+        self.log = None
+        self.closed = False
+        self.flusher = None
+
+    # --- Қалпына келтіру ---
+
+    def load_checkpoint(self):
+        """Бақылау нүктесі: (lsn, баланстар, тізбек ұшы). Файл әлі жоқ болса (0, {}, None)."""
+        try:
+            with open(self.checkpoint_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return 0, {}, None
+        if len(data) < CHECKPOINT_HEADER.size + CRC.size or \
+                zlib.crc32(data[:-CRC.size]) != CRC.unpack_from(data, len(data) - CRC.size)[0]:
+            raise SnapshotError("Бақылау нүктесінің файлы бүлінген.")
+        magic, lsn, count = CHECKPOINT_HEADER.unpack_from(data, 0)
+        if magic != CHECKPOINT_MAGIC:
+            raise SnapshotError("Бақылау нүктесінің форматы танылмады.")
+        balances = {}
+        pos = CHECKPOINT_HEADER.size
+        for _ in range(count):
+            address, pos = decode_value(data, pos)
+            balance, pos = decode_value(data, pos)
+            balances[address] = balance
+        tip = decode_value(data, pos)[0]
+        return lsn, balances, tip
+
+    def recover(self):
+        """
+        Соңғы бақылау нүктесін жүктеп, журналдағы одан кейінгі жазбаларды қолдану.
+        Журналдың бүлінген құйрығы кесіледі. Содан кейін журнал жазуға ашылады.
+        Қайтарады: баланстар сөздігі; олар сәйкес келетін тізбек ұшы — self.tip.
+        """
+        self.checkpoint_lsn, balances, self.tip = self.load_checkpoint()
+        self.lsn = self.durable_lsn = self.checkpoint_lsn
+        data = b""
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "rb") as f:
+                data = f.read()
+        batches, valid_length = read_records(data)
+        for batch in batches:
+            if batch[-1][0] <= self.checkpoint_lsn:
+                continue
+            for lsn, kind, address, old, new in batch:
+                if kind == RECORD_TIP:
+                    self.tip = new
+                elif kind == RECORD_BALANCE:
+                    if new is None:
+                        balances.pop(address, None)  # Аккаунт жойылған
+                    else:
+                        balances[address] = new
+            self.lsn = self.durable_lsn = batch[-1][0]
+        self.committed_lsn = self.lsn
+        self.log = open(self.log_path, "ab")
+        if valid_length < len(data):
+            self.log.truncate(valid_length)  # Апат кезінде жартылай жазылған жазба немесе аяқталмаған топ
+        self.start()
+        return balances
+
+    # --- Жазу ---
+
+    def start(self):
+        if self.log is None:
+            self.log = open(self.log_path, "ab")
+        if self.flusher is None:
+            self.flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self.flusher.start()
+
+    def append(self, address, old, new):
+        """Өзгерісті ашық топқа қосу. Қайтарады: жазбаның lsn нөмірі."""
+        with self.lock:
+            self.lsn += 1
+            self.batch += encode_record(self.lsn, RECORD_BALANCE, address, old, new)
+            return self.lsn
+
+    def append_tip(self, tip):
+        """Баланстар енді tip хэшімен аяқталатын тізбекке сәйкес: белгіні ашық топқа қосу."""
+        with self.lock:
+            old, self.tip = self.tip, tip
+            self.lsn += 1
+            self.batch += encode_record(self.lsn, RECORD_TIP, None, old, tip)
+            return self.lsn
+
+    def commit_batch(self):
+        """
+        Ашық топты COMMIT белгісімен жабып, жазу кезегіне беру.
+        Қайтарады: топтың соңғы lsn нөмірі (wait_durable үшін).
+        """
+        with self.lock:
+            if self.batch:
+                self.lsn += 1
+                self.pending += self.batch + encode_record(self.lsn, RECORD_COMMIT)
+                self.batch.clear()
+                self.committed_lsn = self.lsn
+                self.written.notify_all()
+            return self.committed_lsn
+
+    def _write_pending(self):
+        """Кезектегі жазбаларды файлға жазып, fsync жасау (self.lock ұсталған күйде)."""
+        if not self.pending:
+            return
+        data, lsn = bytes(self.pending), self.committed_lsn
+        self.pending.clear()
+        self.log.write(data)
+        self.log.flush()
+        os.fsync(self.log.fileno())
+        self.durable_lsn = lsn
+
+    def _flush_loop(self):
+        while True:
+            with self.lock:
+                while not self.pending and not self.closed:
+                    self.written.wait()
+                if self.closed:
+                    return
+            # Бір fsync-ке көбірек жазба жинау үшін сәл күтеміз (group commit)
+            time.sleep(self.group_commit_delay)
+            with self.lock:
+                if self.closed:
+                    return
+                self._write_pending()
+                self.written.notify_all()
+
+    def wait_durable(self, lsn):
+        """lsn дейінгі жазбалар дискке fsync болғанша күту."""
+        with self.lock:
+            while self.durable_lsn < lsn and not self.closed:
+                self.written.wait()
+
+    def flush(self):
+        with self.lock:
+            self._write_pending()
+            self.written.notify_all()
+
+    # --- Бақылау нүктесі ---
+
+    def needs_checkpoint(self):
+        return self.committed_lsn - self.checkpoint_lsn >= self.checkpoint_every
+
+    def checkpoint(self, balances):
+        """
+        Барлық баланстарды бақылау нүктесіне жазып, журналды босату.
+        Тек топтар арасында шақырылады: balances жартылай қолданылған
+        операцияны қамтымауы тиіс (UTXOModel оны commit ішінен шақырады).
+        """
+        with self.lock:
+            if self.batch:
+                raise RuntimeError("Ашық топ бар кезде бақылау нүктесін жазуға болмайды.")
+            self._write_pending()
+            out = bytearray(CHECKPOINT_HEADER.pack(CHECKPOINT_MAGIC, self.lsn, len(balances)))
+            for address, balance in balances.items():
+                encode_value(out, address)
+                encode_value(out, balance)
+            encode_value(out, self.tip)
+            out += CRC.pack(zlib.crc32(out))
+            temp_path = self.checkpoint_path + ".tmp"
+            with open(temp_path, "wb") as f:
+                f.write(out)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.checkpoint_path)
+            # Бақылау нүктесі сақталғаннан кейін ғана журнал қысқартылады
+            self.log.truncate(0)
+            self.log.flush()
+            os.fsync(self.log.fileno())
+            self.checkpoint_lsn = self.lsn
+            self.written.notify_all()
+
+    def close(self):
+        with self.lock:
+            if self.log is not None and not self.closed:
+                self._write_pending()
+                self.log.close()
+            self.closed = True
+            self.written.notify_all()
@@ -0,0 +1,120 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy жоқ болса, барлық қолтаңба скалярлық pow арқылы тексеріледі
+    np = None
+
+# ===== Қолтаңбаларды топтап тексеру =====
+# Демо әмияндардың модулі кішкентай (n = 3233, 2021, 3127, ...), сондықтан
+# s^e mod n есебін int64 массивтерінде "квадраттау және көбейту" әдісімен
+# бүкіл блок үшін бір векторлық өтуде жүргізуге болады.
+
+VECTOR_MODULUS_LIMIT = 1 << 31  # (n - 1)^2 int64-ке сыюы тиіс
+
+
+def verify_claim(claim):
+    """Бір қолтаңбаны скалярлық pow арқылы тексеру: claim = (tx_hash, signature, (e, n))."""
+    tx_hash, signature, (e, n) = claim
+    return pow(signature, e, n) == tx_hash % n
+
+
+def vector_modexp(bases, exponents, moduli):
+    """bases^exponents mod moduli мәндерін элемент бойынша есептеу (int64 массивтері)."""
+    result = np.ones_like(bases)
+    base = bases % moduli
+    exponent = exponents.copy()
+    while exponent.any():
+        odd = (exponent & 1) == 1
+        result = np.where(odd, result * base % moduli, result)
+        base = base * base % moduli
+        exponent >>= 1
+    return result
+
+
+def batch_verify(claims):
+    """
+    Қолтаңбалар тізімін тексеру. claims: [(tx_hash, signature, (e, n)), ...].
+    Талаптар ашық кілт бойынша топталады: кіші модульді топтар бір NumPy
+    өтуінде, ал үлкен модульді топтар скалярлық pow арқылы тексеріледі.
+    Нәтиже: claims ретімен сәйкес келетін bool тізімі.
+    """
+    results = [False] * len(claims)
+    groups = {}
+    for i, (_, _, public_key) in enumerate(claims):
+        groups.setdefault(tuple(public_key), []).append(i)
+
+    vector_indices = []
+    for (e, n), indices in groups.items():
+        if np is not None and n < VECTOR_MODULUS_LIMIT and e < VECTOR_MODULUS_LIMIT:
+            vector_indices.extend(indices)
+        else:
+            for i in indices:
+                results[i] = verify_claim(claims[i])
+
+    if vector_indices:
+        moduli = np.array([claims[i][2][1] for i in vector_indices], dtype=np.int64)
+        exponents = np.array([claims[i][2][0] for i in vector_indices], dtype=np.int64)
+        signatures = np.array([claims[i][1] % claims[i][2][1] for i in vector_indices], dtype=np.int64)
+        expected = np.array([claims[i][0] % claims[i][2][1] for i in vector_indices], dtype=np.int64)
+        matches = vector_modexp(signatures, exponents, moduli) == expected
+        for i, ok in zip(vector_indices, matches.tolist()):
+            results[i] = ok
+    return results
+
+
+# ===== Қолтаңбаларды параллель тексеру =====
+
+LARGE_KEY_BITS = 512  # Осыдан үлкен модульдер процестер пулында тексеріледі
+CHUNK_SIZE = 64       # Бір тапсырмадағы қолтаңба саны
+
+
+class VerifyExecutor:
+    """
+    Блок қолтаңбаларын параллель тексеретін орындаушы.
+    Үлкен кілттер (pow ұзақ, GIL-ді ұстайды) процестер пулына, кіші кілттер
+    ағындар пулына жіберіледі. Пулдар алғаш қажет болғанда ғана құрылады.
+    submit() тапсырмалары бөлек бір ағынды пулда орындалады: олар verify()
+    бөліктерін күтетіндіктен, тексеру пулының барлық ағынын алып қойып,
+    бөліктерді ешқашан орындалмайтын күйге жеткізбеуі тиіс (deadlock).
+    """
+    def __init__(self, max_workers=None, chunk_size=CHUNK_SIZE):
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.threads = None
+        self.processes = None
+        self.tasks = None
+
+    def _thread_pool(self):
+        if self.threads is None:
+            self.threads = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self.threads
+
+    def _process_pool(self):
+        if self.processes is None:
+            self.processes = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self.processes
+
+    def verify(self, claims):
+        """batch_verify сияқты, бірақ claims бөліктерге бөлініп, параллель тексеріледі."""
+        if not claims:
+            return []
+        large = any(claim[2][1].bit_length() >= LARGE_KEY_BITS for claim in claims)
+        pool = self._process_pool() if large else self._thread_pool()
+        futures = [pool.submit(batch_verify, claims[i:i + self.chunk_size])
+                   for i in range(0, len(claims), self.chunk_size)]
+        return [ok for future in futures for ok in future.result()]
+
+    def submit(self, fn, *args):
+        """
+        Фондық ағында кез келген тапсырманы орындау (мысалы, блок қосу).
+        Тапсырмалар жіберілу ретімен бірінен соң бірі орындалады.
+        """
+        if self.tasks is None:
+            self.tasks = ThreadPoolExecutor(max_workers=1)
+        return self.tasks.submit(fn, *args)
+
+    def shutdown(self):
+        for pool in (self.tasks, self.threads, self.processes):
+            if pool is not None:
+                pool.shutdown(wait=False)
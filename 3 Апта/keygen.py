@@ -0,0 +1,188 @@
+import random
+import threading
+import queue
+from concurrent.futures import Future
+
+# ===== RSA кілттерін жылдам генерациялау =====
+# Жай сандар Миллер–Рабин тестімен тексеріледі, модульдік кері элемент
+# итеративті кеңейтілген Эвклид алгоритмімен табылады, сондықтан 1024–2048
+# биттік кілттер де секундтың үлесінде генерацияланады.
+
+SMALL_PRIMES = [p for p in range(3, 1000, 2) if all(p % d for d in range(3, int(p ** 0.5) + 1, 2))]
+DEFAULT_E = 65537
+
+
+def gcd(a, b):
+    """Екі санның ортақ бөлгішін табу."""
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def egcd(a, b):
+    """Кеңейтілген Эвклид алгоритмі (итеративті): (g, x, y), a * x + b * y = g."""
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        quotient = old_r // r
+        old_r, r = r, old_r - quotient * r
+        old_x, x = x, old_x - quotient * x
+        old_y, y = y, old_y - quotient * y
+    return old_r, old_x, old_y
+
+
+def mod_inverse(a, m):
+    """Модульдік кері элементті табу: a * x ≡ 1 (mod m)."""
+    g, x, _ = egcd(a, m)
+    if g != 1:
+        raise Exception("Модульдік кері элемент жоқ.")
+    return x % m
+
+
+def is_probable_prime(n, rounds=40, rng=None):
+    """
+    Миллер–Рабин тесті: n жай сан болса True, құрама болса False
+    (қателік ықтималдығы 4^-rounds-тан аспайды).
+    """
+    if n < 2:
+        return False
+    if n in (2, 3):
+        return True
+    if n % 2 == 0:
+        return False
+    for p in SMALL_PRIMES:
+        if n == p:
+            return True
+        if n % p == 0:
+            return False
+    rng = rng or random
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for _ in range(rounds):
+        a = rng.randrange(2, n - 1)
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def generate_prime(bits, rng=None, e=DEFAULT_E):
+    """bits биттік жай сан генерациялау (gcd(e, p - 1) = 1 шартымен)."""
+    rng = rng or random.SystemRandom()
+    while True:
+        # Ең жоғарғы екі бит қойылады, сонда p * q дәл 2 * bits бит болады
+        candidate = rng.getrandbits(bits) | (0b11 << (bits - 2)) | 1
+        if gcd(e, candidate - 1) == 1 and is_probable_prime(candidate, rng=rng):
+            return candidate
+
+
+def generate_keypair(p, q):
+    """
+    RSA кілт жұбын генерациялау:
+      - p және q: екі жай сан.
+      - n = p * q, phi = (p - 1) * (q - 1)
+      - Ашық кілт үшін e таңдалады (1 < e < phi, gcd(e, phi) = 1).
+      - Жеке кілт d есептеледі: e * d ≡ 1 (mod phi).
+    Ашық кілт: (e, n), жеке кілт: (d, n)
+    """
+    if not (is_probable_prime(p) and is_probable_prime(q)):
+        raise ValueError("p және q жай сандар болуы тиіс.")
+    if p == q:
+        raise ValueError("p және q бір-біріне тең болмауы керек.")
+    return build_keypair(p, q)
+
+
+def build_keypair(p, q):
+    """generate_keypair сияқты, бірақ p мен q қайта тексерілмейді (generate_prime нәтижелері үшін)."""
+    n = p * q
+    phi = (p - 1) * (q - 1)
+
+    e = DEFAULT_E  # Әдетте қолданылатын e мәні
+    if gcd(e, phi) != 1:
+        e = 3
+        while gcd(e, phi) != 1:
+            e += 2
+    d = mod_inverse(e, phi)
+    return (e, n), (d, n)
+
+
+def crt_params(p, q, d):
+    """
+    Қытай қалдықтар теоремасы (CRT) бойынша қол қоюға арналған параметрлер:
+    (p, q, dP, dQ, qInv), мұнда dP = d mod (p - 1), dQ = d mod (q - 1), qInv = q^-1 mod p.
+    """
+    return (p, q, d % (p - 1), d % (q - 1), mod_inverse(q, p))
+
+
+def sign_crt(message, crt):
+    """
+    message^d mod n мәнін CRT арқылы есептеу: екі жартылай өлшемді дәрежеге
+    шығару толық d дәрежесінен шамамен 4 есе жылдам.
+    """
+    p, q, d_p, d_q, q_inv = crt
+    m1 = pow(message % p, d_p, p)
+    m2 = pow(message % q, d_q, q)
+    h = (q_inv * (m1 - m2)) % p
+    return m2 + h * q
+
+
+def generate_rsa_keypair(bits=1024, rng=None):
+    """
+    bits биттік модулі бар RSA кілт жұбын кездейсоқ жай сандардан генерациялау.
+    Қайтарады: (ашық кілт, жеке кілт, CRT параметрлері).
+    """
+    rng = rng or random.SystemRandom()
+    p = generate_prime(bits // 2, rng)
+    q = generate_prime(bits // 2, rng)
+    while q == p:
+        q = generate_prime(bits // 2, rng)
+    public_key, private_key = build_keypair(p, q)
+    return public_key, private_key, crt_params(p, q, private_key[0])
+
+
+class KeyPool:
+    """
+    Алдын ала генерацияланған кілт жұптарының пулы.
+    Фондық ағын пулды size кілтке дейін толтырып отырады. Пулда кілт болса,
+    get() бірден қайтады; бірақ қатарынан size-тан көп сұралса, пул босап,
+    get() кілтті сол жерде генерациялайды (1024 бит — шамамен 0.1 с, кейде одан ұзақ).
+    Интерфейс ағыны бөгелмеуі үшін get_async() қолданылады: пул бос болса,
+    ол келесі дайын кілтті Future арқылы береді.
+    """
+    def __init__(self, bits=1024, size=32):
+        self.bits = bits
+        self.keys = queue.Queue(maxsize=size)
+        self.thread = threading.Thread(target=self._fill, daemon=True)
+        self.thread.start()
+
+    def _fill(self):
+        while True:
+            self.keys.put(generate_rsa_keypair(self.bits))
+
+    def get(self):
+        try:
+            return self.keys.get_nowait()
+        except queue.Empty:
+            return generate_rsa_keypair(self.bits)
+
+    def get_async(self):
+        """Кілтті Future ретінде алу: пулда бар болса, Future бірден орындалған."""
+        future = Future()
+        try:
+            future.set_result(self.keys.get_nowait())
+        except queue.Empty:
+            # Толтыру ағыны келесі кілтті қойғанда күтушілер оларды кезекпен алады
+            threading.Thread(target=lambda: future.set_result(self.keys.get()), daemon=True).start()
+        return future
+
+    def available(self):
+        return self.keys.qsize()
@@ -0,0 +1,170 @@
+import json
+import sqlite3
+import threading
+from collections.abc import MutableMapping
+
+# ===== Индекстелген әмиян қоймасы =====
+# Барлық әмиян бір SQLite файлында сақталады: адрес бойынша іздеу PRIMARY KEY
+# индексі арқылы жүреді, ал жеке кілттер тек қол қою кезінде ғана жүктеледі.
+# Сондықтан 100 мың әмиянмен де бағдарлама бірден іске қосылады.
+
+PRIVATE_FIELDS = ('private_key', 'crt')
+
+
+def _encode(value):
+    return json.dumps(value)
+
+
+def _decode(text):
+    value = json.loads(text)
+    return tuple(value) if isinstance(value, list) else value
+
+
+class LazyWallet(dict):
+    """Әмиян сөздігі: жеке кілт пен CRT параметрлері алғаш сұралғанда қоймадан жүктеледі."""
+    def __init__(self, keystore, fields):
+        super().__init__(fields)
+        self.keystore = keystore
+
+    def __missing__(self, key):
+        if key not in PRIVATE_FIELDS or 'private_key' in self:
+            raise KeyError(key)
+        self.update(self.keystore.private_fields(self['address']))
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+class WalletKeystore:
+    """Әмияндарды бір SQLite файлында сақтау, жаппай импорт және экспорт."""
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute("""CREATE TABLE IF NOT EXISTS wallets (
+                address TEXT PRIMARY KEY,
+                name TEXT,
+                public_key TEXT,
+                private_key TEXT,
+                crt TEXT)""")
+        self.wallets = KeystoreWallets(self)
+
+    @staticmethod
+    def _row(wallet):
+        return (_encode(wallet['address']), wallet.get('name'), _encode(wallet['public_key']),
+                _encode(wallet.get('private_key')), _encode(wallet.get('crt')))
+
+    def put(self, wallet):
+        self.import_wallets([wallet])
+
+    def import_wallets(self, wallets):
+        """Әмияндарды бір транзакцияда жаппай жазу. Қайтарады: жазылған саны."""
+        rows = [self._row(wallet) for wallet in wallets]
+        with self.lock, self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO wallets VALUES (?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def get(self, address):
+        """Әмиянның ашық бөлігі (жеке кілт жүктелмейді) немесе None."""
+        with self.lock:
+            row = self.conn.execute("SELECT name, public_key FROM wallets WHERE address = ?",
+                                    (_encode(address),)).fetchone()
+        if row is None:
+            return None
+        return LazyWallet(self, {'name': row[0], 'public_key': _decode(row[1]), 'address': address})
+
+    def private_fields(self, address):
+        with self.lock:
+            row = self.conn.execute("SELECT private_key, crt FROM wallets WHERE address = ?",
+                                    (_encode(address),)).fetchone()
+        if row is None:
+            raise KeyError(address)
+        return {'private_key': _decode(row[0]), 'crt': _decode(row[1])}
+
+    def delete(self, address):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM wallets WHERE address = ?", (_encode(address),))
+
+    def contains(self, address):
+        with self.lock:
+            return self.conn.execute("SELECT 1 FROM wallets WHERE address = ?",
+                                     (_encode(address),)).fetchone() is not None
+
+    def addresses(self):
+        with self.lock:
+            rows = self.conn.execute("SELECT address FROM wallets").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM wallets").fetchone()[0]
+
+    def export_file(self, filename):
+        """Барлық әмиянды JSON Lines файлына жазу (бір жолда бір әмиян). Қайтарады: саны."""
+        with self.lock:
+            rows = self.conn.execute("SELECT address, name, public_key, private_key, crt FROM wallets").fetchall()
+        with open(filename, "w") as f:
+            for address, name, public_key, private_key, crt in rows:
+                wallet = {'name': name, 'public_key': json.loads(public_key),
+                          'private_key': json.loads(private_key), 'crt': json.loads(crt),
+                          'address': json.loads(address)}
+                f.write(json.dumps(wallet) + "\n")
+        return len(rows)
+
+    def import_file(self, filename, batch_size=10000):
+        """JSON Lines файлынан әмияндарды бумалап импорттау. Қайтарады: саны."""
+        total = 0
+        batch = []
+        with open(filename, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                batch.append(json.loads(line))
+                if len(batch) >= batch_size:
+                    total += self.import_wallets(batch)
+                    batch = []
+        if batch:
+            total += self.import_wallets(batch)
+        self.wallets.cache.clear()
+        return total
+
+
+class KeystoreWallets(MutableMapping):
+    """
+    wallets сөздігінің орнына қолданылатын көрініс: оқылған әмияндар жадта
+    кэштеледі, жазу бірден қоймаға түседі.
+    """
+    def __init__(self, keystore):
+        self.keystore = keystore
+        self.cache = {}
+
+    def __getitem__(self, address):
+        wallet = self.cache.get(address)
+        if wallet is None:
+            wallet = self.keystore.get(address)
+            if wallet is None:
+                raise KeyError(address)
+            self.cache[address] = wallet
+        return wallet
+
+    def __setitem__(self, address, wallet):
+        self.keystore.put(wallet)
+        self.cache.pop(address, None)
+
+    def __delitem__(self, address):
+        self.keystore.delete(address)
+        self.cache.pop(address, None)
+
+    def __contains__(self, address):
+        return address in self.cache or self.keystore.contains(address)
+
+    def __iter__(self):
+        return iter(self.keystore.addresses())
+
+    def __len__(self):
+        return self.keystore.count()
@@ -1,34 +1,145 @@
 import hashlib
+import heapq
+import itertools
+import json
 import time
 import random
 
+
+def tx_size(transaction):
+    """Транзакцияның блоктағы өлшемі (байт): JSON түріндегі ұзындығы."""
+    return len(json.dumps(transaction, sort_keys=True).encode())
+
+
+class BlockTemplate:
+    """
+    Блок үлгісі: күтудегі транзакциялардан комиссиясы ең тиімділерін таңдау.
+      - max_txs: блоктағы транзакциялардың ең көп саны,
+      - max_size: блоктағы транзакциялардың жалпы өлшемі (байт).
+    Транзакциялар fee_rate = fee / size бойынша сұрыпталады (ашкөз таңдау).
+    Таңдалғандар min-heap-те (ең нашары жоғарыда), сыймағандары max-heap-те
+    (ең жақсысы жоғарыда) сақталады, сондықтан жаңа транзакция келгенде бүкіл
+    пулды қайта сұрыптаудың қажеті жоқ: O(log n) уақытта үлгі жаңарады.
+    """
+    def __init__(self, max_txs=None, max_size=None):
+        self.max_txs = max_txs
+        self.max_size = max_size
+        self.selected = []  # (fee_rate, seq, size, tx) — min-heap
+        self.waiting = []   # (-fee_rate, seq, size, tx) — max-heap
+        self.selected_size = 0
+        self.selected_fees = 0
+        self._seq = itertools.count()
+
+    def _fits(self, size):
+        if self.max_txs is not None and len(self.selected) + 1 > self.max_txs:
+            return False
+        if self.max_size is not None and self.selected_size + size > self.max_size:
+            return False
+        return True
+
+    def _select(self, fee_rate, seq, size, tx):
+        heapq.heappush(self.selected, (fee_rate, seq, size, tx))
+        self.selected_size += size
+        self.selected_fees += tx['fee']
+
+    def _pop_worst(self):
+        item = heapq.heappop(self.selected)
+        self.selected_size -= item[2]
+        self.selected_fees -= item[3]['fee']
+        return item
+
+    def _refill(self, scan_all=True):
+        """
+        Босаған орынды күтудегі ең тиімді транзакциялармен толтыру.
+        scan_all=True болса, сыймайтын транзакциялар өткізіліп, кезектің
+        қалғаны да қаралады (жаңа блок үшін); әйтпесе алғашқы сыймағанында тоқтайды.
+        """
+        skipped = []
+        while self.waiting:
+            if self.max_txs is not None and len(self.selected) >= self.max_txs:
+                break
+            if self._fits(self.waiting[0][2]):
+                neg_rate, seq, size, tx = heapq.heappop(self.waiting)
+                self._select(-neg_rate, seq, size, tx)
+            elif scan_all:
+                skipped.append(heapq.heappop(self.waiting))
+            else:
+                break
+        for item in skipped:
+            heapq.heappush(self.waiting, item)
+
+    def add(self, tx):
+        """
+        Жаңа транзакцияны үлгіге қосу. Қайтарады: False — транзакция бос блокқа да
+        сыймайды (max_size-тан үлкен), сондықтан қабылданбайды.
+        Орын жетпесе, ең арзандары ығыстырылады, бірақ тек жаңа транзакцияның
+        комиссиясы ығыстырылғандардың жалпы комиссиясынан көп болғанда ғана.
+        """
+        size = tx_size(tx)
+        if self.max_size is not None and size > self.max_size:
+            return False
+        fee_rate = tx['fee'] / size
+        seq = next(self._seq)
+        if self._fits(size):
+            self._select(fee_rate, seq, size, tx)
+            return True
+        removed = []
+        while self.selected and not self._fits(size):
+            removed.append(self._pop_worst())
+        if tx['fee'] > sum(item[3]['fee'] for item in removed):
+            self._select(fee_rate, seq, size, tx)
+            for fee_rate_old, seq_old, size_old, tx_old in removed:
+                heapq.heappush(self.waiting, (-fee_rate_old, seq_old, size_old, tx_old))
+            self._refill(scan_all=False)
+        else:
+            for item in removed:
+                self._select(*item)
+            heapq.heappush(self.waiting, (-fee_rate, seq, size, tx))
+        return True
+
+    def take(self):
+        """Таңдалған транзакцияларды блокқа беру және үлгіні келесі блокқа дайындау."""
+        chosen = sorted(self.selected, key=lambda item: (-item[0], item[1]))
+        self.selected = []
+        self.selected_size = 0
+        self.selected_fees = 0
+        self._refill()
+        return [tx for _, _, _, tx in chosen]
+
+    def __len__(self):
+        return len(self.selected) + len(self.waiting)
+
+
 class Blockchain:
-    def __init__(self):
+    def __init__(self, max_block_txs=None, max_block_size=None):
         self.chain = []
-        self.transactions = []
-        self.create_block(proof=1, previous_hash='0')  # Генезис блогын құру
         self.reward = 10  # Минерге берілетін жүлде
-        self.commission = 1  # Әр транзакциядан алынатын комиссия
+        self.commission = 1  # Транзакцияда комиссия көрсетілмесе, алынатын комиссия
+        self.template = BlockTemplate(max_block_txs, max_block_size)
+        self.create_block(proof=1, previous_hash='0')  # Генезис блогын құру
 
-    def create_block(self, proof, previous_hash, miner_address):
-        # Транзакция комиссиясын есептеу
-        total_fees = len(self.transactions) * self.commission
-        reward_transaction = {"sender": "network", "recipient": miner_address, "amount": self.reward + total_fees}
-        self.transactions.append(reward_transaction)
+    def create_block(self, proof, previous_hash, miner_address=None):
+        transactions = self.template.take() if miner_address is not None else []
+        if miner_address is not None:
+            # Минер блокқа енген транзакциялардың комиссиясын алады
+            total_fees = sum(tx['fee'] for tx in transactions)
+            reward_transaction = {"sender": "network", "recipient": miner_address, "amount": self.reward + total_fees}
+            transactions.append(reward_transaction)
 
         block = {
             'index': len(self.chain) + 1,
             'timestamp': time.time(),
-            'transactions': self.transactions,
+            'transactions': transactions,
             'proof': proof,
             'previous_hash': previous_hash
         }
-        self.transactions = []
         self.chain.append(block)
         return block
 
-    def add_transaction(self, sender, recipient, amount):
-        self.transactions.append({'sender': sender, 'recipient': recipient, 'amount': amount})
+    def add_transaction(self, sender, recipient, amount, fee=None):
+        if fee is None:
+            fee = self.commission
+        return self.template.add({'sender': sender, 'recipient': recipient, 'amount': amount, 'fee': fee})
 
     def proof_of_work(self, last_proof):
         proof = 0
@@ -46,7 +157,7 @@ class Blockchain:
         return self.chain[-1]
 
 # Минерлердің бәсекелестік сценарийі
-blockchain = Blockchain()
+blockchain = Blockchain(max_block_txs=2)
 miners = ["Alice", "Bob"]
 
 def mining_simulation():
@@ -66,9 +177,10 @@ def mining_simulation():
     new_block = blockchain.create_block(results[winner][0], blockchain.get_last_block()['previous_hash'], winner)
     print(f"Жаңа блок жасалды: {new_block}\n")
 
-# Транзакциялар қосу
+# Транзакциялар қосу (блокқа ең жоғары комиссиялы екеуі ғана енеді)
 blockchain.add_transaction("User1", "User2", 50)
-blockchain.add_transaction("User3", "User4", 20)
+blockchain.add_transaction("User3", "User4", 20, fee=3)
+blockchain.add_transaction("User5", "User6", 5, fee=2)
 
 # Миннингті бастау
 mining_simulation()
@@ -0,0 +1,230 @@
+import hashlib
+import json
+import socket
+import threading
+import time
+import multiprocessing
+from collections import deque
+
+# ===== Майнинг пулының параметрлері =====
+DIFFICULTY = 4            # Блок үшін қиындық (mining.py-дағы valid_proof сияқты "0000")
+SHARE_DIFFICULTY = 3      # Үлес (share) үшін жеңілірек қиындық
+NONCE_SPACE = 1 << 24     # Бір extra-nonce-қа келетін nonce саны
+RANGE_SIZE = 20000        # Бір жұмыс бірлігіндегі nonce ауқымы
+STALL_TIMEOUT = 10.0      # Осы уақытта бітпеген ауқым басқа жұмысшыға беріледі
+
+
+def valid_proof(last_proof, proof, difficulty=DIFFICULTY):
+    """mining.py-дағы Blockchain.valid_proof: sha256(f'{last_proof}{proof}') нөлдерден басталуы тиіс."""
+    guess = f'{last_proof}{proof}'.encode()
+    guess_hash = hashlib.sha256(guess).hexdigest()
+    return guess_hash[:difficulty] == "0" * difficulty
+
+
+def make_proof(extra_nonce, nonce):
+    """extra-nonce мен nonce-тан бүтін proof құрастыру (proof кеңістігі extra-nonce бойынша бөлінеді)."""
+    return extra_nonce * NONCE_SPACE + nonce
+
+
+def send_message(stream, message):
+    stream.write(json.dumps(message) + "\n")
+    stream.flush()
+
+
+class PoolCoordinator:
+    """
+    Жергілікті майнинг пулының үйлестірушісі:
+      - жұмысшыларға жұмыс бірлігін береді (блок үлгісі, extra-nonce және nonce ауқымы),
+      - үлестерді (share) жинап тексереді,
+      - STALL_TIMEOUT ішінде бітпеген ауқымдарды қайта таратады,
+      - әр жұмысшының хэш жылдамдығын есептейді.
+    Жұмысшылармен байланыс: localhost сокеті, бір жолда бір JSON хабарлама.
+    """
+    def __init__(self, template, last_proof, host="127.0.0.1", port=0,
+                 range_size=RANGE_SIZE, stall_timeout=STALL_TIMEOUT):
+        self.template = template
+        self.last_proof = last_proof
+        self.range_size = range_size
+        self.stall_timeout = stall_timeout
+        self.lock = threading.Lock()
+        self.pending = deque()   # Қайта таратылатын ауқымдар
+        self.assigned = {}       # range_id -> (жұмысшы, берілген уақыт, жұмыс бірлігі)
+        self.next_range_id = 0
+        self.extra_nonce = 0
+        self.next_nonce = 0
+        self.workers = {}
+        self.solution = None
+        self.solved = threading.Event()
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind((host, port))
+        self.address = self.server.getsockname()
+
+    def start(self):
+        self.server.listen(16)
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        threading.Thread(target=self._reap_stalled, daemon=True).start()
+
+    def stop(self):
+        self.solved.set()
+        self.server.close()
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle_worker, args=(conn,), daemon=True).start()
+
+    def _new_range(self):
+        """Келесі nonce ауқымын бөлу; кеңістік біткенде extra-nonce арттырылады (үлгі өзгереді)."""
+        if self.next_nonce >= NONCE_SPACE:
+            self.extra_nonce += 1
+            self.next_nonce = 0
+        start = self.next_nonce
+        end = min(start + self.range_size, NONCE_SPACE)
+        self.next_nonce = end
+        return {'extra_nonce': self.extra_nonce, 'start': start, 'end': end}
+
+    def next_unit(self, worker):
+        with self.lock:
+            if self.solved.is_set():
+                return {'type': 'STOP'}
+            nonce_range = self.pending.popleft() if self.pending else self._new_range()
+            range_id = self.next_range_id
+            self.next_range_id += 1
+            unit = dict(nonce_range, type='WORK', range_id=range_id,
+                        last_proof=self.last_proof, template=self.template,
+                        share_difficulty=SHARE_DIFFICULTY)
+            self.assigned[range_id] = (worker, time.time(), nonce_range)
+            return unit
+
+    def _stats(self, worker):
+        return self.workers.setdefault(worker, {'hashes': 0, 'elapsed': 0.0, 'shares': 0, 'ranges': 0})
+
+    def submit_share(self, worker, extra_nonce, nonce):
+        proof = make_proof(extra_nonce, nonce)
+        if not valid_proof(self.last_proof, proof, SHARE_DIFFICULTY):
+            return False
+        with self.lock:
+            self._stats(worker)['shares'] += 1
+            if self.solution is None and valid_proof(self.last_proof, proof):
+                self.solution = {'worker': worker, 'extra_nonce': extra_nonce, 'proof': proof}
+                self.solved.set()
+        return True
+
+    def complete_range(self, worker, range_id, hashes, elapsed):
+        with self.lock:
+            self.assigned.pop(range_id, None)
+            stats = self._stats(worker)
+            stats['hashes'] += hashes
+            stats['elapsed'] += elapsed
+            stats['ranges'] += 1
+
+    def _reap_stalled(self):
+        while not self.solved.is_set():
+            time.sleep(self.stall_timeout / 2)
+            now = time.time()
+            with self.lock:
+                for range_id, (worker, assigned_at, nonce_range) in list(self.assigned.items()):
+                    if now - assigned_at > self.stall_timeout:
+                        del self.assigned[range_id]
+                        self.pending.append(nonce_range)
+                        print(f"Ауқым {range_id} ({worker}) қайта таратылды")
+
+    def _handle_worker(self, conn):
+        stream = conn.makefile("rw")
+        worker = None
+        try:
+            for line in stream:
+                message = json.loads(line)
+                worker = message.get('worker', worker)
+                if message['type'] == 'GET_WORK':
+                    send_message(stream, self.next_unit(worker))
+                elif message['type'] == 'SHARE':
+                    self.submit_share(worker, message['extra_nonce'], message['nonce'])
+                elif message['type'] == 'RANGE_DONE':
+                    self.complete_range(worker, message['range_id'], message['hashes'], message['elapsed'])
+        except (OSError, ValueError):
+            pass
+        finally:
+            conn.close()
+
+    def hashrates(self):
+        """Әр жұмысшының орташа хэш жылдамдығы (хэш/сек)."""
+        with self.lock:
+            return {worker: (stats['hashes'] / stats['elapsed'] if stats['elapsed'] else 0.0)
+                    for worker, stats in self.workers.items()}
+
+    def build_block(self):
+        """Табылған proof бойынша блок құрастыру (coinbase-те extra-nonce сақталады)."""
+        if self.solution is None:
+            return None
+        block = dict(self.template)
+        coinbase = {"sender": "network", "recipient": self.solution['worker'],
+                    "extra_nonce": self.solution['extra_nonce']}
+        block['transactions'] = list(self.template.get('transactions', [])) + [coinbase]
+        block['proof'] = self.solution['proof']
+        return block
+
+
+def worker_main(name, host, port):
+    """Жұмысшы процесс: үйлестірушіден ауқым алып, nonce-тарды тексереді."""
+    conn = socket.create_connection((host, port))
+    stream = conn.makefile("rw")
+    try:
+        while True:
+            send_message(stream, {'type': 'GET_WORK', 'worker': name})
+            line = stream.readline()
+            if not line:
+                return
+            unit = json.loads(line)
+            if unit['type'] == 'STOP':
+                return
+            last_proof = unit['last_proof']
+            share_target = "0" * unit['share_difficulty']
+            base = make_proof(unit['extra_nonce'], 0)
+            start_time = time.time()
+            for nonce in range(unit['start'], unit['end']):
+                digest = hashlib.sha256(f'{last_proof}{base + nonce}'.encode()).hexdigest()
+                if digest[:unit['share_difficulty']] == share_target:
+                    send_message(stream, {'type': 'SHARE', 'worker': name,
+                                          'extra_nonce': unit['extra_nonce'], 'nonce': nonce})
+            send_message(stream, {'type': 'RANGE_DONE', 'worker': name, 'range_id': unit['range_id'],
+                                  'hashes': unit['end'] - unit['start'],
+                                  'elapsed': time.time() - start_time})
+    except OSError:
+        pass
+    finally:
+        conn.close()
+
+
+def run_pool(template, last_proof, workers=4, timeout=120):
+    """Үйлестірушіні және жұмысшы процестерді localhost-та іске қосып, блок табылғанша күту."""
+    coordinator = PoolCoordinator(template, last_proof)
+    coordinator.start()
+    host, port = coordinator.address
+    processes = [multiprocessing.Process(target=worker_main, args=(f"worker-{i}", host, port), daemon=True)
+                 for i in range(workers)]
+    for process in processes:
+        process.start()
+    coordinator.solved.wait(timeout)
+    coordinator.stop()
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+    return coordinator
+
+
+if __name__ == "__main__":
+    template = {'index': 2, 'previous_hash': '0',
+                'transactions': [{'sender': 'User1', 'recipient': 'User2', 'amount': 50, 'fee': 1}]}
+    start_time = time.time()
+    pool = run_pool(template, last_proof=1, workers=4)
+    print(f"Шешім: {pool.solution} ({time.time() - start_time:.2f} сек)")
+    print(f"Блок: {pool.build_block()}")
+    for worker, rate in sorted(pool.hashrates().items()):
+        stats = pool.workers[worker]
+        print(f"{worker}: {rate:,.0f} хэш/сек, үлестер: {stats['shares']}, ауқымдар: {stats['ranges']}")
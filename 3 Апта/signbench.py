@@ -0,0 +1,34 @@
+import time
+import random
+from keygen import generate_rsa_keypair, sign_crt
+
+# ===== Қол қою жылдамдығын салыстыру: толық d дәрежесі мен CRT =====
+# Әмияндардағы Transaction қол қоюы сияқты: signature = (tx_hash mod n)^d mod n.
+
+SIGNATURES = 200  # Әр кілт өлшемі үшін қойылатын қолтаңба саны
+
+
+def bench(bits, count=SIGNATURES):
+    public_key, private_key, crt = generate_rsa_keypair(bits)
+    d, n = private_key
+    messages = [random.getrandbits(32) % n for _ in range(count)]  # simple_hash 32 биттік
+
+    start = time.perf_counter()
+    plain = [pow(m, d, n) for m in messages]
+    plain_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = [sign_crt(m, crt) for m in messages]
+    crt_time = time.perf_counter() - start
+
+    if plain != fast:
+        raise ValueError("CRT қолтаңбасы толық дәрежемен сәйкес емес.")
+    if any(pow(s, public_key[0], n) != m for s, m in zip(fast, messages)):
+        raise ValueError("Қолтаңба ашық кілтпен тексерілмеді.")
+    return plain_time, crt_time
+
+
+for bits in (1024, 2048):
+    plain_time, crt_time = bench(bits)
+    print(f"{bits} бит: pow(m, d, n) {SIGNATURES / plain_time:,.0f} қолт./сек, "
+          f"CRT {SIGNATURES / crt_time:,.0f} қолт./сек, жылдамдау {plain_time / crt_time:.2f}x")
@@ -0,0 +1,351 @@
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# ===== Блокчейннің бинарлық снапшоты =====
+# Файл құрылымы:
+#   тақырып (HEADER) | блоктар (әр блок: тақырып жазбасы, денесі) |
+#   ығысулар кестесі (әр блокқа OFFSET_ENTRY) | баланстар | индекстер
+# Мәндер тегпен кодталады (None/bool/int/float/str), сондықтан адрестер мен
+# хэштер бүтін сан да, жол да бола алады. Жүктеу кезінде файл mmap арқылы
+# ашылады, тақырып пен ығысулар кестесі оқылады, ал блок денелері тек
+# сұралғанда ғана декодталады.
+
+MAGIC = b"BCSNAP01"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQQ")   # magic, нұсқа, блок саны, кесте, баланстар, индекстер
+OFFSET_ENTRY = struct.Struct("<QQI")  # блок тақырыбы, дене ығысуы, дене ұзындығы
+COUNT = struct.Struct("<I")
+POSITION = struct.Struct("<II")       # (биіктік, реті)
+SMALL_INT = struct.Struct("<q")
+FLOAT = struct.Struct("<d")
+LENGTH = struct.Struct("<I")
+
+BLOCK_FIELDS = ('timestamp', 'previous_hash', 'merkle_root', 'hash')
+TX_FIELDS = ('sender', 'receiver', 'amount', 'fee', 'tx_hash', 'signature', 'valid')
+BODY_CACHE_BUDGET = 64 * 1024 * 1024  # Жадта ұсталатын денелердің снапшоттағы байт көлемі
+
+
+class SnapshotError(Exception):
+    """Снапшот файлы бүлінген немесе басқа форматта."""
+
+
+@contextmanager
+def decoding(what):
+    """Кесілген не бүлінген байттардан туған struct/Unicode қателерін SnapshotError-ға айналдыру."""
+    try:
+        yield
+    except (struct.error, UnicodeDecodeError, OverflowError) as error:
+        raise SnapshotError(f"Снапшот бүлінген ({what}): {error}") from error
+
+
+def encode_value(out, value):
+    """Бір мәнді тегімен out (bytearray) соңына жазу."""
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, int):
+        if -(1 << 63) <= value < (1 << 63):
+            out += b"i" + SMALL_INT.pack(value)
+        else:  # RSA қолтаңбалары 64 биттен үлкен
+            data = value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+            out += b"I" + LENGTH.pack(len(data)) + data
+    elif isinstance(value, float):
+        out += b"f" + FLOAT.pack(value)
+    elif isinstance(value, str):
+        data = value.encode()
+        out += b"s" + LENGTH.pack(len(data)) + data
+    else:
+        raise TypeError(f"Снапшотқа жазылмайтын мән: {value!r}")
+
+
+def decode_value(buf, pos):
+    """buf ішіндегі pos орнынан бір мәнді оқу. Қайтарады: (мән, келесі орын)."""
+    tag = buf[pos:pos + 1]
+    pos += 1
+    if tag == b"N":
+        return None, pos
+    if tag == b"T":
+        return True, pos
+    if tag == b"F":
+        return False, pos
+    if tag == b"i":
+        return SMALL_INT.unpack_from(buf, pos)[0], pos + SMALL_INT.size
+    if tag == b"f":
+        return FLOAT.unpack_from(buf, pos)[0], pos + FLOAT.size
+    if tag in (b"I", b"s"):
+        length = LENGTH.unpack_from(buf, pos)[0]
+        pos += LENGTH.size
+        if pos + length > len(buf):
+            raise SnapshotError(f"Мән файл шегінен шығады ({pos} орнында)")
+        data = bytes(buf[pos:pos + length])
+        if tag == b"I":
+            return int.from_bytes(data, "little", signed=True), pos + length
+        return data.decode(), pos + length
+    raise SnapshotError(f"Белгісіз тег {tag!r} ({pos - 1} орнында)")
+
+
+def encode_record(out, values):
+    for value in values:
+        encode_value(out, value)
+
+
+def decode_record(buf, pos, size):
+    values = []
+    for _ in range(size):
+        value, pos = decode_value(buf, pos)
+        values.append(value)
+    return values, pos
+
+
+def encode_snapshot(chain, balances, tx_index, address_index):
+    """
+    Тізбекті, баланстарды және индекстерді снапшот байттарына кодтау.
+    chain — BLOCK_FIELDS атрибуттары мен transactions тізімі бар блоктар.
+    """
+    out = bytearray(HEADER.size)
+    offsets = []
+    for block in chain:
+        header_offset = len(out)
+        encode_record(out, (getattr(block, field) for field in BLOCK_FIELDS))
+        body_offset = len(out)
+        out += COUNT.pack(len(block.transactions))
+        for tx in block.transactions:
+            encode_record(out, (getattr(tx, field) for field in TX_FIELDS))
+        offsets.append((header_offset, body_offset, len(out) - body_offset))
+
+    table_offset = len(out)
+    for entry in offsets:
+        out += OFFSET_ENTRY.pack(*entry)
+
+    balances_offset = len(out)
+    out += COUNT.pack(len(balances))
+    for address, balance in balances.items():
+        encode_record(out, (address, balance))
+
+    index_offset = len(out)
+    out += COUNT.pack(len(tx_index))
+    for tx_hash, position in tx_index.items():
+        encode_value(out, tx_hash)
+        out += POSITION.pack(*position)
+    out += COUNT.pack(len(address_index))
+    for address, positions in address_index.items():
+        encode_value(out, address)
+        out += COUNT.pack(len(positions))
+        for position in positions:
+            out += POSITION.pack(*position)
+
+    HEADER.pack_into(out, 0, MAGIC, VERSION, len(offsets), table_offset, balances_offset, index_offset)
+    return out
+
+
+def write_file(path, data):
+    """Файл алдымен уақытша атпен жазылып, содан кейін атомарлы түрде ауыстырылады."""
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    return len(data)
+
+
+def write_snapshot(path, chain, balances, tx_index, address_index):
+    """Снапшотты path файлына жазу. Қайтарады: байт саны."""
+    return write_file(path, encode_snapshot(chain, balances, tx_index, address_index))
+
+
+class SnapshotReader:
+    """
+    Снапшотты mmap арқылы оқу. Ашу кезінде тек файл тақырыбы тексеріледі;
+    блок тақырыптары, денелері, баланстар мен индекстер сұралғанда декодталады.
+    """
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.file = open(path, "rb")
+        try:
+            self.buf = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Бос файл
+            self.file.close()
+            raise SnapshotError("Снапшот файлы бос.")
+        if len(self.buf) < HEADER.size:
+            self.close()
+            raise SnapshotError("Снапшот файлы тым қысқа.")
+        magic, version, self.block_count, self.table_offset, self.balances_offset, self.index_offset = \
+            HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise SnapshotError("Снапшот форматы танылмады.")
+        try:
+            self.check_layout()
+        except SnapshotError:
+            self.close()
+            raise
+
+    def check_layout(self):
+        """
+        Тақырыптағы ығысулар мен ығысулар кестесін файл ұзындығымен салыстыру:
+        кесілген не бүлінген файл ашу кезінде-ақ SnapshotError береді.
+        """
+        table_end = self.table_offset + self.block_count * OFFSET_ENTRY.size
+        if not (HEADER.size <= self.table_offset <= table_end <= self.balances_offset
+                <= self.index_offset <= len(self.buf) - COUNT.size):
+            raise SnapshotError("Снапшот файлы кесілген немесе бүлінген (ығысулар файл шегінен тыс).")
+        previous_end = HEADER.size
+        for header_offset, body_offset, body_length in \
+                OFFSET_ENTRY.iter_unpack(self.buf[self.table_offset:table_end]):
+            if not (previous_end <= header_offset < body_offset
+                    and body_offset + max(body_length, COUNT.size) <= self.table_offset):
+                raise SnapshotError("Снапшоттың ығысулар кестесі бүлінген.")
+            previous_end = body_offset + body_length
+
+    def entry(self, height):
+        """(тақырып ығысуы, дене ығысуы, дене ұзындығы)."""
+        if not 0 <= height < self.block_count:
+            raise IndexError(height)
+        return OFFSET_ENTRY.unpack_from(self.buf, self.table_offset + height * OFFSET_ENTRY.size)
+
+    def header(self, height):
+        """Блок тақырыбы: BLOCK_FIELDS атауларынан сөздік."""
+        with decoding(f"{height} блок тақырыбы"):
+            values, _ = decode_record(self.buf, self.entry(height)[0], len(BLOCK_FIELDS))
+        return dict(zip(BLOCK_FIELDS, values))
+
+    def headers(self):
+        """Барлық блок тақырыптарын бір өтуде оқу."""
+        return [self.header(height) for height in range(self.block_count)]
+
+    def tx_count(self, height):
+        """Блоктағы транзакциялар саны (дене декодталмайды)."""
+        with decoding(f"{height} блок денесі"):
+            return COUNT.unpack_from(self.buf, self.entry(height)[1])[0]
+
+    def body(self, height):
+        """Блок транзакциялары: TX_FIELDS атауларынан сөздіктер тізімі."""
+        with decoding(f"{height} блок денесі"):
+            pos = self.entry(height)[1]
+            count = COUNT.unpack_from(self.buf, pos)[0]
+            pos += COUNT.size
+            transactions = []
+            for _ in range(count):
+                values, pos = decode_record(self.buf, pos, len(TX_FIELDS))
+                transactions.append(dict(zip(TX_FIELDS, values)))
+            return transactions
+
+    def balances(self):
+        with decoding("баланстар"):
+            pos = self.balances_offset
+            count = COUNT.unpack_from(self.buf, pos)[0]
+            pos += COUNT.size
+            balances = {}
+            for _ in range(count):
+                (address, balance), pos = decode_record(self.buf, pos, 2)
+                balances[address] = balance
+            return balances
+
+    def indexes(self):
+        """Қайтарады: (tx_index, address_index)."""
+        with decoding("индекстер"):
+            return self._indexes()
+
+    def _indexes(self):
+        pos = self.index_offset
+        tx_index = {}
+        count = COUNT.unpack_from(self.buf, pos)[0]
+        pos += COUNT.size
+        for _ in range(count):
+            tx_hash, pos = decode_value(self.buf, pos)
+            tx_index[tx_hash] = POSITION.unpack_from(self.buf, pos)
+            pos += POSITION.size
+        address_index = {}
+        count = COUNT.unpack_from(self.buf, pos)[0]
+        pos += COUNT.size
+        for _ in range(count):
+            address, pos = decode_value(self.buf, pos)
+            length = COUNT.unpack_from(self.buf, pos)[0]
+            pos += COUNT.size
+            end = pos + length * POSITION.size
+            if end > len(self.buf):
+                raise SnapshotError("Адрес индексі файл шегінен шығады.")
+            address_index[address] = list(POSITION.iter_unpack(self.buf[pos:end]))
+            pos = end
+        return tx_index, address_index
+
+    def close(self):
+        if getattr(self, "buf", None) is not None:
+            self.buf.close()
+            self.buf = None
+        self.file.close()
+
+
+class BodyStore:
+    """
+    Блок денелерін снапшоттан талап бойынша жүктеу. Декодталған денелер LRU
+    кэшінде ұсталады, кэш көлемі (снапшоттағы дене байттарымен) budget-тен аспайды.
+    restore — TX_FIELDS сөздігінен транзакция объектісін құратын функция.
+    """
+    def __init__(self, reader, restore, budget=BODY_CACHE_BUDGET):
+        self.reader = reader
+        self.restore = restore
+        self.budget = budget
+        self.cache = OrderedDict()  # биіктік -> (транзакциялар, байт саны)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def tx_count(self, height):
+        with self.lock:
+            return self.reader.tx_count(height)
+
+    def body(self, height):
+        with self.lock:
+            entry = self.cache.get(height)
+            if entry is not None:
+                self.cache.move_to_end(height)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            transactions = [self.restore(fields) for fields in self.reader.body(height)]
+            size = self.reader.entry(height)[2]
+            self.cache[height] = (transactions, size)
+            self.size += size
+            # Ең ұзақ қолданылмаған денелер шығарылады (соңғы жүктелгені қалады)
+            while self.size > self.budget and len(self.cache) > 1:
+                _, (_, evicted) = self.cache.popitem(last=False)
+                self.size -= evicted
+            return transactions
+
+    def replacing(self):
+        """
+        Осы снапшот файлын қайта жазу үшін: файл жабылып, жазылған соң қайта
+        ашылады (Windows-та ашық mmap файлын ауыстыруға болмайды).
+        """
+        return _Reopen(self)
+
+    def close(self):
+        with self.lock:
+            self.reader.close()
+            self.cache.clear()
+            self.size = 0
+
+
+class _Reopen:
+    def __init__(self, store):
+        self.store = store
+
+    def __enter__(self):
+        self.store.lock.acquire()
+        self.store.reader.close()
+
+    def __exit__(self, *exc):
+        try:
+            self.store.reader = SnapshotReader(self.store.reader.path)
+        finally:
+            self.store.lock.release()
@@ -1,460 +1,839 @@
-import time
-import tkinter as tk
-from tkinter import messagebox, filedialog
-import json
-
-# ===== RSA АСИММЕТРИЯЛЫ ҚЫЛУ ФУНКЦИЯЛАРЫ =====
-
-def gcd(a, b):
-    """Екі санның ортақ бөлгішін табу."""
-    while b:
-        a, b = b, a % b
-    return a
-
-def egcd(a, b):
-    """Кеңейтілген Эвклид алгоритмі."""
-    if a == 0:
-        return (b, 0, 1)
-    else:
-        g, y, x = egcd(b % a, a)
-        return (g, x - (b // a) * y, y)
-
-def mod_inverse(a, m):
-    """Модульдік кері элементті табу: a * x ≡ 1 (mod m)."""
-    g, x, _ = egcd(a, m)
-    if g != 1:
-        raise Exception("Модульдік кері элемент жоқ.")
-    return x % m
-
-def is_prime(n):
-    """n санының жай сан екенін тексеру."""
-    if n < 2:
-        return False
-    for i in range(2, int(n ** 0.5) + 1):
-        if n % i == 0:
-            return False
-    return True
-
-def generate_keypair(p, q):
-    """
-    RSA кілт жұбын генерациялау:
-      - p және q: екі жай сан.
-      - n = p * q, phi = (p - 1) * (q - 1)
-      - Ашық кілт үшін e таңдалады (1 < e < phi, gcd(e, phi) = 1).
-      - Жеке кілт d есептеледі: e * d ≡ 1 (mod phi).
-    Ашық кілт: (e, n), жеке кілт: (d, n)
-    """
-    if not (is_prime(p) and is_prime(q)):
-        raise ValueError("p және q жай сандар болуы тиіс.")
-    if p == q:
-        raise ValueError("p және q бір-біріне тең болмауы керек.")
-    
-    n = p * q
-    phi = (p - 1) * (q - 1)
-    
-    e = 65537  # Әдетте қолданылатын e мәні
-    if gcd(e, phi) != 1:
-        e = 3
-        while gcd(e, phi) != 1:
-            e += 2
-    d = mod_inverse(e, phi)
-    return (e, n), (d, n)
-
-# ===== Қарапайым Хэш Функциясы =====
-
-def simple_hash(data):
-    """Қарапайым хэш функциясы."""
-    hash_value = 0
-    prime = 31  # Хэшті тұрақты ету үшін жай сан
-    for i, char in enumerate(data):
-        hash_value += (ord(char) * (i + 1))
-        hash_value = hash_value * prime
-    return hash_value & 0xFFFFFFFF  # 32-бит шектеу
-
-# ===== Wallets (әмияндар) және Аккаунт Адрестері =====
-# Аккаунттың адресі ретінде ашық кілттің хэші пайдаланылады.
-wallets = {}
-
-def create_wallet(name, p, q):
-    """
-    name - пайдаланушы аты,
-    p, q - RSA үшін таңдалған жай сандар.
-    Әмиян құрылып, ашық кілттің хэшінен аккаунт адресі есептеледі.
-    """
-    public_key, private_key = generate_keypair(p, q)
-    address = simple_hash(str(public_key))
-    wallet = {
-        'name': name,
-        'public_key': public_key,
-        'private_key': private_key,
-        'address': address
-    }
-    wallets[address] = wallet
-    return wallet
-
-# Мысал ретінде бірнеше әмиян құрамыз.
-alice_wallet   = create_wallet("Alice", 61, 53)    # n = 3233
-bob_wallet     = create_wallet("Bob", 47, 43)      # n = 2021
-charlie_wallet = create_wallet("Charlie", 59, 53)  # n = 3127
-dave_wallet    = create_wallet("Dave", 61, 59)     # n = 3599
-eve_wallet     = create_wallet("Eve", 67, 61)      # n = 4087
-
-# ===== UTXO Моделі =====
-
-class UTXOModel:
-    """UTXO моделі: Аккаунт баланстарын сақтау."""
-    def __init__(self):
-        self.balances = {}
-    
-    def update_balance(self, sender, receiver, amount, fee):
-        if sender not in self.balances:
-            self.balances[sender] = 100  # Бастапқы баланс
-        if receiver not in self.balances:
-            self.balances[receiver] = 100  # Бастапқы баланс
-        
-        if self.balances[sender] >= amount + fee:
-            self.balances[sender] -= (amount + fee)
-            self.balances[receiver] += amount
-            return True
-        return False
-
-    def get_balance(self, account):
-        return self.balances.get(account, 100)
-    
-    def validate_balances(self):
-        """Барлық аккаунттардың балансы теріс болмауы тиіс."""
-        return all(balance >= 0 for balance in self.balances.values())
-
-# ===== Transaction (Транзакция) Класы =====
-
-class Transaction:
-    """Транзакция құрылымы, сандық қолтаңба қосылған."""
-    def __init__(self, sender, receiver, amount, fee, utxo_model):
-        """
-        sender, receiver - аккаунт адресі (ашық кілттің хэші),
-        amount, fee - сома және комиссия,
-        utxo_model - UTXO моделі арқылы баланс тексеріледі.
-        """
-        self.sender = sender
-        self.receiver = receiver
-        self.amount = amount
-        self.fee = fee
-        # Балансты жаңарту: жеткілікті қаражат болмаса, транзакция жарамсыз деп белгіленеді.
-        self.valid = utxo_model.update_balance(sender, receiver, amount, fee)
-        self.tx_hash = self.calculate_hash()
-        self.signature = None
-        # Егер транзакция жарамды болса және жіберуші әмияны бар болса, жеке кілтпен қолтаңба қойылады.
-        if self.valid and self.sender in wallets:
-            private_key = wallets[self.sender]['private_key']  # (d, n)
-            n = private_key[1]
-            self.signature = pow(self.tx_hash % n, private_key[0], n)
-    
-    def calculate_hash(self):
-        return simple_hash(f"{self.sender}{self.receiver}{self.amount}{self.fee}")
-    
-    def verify_signature(self):
-        """
-        Цифрлық қолтаңбаның жарамдылығын тексеру:
-          - Әмияндағы жіберушінің адресі транзакциядағы sender-мен сәйкес болуы керек.
-          - Қол қойылған деректер (sender, receiver, amount, fee) негізінде есептелген хэш,
-            транзакцияда сақталған tx_hash-ке сәйкес келуі тиіс.
-          - Жіберушінің ашық кілті арқылы қолтаңба ашылып, алынған нәтиже tx_hash-тың n-ге бөлінетін қалдығымен салыстырылады.
-        """
-        if self.signature is None or self.sender not in wallets:
-            return False
-
-        wallet = wallets[self.sender]
-
-        # Әмияндағы адрес sender-мен сәйкестігін тексереміз.
-        if wallet.get("address") != self.sender:
-            return False
-
-        # Транзакция деректерінен қайта хэш есептейміз.
-        data_hash = simple_hash(f"{self.sender}{self.receiver}{self.amount}{self.fee}")
-        if data_hash != self.tx_hash:
-            return False
-
-        public_key = wallet['public_key']  # (e, n)
-        n = public_key[1]
-        decrypted = pow(self.signature, public_key[0], n)
-        return decrypted == (self.tx_hash % n)
-
-# ===== Merkle Tree (Меркле ағашы) =====
-
-class MerkleTree:
-    """Merkle Tree (Меркле ағашы) құрылымы."""
-    def __init__(self, transactions):
-        self.transactions = transactions
-        self.root = self.build_merkle_root()
-    
-    def build_merkle_root(self):
-        """Меркле түбірін есептеу."""
-        if not self.transactions:
-            return "Бос"
-        
-        tx_hashes = [tx.tx_hash for tx in self.transactions]
-        while len(tx_hashes) > 1:
-            if len(tx_hashes) % 2 != 0:
-                tx_hashes.append(tx_hashes[-1])
-            new_level = []
-            for i in range(0, len(tx_hashes), 2):
-                combined_hash = simple_hash(str(tx_hashes[i]) + str(tx_hashes[i + 1]))
-                new_level.append(combined_hash)
-            tx_hashes = new_level
-        return tx_hashes[0]
-
-# ===== Block (Блок) Класы =====
-
-class Block:
-    """Блок құрылымы."""
-    def __init__(self, previous_hash, transactions):
-        self.timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
-        self.previous_hash = previous_hash
-        self.transactions = transactions
-        self.merkle_root = MerkleTree(transactions).root
-        self.hash = self.calculate_hash()
-    
-    def calculate_hash(self):
-        return simple_hash(f"{self.timestamp}{self.previous_hash}{self.merkle_root}{[tx.tx_hash for tx in self.transactions]}")
-
-# ===== Blockchain (Блокчейн) Класы =====
-
-class Blockchain:
-    """Блокчейн құрылымы."""
-    def __init__(self):
-        self.chain = [self.create_genesis_block()]
-    
-    def create_genesis_block(self):
-        return Block("0", [])
-    
-    def add_block(self, transactions):
-        valid_transactions = [tx for tx in transactions if tx.valid and tx.verify_signature()]
-        if not valid_transactions:
-            print("Жарамсыз транзакциялар, блок қосылмады.")
-            return False
-        previous_block = self.chain[-1]
-        new_block = Block(previous_block.hash, valid_transactions)
-        self.chain.append(new_block)
-        return True
-    
-    def is_valid_chain(self):
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i - 1]
-            if current_block.previous_hash != previous_block.hash:
-                return False
-            if current_block.hash != current_block.calculate_hash():
-                return False
-            if MerkleTree(current_block.transactions).root != current_block.merkle_root:
-                return False
-            for tx in current_block.transactions:
-                if not tx.verify_signature():
-                    return False
-        if not utxo_model.validate_balances():
-            return False
-        return True
-
-# ===== Блокчейн мен UTXO Моделін Құру =====
-
-utxo_model = UTXOModel()
-blockchain = Blockchain()
-
-# Алдын ала мысал транзакциялары (блок эксплорерінде көрсетіледі)
-transactions1 = [
-    Transaction(alice_wallet['address'], bob_wallet['address'], 10, 0.1, utxo_model),
-    Transaction(bob_wallet['address'], charlie_wallet['address'], 5, 0.05, utxo_model)
-]
-transactions2 = [
-    Transaction(charlie_wallet['address'], dave_wallet['address'], 15, 0.2, utxo_model),
-    Transaction(alice_wallet['address'], eve_wallet['address'], 200, 0.3, utxo_model)  # Жарамсыз транзакция (қарыз)
-]
-
-blockchain.add_block(transactions1)
-blockchain.add_block(transactions2)
-
-# ===== GUI Интерфейсі =====
-
-root = tk.Tk()
-root.title("Блок Эксплорер және Әмиян")
-
-# Әмиян басқару интерфейсі
-wallet_frame = tk.Frame(root, bd=2, relief="groove")
-wallet_frame.pack(padx=10, pady=10, fill="x")
-
-tk.Label(wallet_frame, text="Әмиян Басқару", font=("Arial", 12, "bold")).grid(row=0, column=0, columnspan=4, pady=5)
-
-# Әмиян құру өрістері
-tk.Label(wallet_frame, text="Аты:").grid(row=1, column=0, sticky="e")
-entry_name = tk.Entry(wallet_frame)
-entry_name.grid(row=1, column=1, padx=5)
-
-tk.Label(wallet_frame, text="p:").grid(row=1, column=2, sticky="e")
-entry_p = tk.Entry(wallet_frame, width=5)
-entry_p.grid(row=1, column=3, padx=5)
-entry_p.insert(0, "61")
-
-tk.Label(wallet_frame, text="q:").grid(row=2, column=0, sticky="e")
-entry_q = tk.Entry(wallet_frame, width=5)
-entry_q.grid(row=2, column=1, padx=5)
-entry_q.insert(0, "53")
-
-def create_wallet_gui():
-    name = entry_name.get()
-    try:
-        p = int(entry_p.get())
-        q = int(entry_q.get())
-    except ValueError:
-        messagebox.showerror("Қате", "p және q бүтін сандар болуы тиіс.")
-        return
-    wallet = create_wallet(name, p, q)
-    messagebox.showinfo("Әмиян құрылды", f"Аты: {wallet['name']}\nАдрес: {wallet['address']}\nАшық кілт: {wallet['public_key']}\nЖеке кілт: {wallet['private_key']}")
-    update_wallet_list()
-
-btn_create_wallet = tk.Button(wallet_frame, text="Әмиян құру", command=create_wallet_gui)
-btn_create_wallet.grid(row=2, column=2, columnspan=2, padx=5, pady=5)
-
-# Әмияндарды көрсету (тізім)
-wallet_listbox = tk.Listbox(wallet_frame, width=80)
-wallet_listbox.grid(row=3, column=0, columnspan=4, pady=5)
-
-def update_wallet_list():
-    wallet_listbox.delete(0, tk.END)
-    for addr, wallet in wallets.items():
-        wallet_listbox.insert(tk.END, f"Адрес: {addr} | Аты: {wallet['name']}")
-
-btn_show_wallets = tk.Button(wallet_frame, text="Әмияндарды жаңарту", command=update_wallet_list)
-btn_show_wallets.grid(row=4, column=0, columnspan=4, pady=5)
-
-def save_wallet():
-    selection = wallet_listbox.curselection()
-    if not selection:
-        messagebox.showerror("Қате", "Сақтау үшін әмиянды таңдаңыз.")
-        return
-    index = selection[0]
-    wallet_info = wallet_listbox.get(index)
-    addr = wallet_info.split("|")[0].split(":")[1].strip()
-    wallet = wallets.get(int(addr))
-    if wallet is None:
-        messagebox.showerror("Қате", "Әмиян табылмады.")
-        return
-    filename = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
-    if filename:
-        with open(filename, "w") as f:
-            json.dump(wallet, f)
-        messagebox.showinfo("Сақталды", f"Әмиян файлға сақталды: {filename}")
-
-def load_wallet():
-    filename = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
-    if filename:
-        with open(filename, "r") as f:
-            wallet = json.load(f)
-        addr = wallet.get("address")
-        if addr:
-            wallets[addr] = wallet
-            update_wallet_list()
-            messagebox.showinfo("Жүктелді", f"Әмиян жүктелді: {wallet.get('name')}")
-        else:
-            messagebox.showerror("Қате", "Әмиян деректері дұрыс емес.")
-
-btn_save_wallet = tk.Button(wallet_frame, text="Суық әмиянды сақтау", command=save_wallet)
-btn_save_wallet.grid(row=5, column=0, columnspan=2, pady=5)
-
-btn_load_wallet = tk.Button(wallet_frame, text="Суық әмиянды жүктеу", command=load_wallet)
-btn_load_wallet.grid(row=5, column=2, columnspan=2, pady=5)
-
-def show_balances():
-    balances = utxo_model.balances
-    if not balances:
-        messagebox.showinfo("Баланстар", "Әзірге баланс деректері жоқ.")
-    else:
-        info = "\n".join([f"Адрес: {addr} => Баланс: {bal}" for addr, bal in balances.items()])
-        messagebox.showinfo("Баланстар", info)
-
-btn_show_balances = tk.Button(wallet_frame, text="Баланстарды көрсету", command=show_balances)
-btn_show_balances.grid(row=6, column=0, columnspan=4, pady=5)
-
-# Транзакция жіберу интерфейсі
-tk.Label(wallet_frame, text="Транзакция жіберу", font=("Arial", 12, "bold")).grid(row=7, column=0, columnspan=4, pady=5)
-
-tk.Label(wallet_frame, text="Жіберуші Адрес:").grid(row=8, column=0, sticky="e")
-entry_sender = tk.Entry(wallet_frame, width=40)
-entry_sender.grid(row=8, column=1, columnspan=3, padx=5, pady=2)
-
-tk.Label(wallet_frame, text="Алушы Адрес:").grid(row=9, column=0, sticky="e")
-entry_receiver = tk.Entry(wallet_frame, width=40)
-entry_receiver.grid(row=9, column=1, columnspan=3, padx=5, pady=2)
-
-tk.Label(wallet_frame, text="Сома:").grid(row=10, column=0, sticky="e")
-entry_amount = tk.Entry(wallet_frame, width=10)
-entry_amount.grid(row=10, column=1, padx=5, pady=2)
-
-tk.Label(wallet_frame, text="Комиссия:").grid(row=10, column=2, sticky="e")
-entry_fee = tk.Entry(wallet_frame, width=10)
-entry_fee.grid(row=10, column=3, padx=5, pady=2)
-
-def send_transaction():
-    sender = entry_sender.get().strip()
-    receiver = entry_receiver.get().strip()
-    try:
-        amount = float(entry_amount.get())
-        fee = float(entry_fee.get())
-    except ValueError:
-        messagebox.showerror("Қате", "Сома және комиссия сандық мән болуы тиіс.")
-        return
-    tx = Transaction(sender, receiver, amount, fee, utxo_model)
-    if not tx.valid:
-        messagebox.showerror("Қате", "Жіберушіде жеткілікті қаражат жоқ немесе транзакция жарамсыз.")
-        return
-    if not tx.verify_signature():
-        messagebox.showerror("Қате", "Қолтаңба жарамсыз.")
-        return
-    if blockchain.add_block([tx]):
-        messagebox.showinfo("Жіберілді", "Транзакция жіберілді және блокқа қосылды.")
-        show_blocks()
-    else:
-        messagebox.showerror("Қате", "Транзакция блокқа қосылмады.")
-
-btn_send_tx = tk.Button(wallet_frame, text="Транзакция жіберу", command=send_transaction)
-btn_send_tx.grid(row=11, column=0, columnspan=4, pady=5)
-
-# Блок эксплорері
-explorer_frame = tk.Frame(root, bd=2, relief="groove")
-explorer_frame.pack(padx=10, pady=10, fill="both", expand=True)
-
-tk.Label(explorer_frame, text="Блок Эксплорер", font=("Arial", 12, "bold")).pack(pady=5)
-
-def show_blocks():
-    for widget in explorer_frame.winfo_children():
-        if isinstance(widget, tk.Label) and widget.cget("fg") != "blue":
-            widget.destroy()
-    for i, block in enumerate(blockchain.chain):
-        validity = "✅ Жарамды" if i == 0 or block.previous_hash == blockchain.chain[i-1].hash else "❌ Жарамсыз"
-        transactions_info = "\n".join([
-            f"Жіберуші: {wallets.get(tx.sender, {}).get('name', tx.sender)} ({tx.sender})\n"
-            f"Алушы: {wallets.get(tx.receiver, {}).get('name', tx.receiver)} ({tx.receiver})\n"
-            f"Сома: {tx.amount}\n"
-            f"Tx Хэш: {tx.tx_hash}\n"
-            f"Сигнатура: {tx.signature} ({'жарамды' if tx.verify_signature() else 'жарамсыз'})"
-            for tx in block.transactions
-        ])
-        block_info = (f"Блок {i}\n"
-                      f"Хэш: {block.hash}\n"
-                      f"Уақыт: {block.timestamp}\n"
-                      f"Меркле түбірі: {block.merkle_root}\n"
-                      f"Транзакциялар:\n{transactions_info}\n"
-                      f"{validity}")
-        tk.Label(explorer_frame, text=block_info, padx=10, pady=10, borderwidth=2, relief="solid", font=("Arial", 10)).pack(pady=5, fill="x")
-
-btn_show_blocks = tk.Button(explorer_frame, text="Блоктарды жаңарту", command=show_blocks)
-btn_show_blocks.pack(pady=5)
-
-def check_validity():
-    if blockchain.is_valid_chain():
-        messagebox.showinfo("Блокчейн дұрыстығы", "✅ Блокчейн жарамды!")
-    else:
-        messagebox.showerror("Блокчейн қатесі", "❌ Блокчейнде қате бар!")
-
-btn_check_validity = tk.Button(explorer_frame, text="Блокчейнді тексеру", command=check_validity)
-btn_check_validity.pack(pady=5)
-
-root.mainloop()
\ No newline at end of file
+import time
+import tkinter as tk
+from tkinter import messagebox, filedialog, ttk
+import json
+import threading
+import queue
+from collections import OrderedDict
+from batchverify import batch_verify, verify_claim, VerifyExecutor
+
+# ===== RSA АСИММЕТРИЯЛЫ ҚЫЛУ ФУНКЦИЯЛАРЫ =====
+
+def gcd(a, b):
+    """Екі санның ортақ бөлгішін табу."""
+    while b:
+        a, b = b, a % b
+    return a
+
+def egcd(a, b):
+    """Кеңейтілген Эвклид алгоритмі."""
+    if a == 0:
+        return (b, 0, 1)
+    else:
+        g, y, x = egcd(b % a, a)
+        return (g, x - (b // a) * y, y)
+
+def mod_inverse(a, m):
+    """Модульдік кері элементті табу: a * x ≡ 1 (mod m)."""
+    g, x, _ = egcd(a, m)
+    if g != 1:
+        raise Exception("Модульдік кері элемент жоқ.")
+    return x % m
+
+def is_prime(n):
+    """n санының жай сан екенін тексеру."""
+    if n < 2:
+        return False
+    for i in range(2, int(n ** 0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+def generate_keypair(p, q):
+    """
+    RSA кілт жұбын генерациялау:
+      - p және q: екі жай сан.
+      - n = p * q, phi = (p - 1) * (q - 1)
+      - Ашық кілт үшін e таңдалады (1 < e < phi, gcd(e, phi) = 1).
+      - Жеке кілт d есептеледі: e * d ≡ 1 (mod phi).
+    Ашық кілт: (e, n), жеке кілт: (d, n)
+    """
+    if not (is_prime(p) and is_prime(q)):
+        raise ValueError("p және q жай сандар болуы тиіс.")
+    if p == q:
+        raise ValueError("p және q бір-біріне тең болмауы керек.")
+    
+    n = p * q
+    phi = (p - 1) * (q - 1)
+    
+    e = 65537  # Әдетте қолданылатын e мәні
+    if gcd(e, phi) != 1:
+        e = 3
+        while gcd(e, phi) != 1:
+            e += 2
+    d = mod_inverse(e, phi)
+    return (e, n), (d, n)
+
+# ===== Қарапайым Хэш Функциясы =====
+
+def simple_hash(data):
+    """Қарапайым хэш функциясы."""
+    hash_value = 0
+    prime = 31  # Хэшті тұрақты ету үшін жай сан
+    for i, char in enumerate(data):
+        hash_value += (ord(char) * (i + 1))
+        hash_value = hash_value * prime
+    return hash_value & 0xFFFFFFFF  # 32-бит шектеу
+
+# ===== Wallets (әмияндар) және Аккаунт Адрестері =====
+# Аккаунттың адресі ретінде ашық кілттің хэші пайдаланылады.
+wallets = {}
+
+def create_wallet(name, p, q):
+    """
+    name - пайдаланушы аты,
+    p, q - RSA үшін таңдалған жай сандар.
+    Әмиян құрылып, ашық кілттің хэшінен аккаунт адресі есептеледі.
+    """
+    public_key, private_key = generate_keypair(p, q)
+    address = simple_hash(str(public_key))
+    wallet = {
+        'name': name,
+        'public_key': public_key,
+        'private_key': private_key,
+        'address': address
+    }
+    wallets[address] = wallet
+    return wallet
+
+# Мысал ретінде бірнеше әмиян құрамыз.
+alice_wallet   = create_wallet("Alice", 61, 53)    # n = 3233
+bob_wallet     = create_wallet("Bob", 47, 43)      # n = 2021
+charlie_wallet = create_wallet("Charlie", 59, 53)  # n = 3127
+dave_wallet    = create_wallet("Dave", 61, 59)     # n = 3599
+eve_wallet     = create_wallet("Eve", 67, 61)      # n = 4087
+
+# ===== Қолтаңбаны тексеру кэші =====
+
+class SignatureCache:
+    """
+    Сәтті тексерілген қолтаңбалардың шектелген LRU кэші.
+    Кілт: (tx_hash, signature, public_key). Қайта тексеру модульдік дәрежеге
+    шығарудың орнына сөздіктен іздеуге айналады.
+    """
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return True
+            return False
+
+    def add(self, key):
+        with self.lock:
+            self.entries[key] = True
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+signature_cache = SignatureCache()
+
+# ===== UTXO Моделі =====
+
+class UTXOModel:
+    """UTXO моделі: Аккаунт баланстарын сақтау."""
+    def __init__(self):
+        self.balances = {}
+    
+    def update_balance(self, sender, receiver, amount, fee):
+        if sender not in self.balances:
+            self.balances[sender] = 100  # Бастапқы баланс
+        if receiver not in self.balances:
+            self.balances[receiver] = 100  # Бастапқы баланс
+        
+        if self.balances[sender] >= amount + fee:
+            self.balances[sender] -= (amount + fee)
+            self.balances[receiver] += amount
+            return True
+        return False
+
+    def get_balance(self, account):
+        return self.balances.get(account, 100)
+    
+    def validate_balances(self):
+        """Барлық аккаунттардың балансы теріс болмауы тиіс."""
+        return all(balance >= 0 for balance in self.balances.values())
+
+# ===== Transaction (Транзакция) Класы =====
+
+class Transaction:
+    """Транзакция құрылымы, сандық қолтаңба қосылған."""
+    def __init__(self, sender, receiver, amount, fee, utxo_model):
+        """
+        sender, receiver - аккаунт адресі (ашық кілттің хэші),
+        amount, fee - сома және комиссия,
+        utxo_model - UTXO моделі арқылы баланс тексеріледі.
+        """
+        self.sender = sender
+        self.receiver = receiver
+        self.amount = amount
+        self.fee = fee
+        # Балансты жаңарту: жеткілікті қаражат болмаса, транзакция жарамсыз деп белгіленеді.
+        self.valid = utxo_model.update_balance(sender, receiver, amount, fee)
+        self.tx_hash = self.calculate_hash()
+        self.signature = None
+        # Егер транзакция жарамды болса және жіберуші әмияны бар болса, жеке кілтпен қолтаңба қойылады.
+        if self.valid and self.sender in wallets:
+            private_key = wallets[self.sender]['private_key']  # (d, n)
+            n = private_key[1]
+            self.signature = pow(self.tx_hash % n, private_key[0], n)
+    
+    def calculate_hash(self):
+        return simple_hash(f"{self.sender}{self.receiver}{self.amount}{self.fee}")
+    
+    def signature_claim(self):
+        """
+        Цифрлық қолтаңбаны тексеруге қажет деректер: (tx_hash, signature, public_key).
+        Алдын ала тексерулер өтпесе, None қайтарылады:
+          - Әмияндағы жіберушінің адресі транзакциядағы sender-мен сәйкес болуы керек.
+          - Қол қойылған деректер (sender, receiver, amount, fee) негізінде есептелген хэш,
+            транзакцияда сақталған tx_hash-ке сәйкес келуі тиіс.
+        """
+        if self.signature is None or self.sender not in wallets:
+            return None
+
+        wallet = wallets[self.sender]
+
+        # Әмияндағы адрес sender-мен сәйкестігін тексереміз.
+        if wallet.get("address") != self.sender:
+            return None
+
+        # Транзакция деректерінен қайта хэш есептейміз.
+        data_hash = simple_hash(f"{self.sender}{self.receiver}{self.amount}{self.fee}")
+        if data_hash != self.tx_hash:
+            return None
+
+        return (self.tx_hash, self.signature, tuple(wallet['public_key']))  # public_key: (e, n)
+
+    def verify_signature(self):
+        """
+        Цифрлық қолтаңбаның жарамдылығын тексеру: жіберушінің ашық кілті арқылы
+        қолтаңба ашылып, алынған нәтиже tx_hash-тың n-ге бөлінетін қалдығымен салыстырылады.
+        """
+        claim = self.signature_claim()
+        if claim is None:
+            return False
+        if claim in signature_cache:
+            return True
+        if not verify_claim(claim):
+            return False
+        signature_cache.add(claim)
+        return True
+
+
+def verify_signatures(transactions, executor=None):
+    """
+    Блоктың барлық транзакциясының қолтаңбасын бірге тексеру.
+    Кэште барлары қайта тексерілмейді, қалғандары batch_verify арқылы
+    бір векторлық өтуде (executor берілсе, параллель) тексеріледі.
+    Нәтиже: bool тізімі.
+    """
+    results = [False] * len(transactions)
+    pending = []
+    for i, tx in enumerate(transactions):
+        claim = tx.signature_claim()
+        if claim is None:
+            continue
+        if claim in signature_cache:
+            results[i] = True
+        else:
+            pending.append((i, claim))
+    claims = [claim for _, claim in pending]
+    verified = executor.verify(claims) if executor is not None else batch_verify(claims)
+    for (i, claim), ok in zip(pending, verified):
+        if ok:
+            signature_cache.add(claim)
+            results[i] = True
+    return results
+
+# ===== Merkle Tree (Меркле ағашы) =====
+
+class MerkleTree:
+    """Merkle Tree (Меркле ағашы) құрылымы."""
+    def __init__(self, transactions):
+        self.transactions = transactions
+        self.root = self.build_merkle_root()
+    
+    def build_merkle_root(self):
+        """Меркле түбірін есептеу."""
+        if not self.transactions:
+            return "Бос"
+        
+        tx_hashes = [tx.tx_hash for tx in self.transactions]
+        while len(tx_hashes) > 1:
+            if len(tx_hashes) % 2 != 0:
+                tx_hashes.append(tx_hashes[-1])
+            new_level = []
+            for i in range(0, len(tx_hashes), 2):
+                combined_hash = simple_hash(str(tx_hashes[i]) + str(tx_hashes[i + 1]))
+                new_level.append(combined_hash)
+            tx_hashes = new_level
+        return tx_hashes[0]
+
+# ===== Block (Блок) Класы =====
+
+class Block:
+    """Блок құрылымы."""
+    def __init__(self, previous_hash, transactions):
+        self.timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        self.previous_hash = previous_hash
+        self.transactions = transactions
+        self.merkle_root = MerkleTree(transactions).root
+        self.hash = self.calculate_hash()
+    
+    def calculate_hash(self):
+        return simple_hash(f"{self.timestamp}{self.previous_hash}{self.merkle_root}{[tx.tx_hash for tx in self.transactions]}")
+
+# ===== Blockchain (Блокчейн) Класы =====
+
+# ===== Тізбекті тексеру кезеңдері =====
+# is_valid_chain әр кезеңге жұмсалған уақытты timings сөздігіне жинайды.
+VALIDATION_STAGES = {
+    'links': "Блок байланыстары",
+    'hashes': "Блок хэштері",
+    'merkle': "Меркле түбірлері",
+    'signatures': "Қолтаңбалар",
+    'balances': "Баланстар",
+}
+
+def timed_check(timings, stage, check):
+    """check() нәтижесін қайтарып, оған кеткен уақытты timings[stage]-ке қосу."""
+    start = time.perf_counter()
+    ok = check()
+    timings[stage] += time.perf_counter() - start
+    return ok
+
+def format_timings(timings):
+    return "\n".join(f"{VALIDATION_STAGES[stage]}: {timings.get(stage, 0.0):.3f} сек"
+                     for stage in VALIDATION_STAGES)
+
+class Blockchain:
+    """
+    Блокчейн құрылымы.
+    verify_executor берілсе (VerifyExecutor), блок қолтаңбалары параллель тексеріледі.
+    """
+    def __init__(self, verify_executor=None):
+        self.verify_executor = verify_executor
+        self.lock = threading.Lock()
+        self.chain = [self.create_genesis_block()]
+        # Іздеу индекстері: tx_hash -> (биіктік, реті), блок хэші -> биіктік,
+        # адрес -> [(биіктік, реті), ...]. add_block кезінде толықтырылады.
+        self.tx_index = {}
+        self.block_index = {}
+        self.address_index = {}
+        self.index_block(0, self.chain[0])
+    
+    def create_genesis_block(self):
+        return Block("0", [])
+    
+    def add_block(self, transactions):
+        candidates = [tx for tx in transactions if tx.valid]
+        verified = verify_signatures(candidates, self.verify_executor)
+        valid_transactions = [tx for tx, ok in zip(candidates, verified) if ok]
+        if not valid_transactions:
+            print("Жарамсыз транзакциялар, блок қосылмады.")
+            return False
+        # Блок тексерілген транзакциялардан құрастырылып, тізбекке атомарлы түрде қосылады.
+        with self.lock:
+            previous_block = self.chain[-1]
+            new_block = Block(previous_block.hash, valid_transactions)
+            self.chain.append(new_block)
+            self.index_block(len(self.chain) - 1, new_block)
+        return True
+
+    def add_block_async(self, transactions):
+        """
+        add_block-ты фондық ағында орындау: шақырушы (мысалы, Tk ағыны) күтпейді.
+        Қайтарады: Future, нәтижесі add_block сияқты True/False.
+        """
+        if self.verify_executor is None:
+            self.verify_executor = VerifyExecutor()
+        return self.verify_executor.submit(self.add_block, transactions)
+    
+    def index_block(self, height, block):
+        """Блокты іздеу индекстеріне қосу."""
+        self.block_index[block.hash] = height
+        for i, tx in enumerate(block.transactions):
+            self.tx_index[tx.tx_hash] = (height, i)
+            self.address_index.setdefault(tx.sender, []).append((height, i))
+            if tx.receiver != tx.sender:
+                self.address_index.setdefault(tx.receiver, []).append((height, i))
+
+    def rebuild_indexes(self):
+        """Тізбек толығымен ауыстырылғанда индекстерді қайта құру."""
+        self.tx_index.clear()
+        self.block_index.clear()
+        self.address_index.clear()
+        for height, block in enumerate(self.chain):
+            self.index_block(height, block)
+
+    def find_block(self, block_hash):
+        """Блок хэші бойынша биіктік немесе None."""
+        return self.block_index.get(block_hash)
+
+    def find_transaction(self, tx_hash):
+        """Транзакция хэші бойынша (биіктік, реті) немесе None."""
+        return self.tx_index.get(tx_hash)
+
+    def find_address(self, address):
+        """Адрес қатысқан транзакциялардың орындары [(биіктік, реті), ...]."""
+        return self.address_index.get(address, [])
+
+    def is_valid_chain(self, progress=None, cancelled=None, timings=None):
+        """
+        Тізбекті тексеру. Қосымша параметрлер (фондық ағында тексеру үшін):
+          - progress(done, total): тексерілген блоктар саны туралы хабар,
+          - cancelled: threading.Event, орнатылса тексеру тоқтап None қайтарады,
+          - timings: әр кезеңге жұмсалған уақыт жазылатын сөздік.
+        """
+        with self.lock:
+            chain = list(self.chain)
+        if timings is None:
+            timings = {}
+        for stage in VALIDATION_STAGES:
+            timings.setdefault(stage, 0.0)
+        total = len(chain) - 1
+        step = max(1, total // 100)  # Кезекті хабарлармен толтырмау үшін ~100 хабар
+        for i in range(1, len(chain)):
+            if cancelled is not None and cancelled.is_set():
+                return None
+            current_block = chain[i]
+            previous_block = chain[i - 1]
+            if not timed_check(timings, 'links', lambda: current_block.previous_hash == previous_block.hash):
+                return False
+            if not timed_check(timings, 'hashes', lambda: current_block.hash == current_block.calculate_hash()):
+                return False
+            if not timed_check(timings, 'merkle',
+                               lambda: MerkleTree(current_block.transactions).root == current_block.merkle_root):
+                return False
+            if not timed_check(timings, 'signatures', lambda: all(verify_signatures(current_block.transactions))):
+                return False
+            if progress is not None and (i % step == 0 or i == total):
+                progress(i, total)
+        if cancelled is not None and cancelled.is_set():
+            return None
+        if not timed_check(timings, 'balances', utxo_model.validate_balances):
+            return False
+        return True
+
+# ===== Блокчейн мен UTXO Моделін Құру =====
+
+utxo_model = UTXOModel()
+verify_executor = VerifyExecutor()
+blockchain = Blockchain(verify_executor)
+
+# Алдын ала мысал транзакциялары (блок эксплорерінде көрсетіледі)
+transactions1 = [
+    Transaction(alice_wallet['address'], bob_wallet['address'], 10, 0.1, utxo_model),
+    Transaction(bob_wallet['address'], charlie_wallet['address'], 5, 0.05, utxo_model)
+]
+transactions2 = [
+    Transaction(charlie_wallet['address'], dave_wallet['address'], 15, 0.2, utxo_model),
+    Transaction(alice_wallet['address'], eve_wallet['address'], 200, 0.3, utxo_model)  # Жарамсыз транзакция (қарыз)
+]
+
+blockchain.add_block(transactions1)
+blockchain.add_block(transactions2)
+
+# ===== GUI Интерфейсі =====
+
+root = tk.Tk()
+root.title("Блок Эксплорер және Әмиян")
+
+# Әмиян басқару интерфейсі
+wallet_frame = tk.Frame(root, bd=2, relief="groove")
+wallet_frame.pack(padx=10, pady=10, fill="x")
+
+tk.Label(wallet_frame, text="Әмиян Басқару", font=("Arial", 12, "bold")).grid(row=0, column=0, columnspan=4, pady=5)
+
+# Әмиян құру өрістері
+tk.Label(wallet_frame, text="Аты:").grid(row=1, column=0, sticky="e")
+entry_name = tk.Entry(wallet_frame)
+entry_name.grid(row=1, column=1, padx=5)
+
+tk.Label(wallet_frame, text="p:").grid(row=1, column=2, sticky="e")
+entry_p = tk.Entry(wallet_frame, width=5)
+entry_p.grid(row=1, column=3, padx=5)
+entry_p.insert(0, "61")
+
+tk.Label(wallet_frame, text="q:").grid(row=2, column=0, sticky="e")
+entry_q = tk.Entry(wallet_frame, width=5)
+entry_q.grid(row=2, column=1, padx=5)
+entry_q.insert(0, "53")
+
+def create_wallet_gui():
+    name = entry_name.get()
+    try:
+        p = int(entry_p.get())
+        q = int(entry_q.get())
+    except ValueError:
+        messagebox.showerror("Қате", "p және q бүтін сандар болуы тиіс.")
+        return
+    wallet = create_wallet(name, p, q)
+    messagebox.showinfo("Әмиян құрылды", f"Аты: {wallet['name']}\nАдрес: {wallet['address']}\nАшық кілт: {wallet['public_key']}\nЖеке кілт: {wallet['private_key']}")
+    update_wallet_list()
+
+btn_create_wallet = tk.Button(wallet_frame, text="Әмиян құру", command=create_wallet_gui)
+btn_create_wallet.grid(row=2, column=2, columnspan=2, padx=5, pady=5)
+
+# Әмияндарды көрсету (тізім)
+wallet_listbox = tk.Listbox(wallet_frame, width=80)
+wallet_listbox.grid(row=3, column=0, columnspan=4, pady=5)
+
+def update_wallet_list():
+    wallet_listbox.delete(0, tk.END)
+    for addr, wallet in wallets.items():
+        wallet_listbox.insert(tk.END, f"Адрес: {addr} | Аты: {wallet['name']}")
+
+btn_show_wallets = tk.Button(wallet_frame, text="Әмияндарды жаңарту", command=update_wallet_list)
+btn_show_wallets.grid(row=4, column=0, columnspan=4, pady=5)
+
+def save_wallet():
+    selection = wallet_listbox.curselection()
+    if not selection:
+        messagebox.showerror("Қате", "Сақтау үшін әмиянды таңдаңыз.")
+        return
+    index = selection[0]
+    wallet_info = wallet_listbox.get(index)
+    addr = wallet_info.split("|")[0].split(":")[1].strip()
+    wallet = wallets.get(int(addr))
+    if wallet is None:
+        messagebox.showerror("Қате", "Әмиян табылмады.")
+        return
+    filename = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
+    if filename:
+        with open(filename, "w") as f:
+            json.dump(wallet, f)
+        messagebox.showinfo("Сақталды", f"Әмиян файлға сақталды: {filename}")
+
+def load_wallet():
+    filename = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
+    if filename:
+        with open(filename, "r") as f:
+            wallet = json.load(f)
+        addr = wallet.get("address")
+        if addr:
+            wallets[addr] = wallet
+            update_wallet_list()
+            messagebox.showinfo("Жүктелді", f"Әмиян жүктелді: {wallet.get('name')}")
+        else:
+            messagebox.showerror("Қате", "Әмиян деректері дұрыс емес.")
+
+btn_save_wallet = tk.Button(wallet_frame, text="Суық әмиянды сақтау", command=save_wallet)
+btn_save_wallet.grid(row=5, column=0, columnspan=2, pady=5)
+
+btn_load_wallet = tk.Button(wallet_frame, text="Суық әмиянды жүктеу", command=load_wallet)
+btn_load_wallet.grid(row=5, column=2, columnspan=2, pady=5)
+
+def show_balances():
+    balances = utxo_model.balances
+    if not balances:
+        messagebox.showinfo("Баланстар", "Әзірге баланс деректері жоқ.")
+    else:
+        info = "\n".join([f"Адрес: {addr} => Баланс: {bal}" for addr, bal in balances.items()])
+        messagebox.showinfo("Баланстар", info)
+
+btn_show_balances = tk.Button(wallet_frame, text="Баланстарды көрсету", command=show_balances)
+btn_show_balances.grid(row=6, column=0, columnspan=4, pady=5)
+
+# Транзакция жіберу интерфейсі
+tk.Label(wallet_frame, text="Транзакция жіберу", font=("Arial", 12, "bold")).grid(row=7, column=0, columnspan=4, pady=5)
+
+tk.Label(wallet_frame, text="Жіберуші Адрес:").grid(row=8, column=0, sticky="e")
+entry_sender = tk.Entry(wallet_frame, width=40)
+entry_sender.grid(row=8, column=1, columnspan=3, padx=5, pady=2)
+
+tk.Label(wallet_frame, text="Алушы Адрес:").grid(row=9, column=0, sticky="e")
+entry_receiver = tk.Entry(wallet_frame, width=40)
+entry_receiver.grid(row=9, column=1, columnspan=3, padx=5, pady=2)
+
+tk.Label(wallet_frame, text="Сома:").grid(row=10, column=0, sticky="e")
+entry_amount = tk.Entry(wallet_frame, width=10)
+entry_amount.grid(row=10, column=1, padx=5, pady=2)
+
+tk.Label(wallet_frame, text="Комиссия:").grid(row=10, column=2, sticky="e")
+entry_fee = tk.Entry(wallet_frame, width=10)
+entry_fee.grid(row=10, column=3, padx=5, pady=2)
+
+def send_transaction():
+    sender = entry_sender.get().strip()
+    receiver = entry_receiver.get().strip()
+    try:
+        amount = float(entry_amount.get())
+        fee = float(entry_fee.get())
+    except ValueError:
+        messagebox.showerror("Қате", "Сома және комиссия сандық мән болуы тиіс.")
+        return
+    tx = Transaction(sender, receiver, amount, fee, utxo_model)
+    if not tx.valid:
+        messagebox.showerror("Қате", "Жіберушіде жеткілікті қаражат жоқ немесе транзакция жарамсыз.")
+        return
+    if not tx.verify_signature():
+        messagebox.showerror("Қате", "Қолтаңба жарамсыз.")
+        return
+    # Блок фондық ағында қосылады, нәтижесі root.after арқылы тексеріледі (терезе қатпайды)
+    btn_send_tx.config(state="disabled")
+    future = blockchain.add_block_async([tx])
+    root.after(BLOCK_POLL_MS, poll_block_future, future)
+
+BLOCK_POLL_MS = 50
+
+def poll_block_future(future):
+    """add_block_async нәтижесін Tk ағынында күту және көрсету."""
+    if not future.done():
+        root.after(BLOCK_POLL_MS, poll_block_future, future)
+        return
+    btn_send_tx.config(state="normal")
+    try:
+        added = future.result()
+    except Exception as e:
+        messagebox.showerror("Қате", f"Блок қосу кезінде қате: {e}")
+        return
+    if added:
+        messagebox.showinfo("Жіберілді", "Транзакция жіберілді және блокқа қосылды.")
+        show_blocks()
+    else:
+        messagebox.showerror("Қате", "Транзакция блокқа қосылмады.")
+
+btn_send_tx = tk.Button(wallet_frame, text="Транзакция жіберу", command=send_transaction)
+btn_send_tx.grid(row=11, column=0, columnspan=4, pady=5)
+
+# Блок эксплорері
+explorer_frame = tk.Frame(root, bd=2, relief="groove")
+explorer_frame.pack(padx=10, pady=10, fill="both", expand=True)
+
+tk.Label(explorer_frame, text="Блок Эксплорер", font=("Arial", 12, "bold")).pack(pady=5)
+
+# Блоктар виртуалданған тізімде көрсетіледі: Treeview-те тек ағымдағы беттің
+# PAGE_SIZE жолы ғана құрылады, сондықтан тізбек ұзындығына қарамастан сызу уақыты тұрақты.
+PAGE_SIZE = 50
+current_page = 0
+
+nav_frame = tk.Frame(explorer_frame)
+nav_frame.pack(fill="x", pady=5)
+
+block_tree = ttk.Treeview(explorer_frame, columns=("height", "hash", "time", "txs", "validity"),
+                          show="headings", height=15)
+for column, title, width in (("height", "Блок", 60), ("hash", "Хэш", 120), ("time", "Уақыт", 150),
+                             ("txs", "Транзакциялар", 100), ("validity", "Күйі", 110)):
+    block_tree.heading(column, text=title)
+    block_tree.column(column, width=width, anchor="w")
+block_tree.pack(fill="both", expand=True)
+
+block_details = tk.Text(explorer_frame, height=10, font=("Arial", 10))
+block_details.pack(fill="x", pady=5)
+
+def page_count():
+    return max(1, (len(blockchain.chain) + PAGE_SIZE - 1) // PAGE_SIZE)
+
+def block_validity(i):
+    block = blockchain.chain[i]
+    return "✅ Жарамды" if i == 0 or block.previous_hash == blockchain.chain[i-1].hash else "❌ Жарамсыз"
+
+def render_page(page):
+    """Тек page бетіндегі блоктарды Treeview-ке жазу."""
+    global current_page
+    current_page = max(0, min(page, page_count() - 1))
+    block_tree.delete(*block_tree.get_children())
+    start = current_page * PAGE_SIZE
+    for i in range(start, min(start + PAGE_SIZE, len(blockchain.chain))):
+        block = blockchain.chain[i]
+        block_tree.insert("", "end", iid=str(i),
+                          values=(i, block.hash, block.timestamp, len(block.transactions), block_validity(i)))
+    page_label.config(text=f"Бет {current_page + 1}/{page_count()}")
+
+def show_blocks():
+    render_page(current_page)
+
+# Іздеу нәтижесінің жазбасы: (биіктік, мәтін). show_block_details оны блок
+# мәліметінің соңына қосады, сондықтан <<TreeviewSelect>> оқиғасы іздеуден
+# кейін өңделіп, мәліметті қайта сызса да, жазба өшпейді.
+search_note = None
+
+def show_block_details(event=None):
+    """Таңдалған блоктың толық мәліметін (транзакцияларымен) көрсету."""
+    selection = block_tree.selection()
+    if not selection:
+        return
+    i = int(selection[0])
+    block = blockchain.chain[i]
+    transactions_info = "\n".join([
+        f"Жіберуші: {wallets.get(tx.sender, {}).get('name', tx.sender)} ({tx.sender})\n"
+        f"Алушы: {wallets.get(tx.receiver, {}).get('name', tx.receiver)} ({tx.receiver})\n"
+        f"Сома: {tx.amount}\n"
+        f"Tx Хэш: {tx.tx_hash}\n"
+        f"Сигнатура: {tx.signature} ({'жарамды' if tx.verify_signature() else 'жарамсыз'})"
+        for tx in block.transactions
+    ])
+    block_info = (f"Блок {i}\n"
+                  f"Хэш: {block.hash}\n"
+                  f"Уақыт: {block.timestamp}\n"
+                  f"Меркле түбірі: {block.merkle_root}\n"
+                  f"Транзакциялар:\n{transactions_info}\n"
+                  f"{block_validity(i)}")
+    if search_note is not None and search_note[0] == i:
+        block_info += search_note[1]
+    block_details.delete("1.0", tk.END)
+    block_details.insert(tk.END, block_info)
+
+block_tree.bind("<<TreeviewSelect>>", show_block_details)
+
+def select_block(height, note=None):
+    """Блок тұрған бетті ашып, оның жолын таңдау. note — мәліметтің соңына қосылатын іздеу нәтижесі."""
+    global search_note
+    search_note = (height, note) if note else None
+    render_page(height // PAGE_SIZE)
+    block_tree.selection_set(str(height))
+    block_tree.see(str(height))
+    show_block_details()  # Жол бұрыннан таңдалған болса, оқиға келмейді
+
+def jump_to_height():
+    try:
+        height = int(entry_height.get())
+    except ValueError:
+        messagebox.showerror("Қате", "Биіктік бүтін сан болуы тиіс.")
+        return
+    if not 0 <= height < len(blockchain.chain):
+        messagebox.showerror("Қате", f"Биіктік 0 мен {len(blockchain.chain) - 1} аралығында болуы тиіс.")
+        return
+    select_block(height)
+
+tk.Button(nav_frame, text="◀", command=lambda: render_page(current_page - 1)).pack(side="left")
+page_label = tk.Label(nav_frame, text="Бет 1/1")
+page_label.pack(side="left", padx=5)
+tk.Button(nav_frame, text="▶", command=lambda: render_page(current_page + 1)).pack(side="left")
+tk.Button(nav_frame, text="Соңғы", command=lambda: render_page(page_count() - 1)).pack(side="left", padx=5)
+tk.Label(nav_frame, text="Биіктік:").pack(side="left", padx=(20, 0))
+entry_height = tk.Entry(nav_frame, width=8)
+entry_height.pack(side="left", padx=5)
+tk.Button(nav_frame, text="Өту", command=jump_to_height).pack(side="left")
+
+SEARCH_LIST_LIMIT = 20  # Адрес бойынша іздегенде көрсетілетін соңғы орындар саны
+
+def search_chain():
+    """Блок хэші, транзакция хэші немесе адрес бойынша индекстен іздеп, жолға өту."""
+    query = entry_search.get().strip()
+    if not query:
+        return
+    keys = [query]
+    try:
+        keys.insert(0, int(query))  # Хэштер мен адрестер бүтін сан ретінде сақталады
+    except ValueError:
+        pass
+    for key in keys:
+        height = blockchain.find_block(key)
+        if height is not None:
+            select_block(height)
+            return
+        position = blockchain.find_transaction(key)
+        if position is not None:
+            select_block(position[0], f"\nІзделген транзакция: блок {position[0]}, №{position[1]}")
+            return
+        positions = blockchain.find_address(key)
+        if positions:
+            listing = ", ".join(f"{height}/{index}" for height, index in positions[-SEARCH_LIST_LIMIT:])
+            select_block(positions[-1][0], f"\nАдрес {key}: {len(positions)} транзакция (блок/№): {listing}")
+            return
+    messagebox.showinfo("Іздеу", f"'{query}' табылмады.")
+
+search_frame = tk.Frame(explorer_frame)
+search_frame.pack(fill="x", pady=5)
+
+tk.Label(search_frame, text="Іздеу (блок/tx хэші, адрес):").pack(side="left")
+entry_search = tk.Entry(search_frame, width=30)
+entry_search.pack(side="left", padx=5)
+tk.Button(search_frame, text="Іздеу", command=search_chain).pack(side="left")
+
+btn_show_blocks = tk.Button(explorer_frame, text="Блоктарды жаңарту", command=show_blocks)
+btn_show_blocks.pack(pady=5)
+
+# Тізбекті тексеру фондық ағында жүреді: прогресс validation_queue арқылы
+# беріліп, root.after көмегімен оқылады, сондықтан терезе қатып қалмайды.
+validation_queue = queue.Queue()
+validation_cancel = None
+VALIDATION_POLL_MS = 100
+
+def validation_worker(cancelled):
+    timings = {}
+    try:
+        result = blockchain.is_valid_chain(
+            progress=lambda done, total: validation_queue.put(("progress", done, total)),
+            cancelled=cancelled, timings=timings)
+        validation_queue.put(("done", result, timings))
+    except Exception as e:
+        validation_queue.put(("error", e, timings))
+
+def check_validity():
+    global validation_cancel
+    if validation_cancel is not None:
+        return  # Тексеру жүріп жатыр
+    validation_cancel = threading.Event()
+    btn_check_validity.config(state="disabled")
+    btn_cancel_validity.config(state="normal")
+    validation_progress.config(value=0)
+    validation_label.config(text="Тексерілуде...")
+    threading.Thread(target=validation_worker, args=(validation_cancel,), daemon=True).start()
+    root.after(VALIDATION_POLL_MS, poll_validation)
+
+def cancel_validity():
+    if validation_cancel is not None:
+        validation_cancel.set()
+        validation_label.config(text="Тоқтатылуда...")
+
+def poll_validation():
+    global validation_cancel
+    finished = None
+    try:
+        while True:
+            message = validation_queue.get_nowait()
+            if message[0] == "progress":
+                _, done, total = message
+                validation_progress.config(value=100 * done / total)
+                validation_label.config(text=f"Тексерілді: {done}/{total} блок")
+            else:
+                finished = message
+    except queue.Empty:
+        pass
+    if finished is None:
+        root.after(VALIDATION_POLL_MS, poll_validation)
+        return
+
+    validation_cancel = None
+    btn_check_validity.config(state="normal")
+    btn_cancel_validity.config(state="disabled")
+    kind, result, timings = finished
+    summary = format_timings(timings)
+    if kind == "error":
+        validation_label.config(text="Тексеру қатемен аяқталды")
+        messagebox.showerror("Блокчейн қатесі", f"Тексеру кезінде қате: {result}\n\n{summary}")
+    elif result is None:
+        validation_label.config(text="Тексеру тоқтатылды")
+        messagebox.showinfo("Блокчейн дұрыстығы", f"Тексеру тоқтатылды.\n\n{summary}")
+    elif result:
+        validation_progress.config(value=100)
+        validation_label.config(text="✅ Блокчейн жарамды")
+        messagebox.showinfo("Блокчейн дұрыстығы", f"✅ Блокчейн жарамды!\n\n{summary}")
+    else:
+        validation_label.config(text="❌ Блокчейнде қате бар")
+        messagebox.showerror("Блокчейн қатесі", f"❌ Блокчейнде қате бар!\n\n{summary}")
+
+validation_frame = tk.Frame(explorer_frame)
+validation_frame.pack(pady=5, fill="x")
+
+btn_check_validity = tk.Button(validation_frame, text="Блокчейнді тексеру", command=check_validity)
+btn_check_validity.pack(side="left", padx=5)
+
+btn_cancel_validity = tk.Button(validation_frame, text="Тоқтату", command=cancel_validity, state="disabled")
+btn_cancel_validity.pack(side="left", padx=5)
+
+validation_progress = ttk.Progressbar(validation_frame, length=200, maximum=100)
+validation_progress.pack(side="left", padx=5)
+
+validation_label = tk.Label(validation_frame, text="")
+validation_label.pack(side="left", padx=5)
+
+root.mainloop()
@@ -0,0 +1,118 @@
+import argparse
+import hashlib
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from keygen import generate_prime, build_keypair, crt_params
+
+# ===== Жүктемелік тест үшін детерминирленген әмияндар генераторы =====
+# Әр әмиянның кілті шебер тұқымнан (master seed) және реттік нөмірден
+# туындатылады: бірдей тұқым әрқашан бірдей әмияндар жиынын береді, ал
+# генерация процестер арасында параллель жүреді.
+
+
+def simple_hash(data):
+    """Қарапайым хэш функциясы (әмиян адресі үшін, amianGUI.py-дағыдай)."""
+    hash_value = 0
+    prime = 31  # Хэшті тұрақты ету үшін жай сан
+    for i, char in enumerate(data):
+        hash_value += (ord(char) * (i + 1))
+        hash_value = hash_value * prime
+    return hash_value & 0xFFFFFFFF  # 32-бит шектеу
+
+
+def derive_rng(master_seed, index):
+    """index-ші әмиянға арналған кездейсоқ сандар генераторы: sha256(seed:index)."""
+    seed = hashlib.sha256(f"{master_seed}:{index}".encode()).digest()
+    return random.Random(int.from_bytes(seed, "big"))
+
+
+def derive_wallet(master_seed, index, bits=512):
+    """Шебер тұқымнан index-ші әмиянды (CRT параметрлерімен) туындату."""
+    rng = derive_rng(master_seed, index)
+    p = generate_prime(bits // 2, rng)
+    q = generate_prime(bits // 2, rng)
+    while q == p:
+        q = generate_prime(bits // 2, rng)
+    public_key, private_key = build_keypair(p, q)
+    return {
+        'name': f"load-{index}",
+        'public_key': public_key,
+        'private_key': private_key,
+        'crt': crt_params(p, q, private_key[0]),
+        'address': simple_hash(str(public_key))
+    }
+
+
+def _derive_range(task):
+    master_seed, start, stop, bits = task
+    return [derive_wallet(master_seed, index, bits) for index in range(start, stop)]
+
+
+def generate_wallets(master_seed, count, bits=512, workers=None, chunk_size=256):
+    """
+    count әмиянды процестер пулында генерациялау. Нәтиженің реті мен
+    мазмұны тек master_seed, count және bits мәндеріне тәуелді.
+    """
+    tasks = [(master_seed, start, min(start + chunk_size, count), bits)
+             for start in range(0, count, chunk_size)]
+    wallets = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in pool.map(_derive_range, tasks):
+            wallets.extend(chunk)
+    return wallets
+
+
+def register_wallets(wallets, registry=None, keystore=None, utxo_model=None, balance=100):
+    """
+    Әмияндарды жаппай тіркеу:
+      - registry: wallets сөздігі (адрес -> әмиян),
+      - keystore: WalletKeystore (бір транзакцияда жазылады),
+      - utxo_model: әр адреске бастапқы balance қаражат беріледі (amianGUI.UTXOModel:
+        set_balance және commit әдістері бар модель).
+    Бірдей адресті (32 биттік хэш қақтығысы) әмияндардың біріншісі ғана тіркеледі.
+    Қайтарады: тіркелген әмияндар тізімі.
+    """
+    unique = {}
+    for wallet in wallets:
+        unique.setdefault(wallet['address'], wallet)
+    registered = list(unique.values())
+    if registry is not None:
+        registry.update(unique)
+    if keystore is not None:
+        keystore.import_wallets(registered)
+    if utxo_model is not None:
+        # set_balance арқылы: өзгерістер баланстар журналына жазылып, оқиғалар жіберіледі
+        for address in unique:
+            utxo_model.set_balance(address, balance)
+        utxo_model.commit()  # Барлық жазба үшін бір fsync (group commit)
+    return registered
+
+
+def fingerprint(wallets):
+    """Әмияндар жиынының қысқа саусақ ізі (қайталанғыштықты тексеру үшін)."""
+    digest = hashlib.sha256()
+    for wallet in wallets:
+        digest.update(f"{wallet['address']}:{wallet['public_key']}".encode())
+    return digest.hexdigest()[:16]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Детерминирленген әмияндар генераторы")
+    parser.add_argument("--seed", default="load-test")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--bits", type=int, default=512)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--keystore", help="Әмияндарды жазатын SQLite файлы")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    wallets = generate_wallets(args.seed, args.count, args.bits, args.workers)
+    duration = time.time() - start_time
+    keystore = None
+    if args.keystore:
+        from keystore import WalletKeystore
+        keystore = WalletKeystore(args.keystore)
+    registered = register_wallets(wallets, keystore=keystore)
+    print(f"{len(wallets)} әмиян ({args.bits} бит) {duration:.2f} сек ішінде генерацияланды, "
+          f"бірегей адрестер: {len(registered)}, саусақ ізі: {fingerprint(wallets)}")
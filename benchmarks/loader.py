@@ -0,0 +1,23 @@
+import os
+import sys
+
+# Скрипты репозитория при импорте сразу строят GUI или запускают узел сети,
+# поэтому бенчмарки выполняют только их начало — до указанной строки-маркера.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_script(relative_path, marker):
+    """Выполнить скрипт до строки marker и вернуть его пространство имён."""
+    path = os.path.join(ROOT, relative_path)
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    end = source.find(marker)
+    if end < 0:
+        raise ValueError(f"В {relative_path} не найден маркер {marker!r}")
+    directory = os.path.dirname(path)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)  # Соседние модули (batchverify, keygen, ...)
+    namespace = {'__name__': "bench_" + os.path.splitext(os.path.basename(path))[0], '__file__': path}
+    exec(compile(source[:end], path, "exec"), namespace)
+    return namespace
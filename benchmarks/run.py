@@ -0,0 +1,212 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+from loader import ROOT, load_script
+
+sys.path.insert(0, ROOT)
+from percentiles import percentile  # Общий модуль в корне репозитория
+
+# Набор бенчмарков основных структур: хэш, дерево Меркле, хэш блока, проверка
+# цепочки, обновление балансов, баланс узла и RSA-подпись. Синтетическая
+# цепочка строится заданного размера, результаты выводятся в JSON
+# (пропускная способность и перцентили), чтобы сравнивать версии между собой:
+#   python benchmarks/run.py --blocks 500 --output new.json --compare old.json
+
+CORE_SCRIPT = os.path.join("3 Апта", "validasia2.py")
+CORE_MARKER = "# ===== Блокчейн мен UTXO Моделін Құру ====="
+NODE_SCRIPT = "blokkuru.py"
+NODE_MARKER = "# Создание первого блока"
+
+
+def measure(fn, iterations, batch=1, setup=None, items=None):
+    """
+    Вызвать fn batch раз в каждой из iterations итераций.
+    Время одной операции = время итерации / batch (для дешёвых операций
+    пакет скрывает накладные расходы таймера). items — сколько элементов
+    (блоков, транзакций) обрабатывает одна операция, для items_per_sec.
+    """
+    samples = []
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        start = time.perf_counter_ns()
+        for _ in range(batch):
+            fn()
+        samples.append((time.perf_counter_ns() - start) / batch / 1000)  # мкс
+    samples.sort()
+    mean = sum(samples) / len(samples)
+    result = {
+        'ops': iterations * batch,
+        'ops_per_sec': round(1e6 / mean, 2) if mean else None,
+        'mean_us': round(mean, 3),
+        'p50_us': round(percentile(samples, 0.50), 3),
+        'p90_us': round(percentile(samples, 0.90), 3),
+        'p99_us': round(percentile(samples, 0.99), 3),
+        'min_us': round(samples[0], 3),
+        'max_us': round(samples[-1], 3),
+    }
+    if items:
+        result['items_per_sec'] = round(items * 1e6 / mean, 2) if mean else None
+    return result
+
+
+# Функция построения синтетической цепочки на демо-кошельках validasia2.py
+def build_core_chain(core, blocks, txs_per_block, rng):
+    utxo_model = core['UTXOModel']()
+    core['utxo_model'] = utxo_model  # is_valid_chain обращается к глобальной модели
+    blockchain = core['Blockchain']()
+    addresses = list(core['wallets'])
+    for _ in range(blocks):
+        transactions = []
+        for _ in range(txs_per_block):
+            sender, receiver = rng.sample(addresses, 2)
+            amount = rng.randint(1, 1000) / 100000  # Балансов хватает на любой размер цепочки
+            transactions.append(core['Transaction'](sender, receiver, amount, 0, utxo_model))
+        blockchain.add_block(transactions)
+    return blockchain
+
+
+# Функция построения цепочки узла: балансы заполняются тем же apply_block, что и при приёме блоков
+def build_node_chain(node, blocks, txs_per_block, accounts, rng):
+    names = [f"addr{i}" for i in range(accounts)]
+    chain = node['blockchain']
+    del chain[:]
+    node['balances'].clear()
+    previous_hash = "0"
+    for index in range(blocks + 1):
+        transactions = [] if index == 0 else [
+            {'from': rng.choice(names), 'to': rng.choice(names), 'amount': rng.randint(1, 100)}
+            for _ in range(txs_per_block)]
+        block = node['create_block'](previous_hash, transactions, index)
+        chain.append(block)
+        node['undo_records'][block['hash']] = node['apply_block'](block)
+        previous_hash = block['hash']
+    return names
+
+
+def run_suite(args):
+    rng = random.Random(args.seed)
+    results = {}
+
+    core = load_script(CORE_SCRIPT, CORE_MARKER)
+    blockchain = build_core_chain(core, args.blocks, args.txs_per_block, rng)
+    chain = blockchain.chain
+    transactions = [tx for block in chain for tx in block.transactions]
+    if not blockchain.is_valid_chain():
+        raise ValueError("Синтетическая цепочка не прошла проверку: бенчмарк измерял бы ранний выход")
+
+    strings = [f"{tx.sender}{tx.receiver}{tx.amount}{tx.fee}" for tx in transactions[:1000]]
+    inputs = itertools.cycle(strings)
+    results['simple_hash'] = measure(lambda: core['simple_hash'](next(inputs)),
+                                     args.iterations, batch=100)
+
+    trees = itertools.cycle([core['MerkleTree'](block.transactions) for block in chain[1:]])
+    results['merkle_root'] = measure(lambda: next(trees).build_merkle_root(),
+                                     args.iterations, items=args.txs_per_block)
+
+    block_cycle = itertools.cycle(chain)
+    results['block_hash'] = measure(lambda: next(block_cycle).calculate_hash(), args.iterations, batch=10)
+
+    # Кэш подписей очищается перед каждым прогоном: меряем полную проверку
+    results['is_valid_chain'] = measure(blockchain.is_valid_chain, args.repeat,
+                                        setup=core['signature_cache'].entries.clear, items=len(chain))
+
+    utxo_model = core['UTXOModel']()
+    addresses = list(core['wallets'])
+    pairs = itertools.cycle([tuple(rng.sample(addresses, 2)) for _ in range(1000)])
+
+    def update_balance():
+        sender, receiver = next(pairs)
+        utxo_model.update_balance(sender, receiver, 0.00001, 0)
+    results['update_balance'] = measure(update_balance, args.iterations, batch=100)
+
+    node = load_script(NODE_SCRIPT, NODE_MARKER)
+    names = build_node_chain(node, args.blocks, args.txs_per_block, args.accounts, rng)
+    lookups = itertools.cycle(names)
+    results['node_get_balance'] = measure(lambda: node['get_balance'](next(lookups)), args.iterations, batch=100)
+
+    from keygen import generate_rsa_keypair, sign_crt
+    for bits in args.rsa_bits:
+        (e, n), (d, _), crt = generate_rsa_keypair(bits, random.Random(args.seed + bits))
+        messages = itertools.cycle([rng.getrandbits(32) % n for _ in range(100)])
+        signatures = itertools.cycle([(m, sign_crt(m, crt)) for m in [rng.getrandbits(32) % n for _ in range(100)]])
+        results[f'rsa_sign_{bits}'] = measure(lambda: pow(next(messages), d, n), args.rsa_iterations)
+        results[f'rsa_sign_crt_{bits}'] = measure(lambda: sign_crt(next(messages), crt), args.rsa_iterations)
+
+        def verify():
+            message, signature = next(signatures)
+            return pow(signature, e, n) == message
+        results[f'rsa_verify_{bits}'] = measure(verify, args.rsa_iterations)
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path, threshold):
+    """Сравнить пропускную способность с прошлым отчётом. Возвращает список регрессий."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)['results']
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if not old or not old.get('ops_per_sec') or not result.get('ops_per_sec'):
+            continue
+        ratio = result['ops_per_sec'] / old['ops_per_sec']
+        marker = ""
+        if ratio < 1 - threshold:
+            marker = "  <-- регрессия"
+            regressions.append(name)
+        print(f"{name:24} {old['ops_per_sec']:>14,.1f} -> {result['ops_per_sec']:>14,.1f} ops/s  x{ratio:.2f}{marker}",
+              file=sys.stderr)
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Бенчмарки основных структур блокчейна")
+    parser.add_argument("--blocks", type=int, default=200, help="Размер синтетической цепочки")
+    parser.add_argument("--txs-per-block", type=int, default=20)
+    parser.add_argument("--accounts", type=int, default=1000, help="Число адресов в цепочке узла")
+    parser.add_argument("--iterations", type=int, default=200, help="Итераций для микробенчмарков")
+    parser.add_argument("--repeat", type=int, default=5, help="Прогонов is_valid_chain")
+    parser.add_argument("--rsa-bits", type=int, nargs="+", default=[1024, 2048])
+    parser.add_argument("--rsa-iterations", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Файл для JSON-отчёта (по умолчанию stdout)")
+    parser.add_argument("--compare", help="JSON-отчёт прошлой версии для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Допустимое падение пропускной способности")
+    args = parser.parse_args()
+
+    started = time.time()
+    results = run_suite(args)
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'duration_sec': round(time.time() - started, 2),
+            'params': {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        },
+        'results': results,
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
@@ -1,6 +1,6 @@
 import time
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 
 def simple_hash(data):
     """
@@ -66,19 +66,53 @@ blockchain.add_block("Үшінші блок")
 blockchain.add_block("Төртінші блок")
 
 # === GUI Интерфейсі ===
+# Блоктар виртуалданған тізімде көрсетіледі: Treeview-те тек ағымдағы беттің
+# PAGE_SIZE жолы ғана құрылады, сондықтан тізбек ұзындығына қарамастан сызу уақыты тұрақты.
+PAGE_SIZE = 50
+current_page = 0
+
+def page_count():
+    return max(1, (len(blockchain.chain) + PAGE_SIZE - 1) // PAGE_SIZE)
+
+def block_validity(i):
+    block = blockchain.chain[i]
+    return "✅ Жарамды" if i == 0 or block.previous_hash == blockchain.chain[i - 1].hash else "❌ Жарамсыз"
+
+def render_page(page):
+    """
+    Тек page бетіндегі блоктарды Treeview-ке жазу.
+    """
+    global current_page
+    current_page = max(0, min(page, page_count() - 1))
+    block_tree.delete(*block_tree.get_children())
+    start = current_page * PAGE_SIZE
+    for i in range(start, min(start + PAGE_SIZE, len(blockchain.chain))):
+        block = blockchain.chain[i]
+        block_tree.insert("", "end", iid=str(i),
+                          values=(i, block.hash, block.timestamp, block.data, block_validity(i)))
+    page_label.config(text=f"Бет {current_page + 1}/{page_count()}")
+
 def show_blocks():
     """
-    Блоктарды GUI-да көрсету.
+    Блоктарды GUI-да көрсету (ағымдағы бет).
     """
-    for widget in frame.winfo_children():
-        widget.destroy()
+    render_page(current_page)
 
-    for i, block in enumerate(blockchain.chain):
-        validity = "✅ Жарамды" if i == 0 or block.previous_hash == blockchain.chain[i - 1].hash else "❌ Жарамсыз"
-        block_info = f"Блок {i}\nХэш: {block.hash}\nУақыт: {block.timestamp}\nДеректер: {block.data}\n{validity}"
-        
-        label = tk.Label(frame, text=block_info, padx=10, pady=10, borderwidth=2, relief="solid")
-        label.pack(pady=5, fill="x")
+def jump_to_height():
+    """
+    Берілген биіктіктегі блокқа өту.
+    """
+    try:
+        height = int(entry_height.get())
+    except ValueError:
+        messagebox.showerror("Қате", "Биіктік бүтін сан болуы тиіс.")
+        return
+    if not 0 <= height < len(blockchain.chain):
+        messagebox.showerror("Қате", f"Биіктік 0 мен {len(blockchain.chain) - 1} аралығында болуы тиіс.")
+        return
+    render_page(height // PAGE_SIZE)
+    block_tree.selection_set(str(height))
+    block_tree.see(str(height))
 
 def check_validity():
     """
@@ -94,7 +128,27 @@ root = tk.Tk()
 root.title("Блок Эксплорер")
 
 frame = tk.Frame(root)
-frame.pack(padx=10, pady=10)
+frame.pack(padx=10, pady=10, fill="both", expand=True)
+
+nav_frame = tk.Frame(frame)
+nav_frame.pack(fill="x", pady=5)
+
+tk.Button(nav_frame, text="◀", command=lambda: render_page(current_page - 1)).pack(side="left")
+page_label = tk.Label(nav_frame, text="Бет 1/1")
+page_label.pack(side="left", padx=5)
+tk.Button(nav_frame, text="▶", command=lambda: render_page(current_page + 1)).pack(side="left")
+tk.Button(nav_frame, text="Соңғы", command=lambda: render_page(page_count() - 1)).pack(side="left", padx=5)
+tk.Label(nav_frame, text="Биіктік:").pack(side="left", padx=(20, 0))
+entry_height = tk.Entry(nav_frame, width=8)
+entry_height.pack(side="left", padx=5)
+tk.Button(nav_frame, text="Өту", command=jump_to_height).pack(side="left")
+
+block_tree = ttk.Treeview(frame, columns=("height", "hash", "time", "data", "validity"), show="headings", height=15)
+for column, title, width in (("height", "Блок", 60), ("hash", "Хэш", 120), ("time", "Уақыт", 150),
+                             ("data", "Деректер", 200), ("validity", "Күйі", 110)):
+    block_tree.heading(column, text=title)
+    block_tree.column(column, width=width, anchor="w")
+block_tree.pack(fill="both", expand=True)
 
 show_blocks_button = tk.Button(root, text="Блоктарды көрсету", command=show_blocks)
 show_blocks_button.pack(pady=5)
@@ -2,62 +2,342 @@ import socket
 import threading
 import json
 import time
+import hashlib
+import signal
+from nodemetrics import NodeMetrics, start_metrics_server, METRICS_PORT
+from nodeprofiler import NodeProfiler, parse_duration
 
 # Глобальная переменная для хранения блокчейна
-blockchain = []
+blockchain = []  # Активная (самая тяжёлая) ветка: от генезиса до вершины
 peers = set()
 wallets = {}
+mempool = []  # Транзакции, ожидающие включения в блок
+chain_lock = threading.Lock()
 
-# Функция создания нового блока узлом-майнером
-def create_block(prev_hash, transactions):
+# Дерево блоков: все известные блоки по хэшу, включая боковые ветки
+blocks = {}
+total_work = {}     # хэш -> суммарная работа от генезиса до блока
+orphans = {}        # previous_hash -> блоки, чей родитель ещё не получен
+undo_records = {}   # хэш -> [(адрес, баланс до блока), ...] для блоков активной ветки
+balances = {}       # Балансы по активной ветке
+
+# Метрики узла (Prometheus): /metrics на localhost:METRICS_PORT
+MAX_PEER_LABELS = 32  # Узлы сверх этого числа попадают в метриках под метку peer="other"
+MESSAGE_TYPES = {'BLOCK', 'PEER', 'TRANSACTION', 'BALANCE_REQUEST', 'BLOCKCHAIN_REQUEST', 'PROFILE'}
+metrics = NodeMetrics()
+metrics.describe('node_messages_total', "Обработанные сообщения по типам")
+metrics.describe('node_message_errors_total', "Сообщения, обработка которых завершилась исключением")
+metrics.describe('node_handler_seconds', "Время обработки сообщения в handle_client")
+metrics.describe('node_broadcast_total', "Отправки broadcast по узлам (сверх MAX_PEER_LABELS — peer=\"other\") и результату")
+metrics.describe('node_blocks_received_total', "Полученные от сети блоки по результату (accepted — сменилась вершина)")
+metrics.describe('node_blocks_mined_total', "Блоки, найденные собственным майнером")
+metrics.describe('node_reorgs_total', "Переключения на другую ветку")
+metrics.gauge('node_chain_height', "Высота активной ветки", lambda: len(blockchain) - 1)
+metrics.gauge('node_mempool_depth', "Транзакции в мемпуле", lambda: len(mempool))
+metrics.gauge('node_peers', "Известные узлы", lambda: len(peers))
+metrics.gauge('node_orphan_blocks', "Блоки, ожидающие родителя", lambda: sum(len(w) for w in list(orphans.values())))
+
+# Профилирование по требованию: SIGUSR1 или сообщение PROFILE с localhost
+profiler = NodeProfiler()
+
+DIFFICULTY = 4  # Количество нулей в начале хэша (как в valid_proof из mining.py)
+BLOCK_WORK = 16 ** DIFFICULTY  # Ожидаемое число хэшей на блок при текущей сложности
+ABORT_CHECK_INTERVAL = 1024  # Как часто майнер проверяет появление нового блока
+MAX_ORPHANS = 100  # Сколько блоков без родителя держим в памяти
+
+# Результаты add_block: вершина активной ветки сменилась / блок сохранён на боковой
+# ветке / ждёт родителя / отклонён. Майнер перезапускается и блок пересылается
+# дальше только при смене вершины
+BLOCK_ACCEPTED = 'accepted'
+BLOCK_SIDE_BRANCH = 'side_branch'
+BLOCK_ORPHAN = 'orphan'
+BLOCK_REJECTED = 'rejected'
+
+# Функция вычисления хэша блока (SHA-256 по заголовку и nonce)
+def block_header(block):
+    return (f"{block['index']}{block['timestamp']}{block['previous_hash']}"
+            f"{json.dumps(block['transactions'], sort_keys=True)}")
+
+def calculate_hash(block):
+    return hashlib.sha256(f"{block_header(block)}{block['nonce']}".encode()).hexdigest()
+
+# Функция проверки доказательства работы
+def valid_proof(block):
+    return block['hash'][:DIFFICULTY] == "0" * DIFFICULTY and block['hash'] == calculate_hash(block)
+
+# Функция создания нового блока узлом-майнером (nonce подбирает майнер)
+def create_block(prev_hash, transactions, index=0):
     block = {
+        'index': index,
         'timestamp': time.time(),
         'previous_hash': prev_hash,
         'transactions': transactions,
-        'hash': hash(str(prev_hash) + str(transactions) + str(time.time()))
+        'nonce': 0
     }
+    block['hash'] = calculate_hash(block)
     return block
 
-# Функция добавления блока в цепочку
+# Функция проверки транзакции: адреса — строки, сумма — целое число.
+# Блок из сети проверяется до того, как он попадёт в дерево или изменит балансы
+def valid_transaction(tx):
+    return (isinstance(tx, dict) and isinstance(tx.get('from'), str) and isinstance(tx.get('to'), str)
+            and type(tx.get('amount')) is int)
+
+def valid_transactions(block):
+    return isinstance(block.get('transactions'), list) and all(map(valid_transaction, block['transactions']))
+
+# Функция применения блока к балансам: возвращает запись для отката.
+# Если применение прервалось, уже изменённые балансы возвращаются назад
+def apply_block(block):
+    undo = []
+    seen = set()
+    try:
+        for tx in block['transactions']:
+            for address in (tx['from'], tx['to']):
+                if address not in seen:
+                    seen.add(address)
+                    undo.append((address, balances.get(address)))
+            balances[tx['from']] = balances.get(tx['from'], 0) - tx['amount']
+            balances[tx['to']] = balances.get(tx['to'], 0) + tx['amount']
+    except Exception:
+        restore_balances(undo)
+        raise
+    return undo
+
+def restore_balances(undo):
+    for address, balance in reversed(undo):
+        if balance is None:
+            balances.pop(address, None)
+        else:
+            balances[address] = balance
+
+# Функция отката блока: балансы возвращаются к состоянию до блока
+def undo_block(block):
+    restore_balances(undo_records.pop(block['hash']))
+
+# Функция проверки, что блок лежит на активной ветке
+def on_active_chain(block):
+    index = block['index']
+    return index < len(blockchain) and blockchain[index]['hash'] == block['hash']
+
+# Функция переключения на ветку с вершиной new_tip.
+# Откатываются и применяются только блоки выше точки разветвления: O(глубина).
+# Переключение атомарно: если блок новой ветки не применился, возвращается прежняя ветка
+def reorganize(new_tip):
+    branch = []
+    block = new_tip
+    while not on_active_chain(block):
+        branch.append(block)
+        block = blocks[block['previous_hash']]
+    fork_index = block['index']
+
+    detached = blockchain[fork_index + 1:]
+    for old in reversed(detached):
+        undo_block(old)
+    del blockchain[fork_index + 1:]
+
+    try:
+        for new in reversed(branch):
+            undo_records[new['hash']] = apply_block(new)
+            blockchain.append(new)
+    except Exception:
+        for new in reversed(blockchain[fork_index + 1:]):
+            undo_block(new)
+        del blockchain[fork_index + 1:]
+        for old in detached:
+            undo_records[old['hash']] = apply_block(old)
+            blockchain.append(old)
+        raise
+
+    attached = set()
+    for new in branch:
+        attached.update(json.dumps(tx, sort_keys=True) for tx in new['transactions'])
+
+    # Транзакции из отброшенных блоков возвращаются в мемпул, если их нет в новой ветке.
+    # У транзакций нет идентификатора, они сравниваются по содержимому: два одинаковых
+    # перевода считаются одной транзакцией и в мемпул возвращается только один из них
+    for old in detached:
+        for tx in old['transactions']:
+            if json.dumps(tx, sort_keys=True) not in attached and tx not in mempool:
+                mempool.append(tx)
+    mempool[:] = [tx for tx in mempool if json.dumps(tx, sort_keys=True) not in attached]
+    if detached:
+        metrics.inc('node_reorgs_total')
+        print(f"Реорганизация: откатано {len(detached)}, применено {len(branch)} блоков")
+
+# Функция подключения блока к дереву (родитель уже известен)
+def connect_block(block):
+    parent = blocks[block['previous_hash']]
+    if block['index'] != parent['index'] + 1:
+        return False
+    blocks[block['hash']] = block
+    total_work[block['hash']] = total_work[parent['hash']] + BLOCK_WORK
+    # Выбор ветки по суммарной работе; при равенстве остаёмся на текущей
+    if total_work[block['hash']] > total_work[blockchain[-1]['hash']]:
+        try:
+            reorganize(block)
+        except Exception:
+            # Ветка осталась прежней; блок, который не удалось применить, забываем
+            del blocks[block['hash']]
+            del total_work[block['hash']]
+            raise
+    return True
+
+# Функция добавления блока в дерево блоков: возвращает один из BLOCK_*
 def add_block(block):
-    if len(blockchain) == 0 or blockchain[-1]['hash'] == block['previous_hash']:
-        blockchain.append(block)
-        return True
-    return False
+    with chain_lock:
+        if len(blockchain) == 0:
+            blockchain.append(block)
+            blocks[block['hash']] = block
+            total_work[block['hash']] = 0
+            undo_records[block['hash']] = apply_block(block)
+            return BLOCK_ACCEPTED
+        if block['hash'] in blocks or not valid_proof(block) or not valid_transactions(block):
+            return BLOCK_REJECTED
+        if block['previous_hash'] not in blocks:
+            # Родитель ещё не дошёл (гонка распространения): откладываем блок
+            orphans.setdefault(block['previous_hash'], []).append(block)
+            while sum(len(waiting) for waiting in orphans.values()) > MAX_ORPHANS:
+                oldest = next(iter(orphans))
+                orphans[oldest].pop(0)
+                if not orphans[oldest]:
+                    del orphans[oldest]
+            return BLOCK_ORPHAN
+        tip = blockchain[-1]['hash']
+        if not connect_block(block):
+            return BLOCK_REJECTED
+        # Подключаем блоки, ожидавшие этого блока как родителя
+        pending = [block['hash']]
+        while pending:
+            for child in orphans.pop(pending.pop(), []):
+                if child['hash'] not in blocks and connect_block(child):
+                    pending.append(child['hash'])
+        return BLOCK_ACCEPTED if blockchain[-1]['hash'] != tip else BLOCK_SIDE_BRANCH
+
+# Фоновый майнер: ищет nonce для блока на текущей вершине цепочки
+class MiningWorker(threading.Thread):
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.work_available = threading.Event()  # В мемпуле есть транзакции
+        self.new_tip = threading.Event()  # Вершина цепочки сменилась, текущая работа устарела
+
+    def notify_transactions(self):
+        self.work_available.set()
+
+    def notify_new_tip(self):
+        self.new_tip.set()
+        self.work_available.set()
+
+    def run(self):
+        while True:
+            self.work_available.wait()
+            with chain_lock:
+                tip = blockchain[-1]
+                transactions = list(mempool)
+                self.new_tip.clear()
+                if not transactions:
+                    self.work_available.clear()
+                    continue
+            block = create_block(tip['hash'], transactions, tip['index'] + 1)
+            if not self.mine(block):
+                print("Получен новый блок, майнинг перезапущен")
+                continue
+            if profiler.call('mined_block', add_block, block) == BLOCK_ACCEPTED:
+                metrics.inc('node_blocks_mined_total')
+                profiler.call('mined_block', broadcast, {'type': 'BLOCK', 'block': block})
+                print("Новый блок замайнен и добавлен в сеть")
+
+    def mine(self, block):
+        # Заголовок хэшируется один раз, для каждого nonce копируется состояние SHA-256
+        base = hashlib.sha256(block_header(block).encode())
+        target = "0" * DIFFICULTY
+        nonce = 0
+        while True:
+            if nonce % ABORT_CHECK_INTERVAL == 0 and self.new_tip.is_set():
+                return False
+            h = base.copy()
+            h.update(str(nonce).encode())
+            digest = h.hexdigest()
+            if digest[:DIFFICULTY] == target:
+                block['nonce'] = nonce
+                block['hash'] = digest
+                return True
+            nonce += 1
+
+miner = MiningWorker()
 
 # Функция обработки соединений между узлами
 def handle_client(client_socket):
-    data = client_socket.recv(4096).decode()
-    if not data:
-        return
-    message = json.loads(data)
-    if message['type'] == 'BLOCK':
-        if add_block(message['block']):
-            print("Блок добавлен: ", message['block'])
-            broadcast(message, client_socket)
-    elif message['type'] == 'PEER':
-        peers.add(message['peer'])
-    elif message['type'] == 'TRANSACTION':
-        print("Получена транзакция: ", message['transaction'])
-        mine_new_block([message['transaction']])
-    elif message['type'] == 'BALANCE_REQUEST':
-        balance = get_balance(message['address'])
-        response = {'type': 'BALANCE_RESPONSE', 'balance': balance}
-        client_socket.send(json.dumps(response).encode())
-    elif message['type'] == 'BLOCKCHAIN_REQUEST':
-        response = {'type': 'BLOCKCHAIN_RESPONSE', 'blockchain': blockchain}
-        client_socket.send(json.dumps(response).encode())
-    client_socket.close()
+    start = time.perf_counter()
+    message_type = 'invalid'  # Пока сообщение не разобрано
+    try:
+        data = client_socket.recv(4096).decode()
+        if not data:
+            message_type = 'empty'
+            return
+        message = json.loads(data)
+        # Тип из сети не становится меткой как есть: число серий метрик ограничено
+        message_type = message['type'] if message.get('type') in MESSAGE_TYPES else 'unknown'
+        profiler.relabel(f"handle_client-{message_type}")
+        if message['type'] == 'BLOCK':
+            result = add_block(message['block'])
+            metrics.inc('node_blocks_received_total', (('result', result),))
+            if result == BLOCK_ACCEPTED:
+                miner.notify_new_tip()
+                print("Блок добавлен: ", message['block'])
+                broadcast(message, client_socket)
+        elif message['type'] == 'PEER':
+            peers.add(message['peer'])
+        elif message['type'] == 'TRANSACTION':
+            print("Получена транзакция: ", message['transaction'])
+            # Неверная транзакция в мемпуле сделала бы каждый блок майнера невалидным
+            if valid_transaction(message['transaction']):
+                mine_new_block([message['transaction']])
+        elif message['type'] == 'BALANCE_REQUEST':
+            balance = get_balance(message['address'])
+            response = {'type': 'BALANCE_RESPONSE', 'balance': balance}
+            client_socket.send(json.dumps(response).encode())
+        elif message['type'] == 'BLOCKCHAIN_REQUEST':
+            response = {'type': 'BLOCKCHAIN_RESPONSE', 'blockchain': blockchain}
+            client_socket.send(json.dumps(response).encode())
+        elif message['type'] == 'PROFILE':
+            # Команда администратора: принимается только с этой же машины
+            if client_socket.family == socket.AF_INET and client_socket.getpeername()[0] == '127.0.0.1':
+                if message.get('action', 'start') == 'start':
+                    try:
+                        duration = parse_duration(message.get('duration'))
+                    except (TypeError, ValueError) as e:
+                        response = {'type': 'PROFILE_RESPONSE', 'error': f"duration: {e}"}
+                    else:
+                        profiler.start(duration)
+                        response = {'type': 'PROFILE_RESPONSE', 'active': True, 'until': profiler.until}
+                else:
+                    response = {'type': 'PROFILE_RESPONSE', 'active': False, 'files': profiler.stop()}
+            else:
+                response = {'type': 'PROFILE_RESPONSE', 'error': 'forbidden'}
+            client_socket.send(json.dumps(response).encode())
+        client_socket.close()
+    except Exception:
+        metrics.inc('node_message_errors_total', (('type', message_type),))
+        raise
+    finally:
+        labels = (('type', message_type),)
+        metrics.inc('node_messages_total', labels)
+        metrics.observe('node_handler_seconds', labels, time.perf_counter() - start)
 
 # Функция отправки данных всем узлам сети
 def broadcast(message, exclude_socket=None):
     for peer in peers:
+        # peers пополняется неаутентифицированными сообщениями PEER: число меток ограничено
+        label = metrics.limit_label('peer', peer, MAX_PEER_LABELS)
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             s.connect((peer, 5000))
             s.send(json.dumps(message).encode())
             s.close()
+            metrics.inc('node_broadcast_total', (('peer', label), ('result', 'success')))
         except:
+            metrics.inc('node_broadcast_total', (('peer', label), ('result', 'failure')))
             continue
 
 # Функция запуска узла сети
@@ -68,27 +348,19 @@ def start_node(port):
     print(f"Узел запущен на порту {port}")
     while True:
         client_socket, _ = server.accept()
-        client_handler = threading.Thread(target=handle_client, args=(client_socket,))
+        client_handler = threading.Thread(target=profiler.call, args=('handle_client', handle_client, client_socket))
         client_handler.start()
 
-# Функция создания нового блока (майнинг)
+# Функция передачи транзакций фоновому майнеру
 def mine_new_block(transactions):
-    prev_hash = blockchain[-1]['hash'] if blockchain else "0"
-    new_block = create_block(prev_hash, transactions)
-    if add_block(new_block):
-        broadcast({'type': 'BLOCK', 'block': new_block})
-        print("Новый блок замайнен и добавлен в сеть")
+    with chain_lock:
+        mempool.extend(transactions)
+    miner.notify_transactions()
 
-# Функция проверки баланса
+# Функция проверки баланса (балансы активной ветки поддерживаются при добавлении и откате блоков)
 def get_balance(address):
-    balance = 0
-    for block in blockchain:
-        for tx in block['transactions']:
-            if tx['to'] == address:
-                balance += tx['amount']
-            if tx['from'] == address:
-                balance -= tx['amount']
-    return balance
+    with chain_lock:
+        return balances.get(address, 0)
 
 # Функция запроса блокчейна у узлов
 def request_blockchain():
@@ -105,14 +377,30 @@ def request_blockchain():
             continue
     return []
 
-# Создание первого блока (генезис-блок)
+# Создание первого блока (генезис-блок): фиксированное время, чтобы у всех узлов
+# был один и тот же генезис и их ветки могли соединяться
 if len(blockchain) == 0:
-    blockchain.append(create_block("0", []))
+    genesis = create_block("0", [])
+    genesis['timestamp'] = 0
+    genesis['hash'] = calculate_hash(genesis)
+    add_block(genesis)
+
+# Запуск фонового майнера
+miner.start()
 
 # Запуск узла сети в отдельном потоке
 node_thread = threading.Thread(target=start_node, args=(5000,))
 node_thread.start()
 
+# Запуск HTTP-сервера метрик для Prometheus
+start_metrics_server(metrics, METRICS_PORT)
+print(f"Метрики узла: http://127.0.0.1:{METRICS_PORT}/metrics")
+
+# SIGUSR1 включает и выключает профилирование (в Windows сигнала нет, остаётся сообщение PROFILE).
+# Запись файлов идёт в отдельном потоке, чтобы не задерживать обработчик сигнала
+if hasattr(signal, 'SIGUSR1'):
+    signal.signal(signal.SIGUSR1, lambda signum, frame: threading.Thread(target=profiler.toggle, daemon=True).start())
+
 # Пример отправки транзакции
 time.sleep(5)
 new_transaction = {'from': 'Alice', 'to': 'Bob', 'amount': 10}
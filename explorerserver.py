@@ -0,0 +1,245 @@
+import argparse
+import hashlib
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Headless-эксплорер: HTTP/JSON API поверх цепочки P2P-узла (blokkuru.py,
+# nowblokexplorer.py). Цепочка периодически забирается у узла сообщением
+# BLOCKCHAIN_REQUEST, а ответы по блокам сериализуются один раз и отдаются
+# из кэша вместе с ETag, поэтому повторные запросы почти ничего не стоят.
+
+NODE_HOST = "127.0.0.1"
+NODE_PORT = 5000
+HTTP_PORT = 8080
+SYNC_INTERVAL = 5          # Секунды между синхронизациями с узлом
+# Блок с данным хэшем не меняется никогда, а блок на данной высоте (и место
+# транзакции в цепочке) меняется при реорганизации: такие ответы проверяются по ETag
+BLOCK_HASH_CACHE = "max-age=31536000, immutable"
+
+
+# Функция запроса цепочки у узла: узел закрывает сокет после ответа,
+# поэтому читаем до EOF (ответ бывает больше одного recv)
+def fetch_blockchain(host=NODE_HOST, port=NODE_PORT, timeout=10):
+    with socket.create_connection((host, port), timeout=timeout) as s:
+        s.sendall(json.dumps({'type': 'BLOCKCHAIN_REQUEST'}).encode())
+        chunks = []
+        while True:
+            chunk = s.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    response = json.loads(b"".join(chunks).decode())
+    return response.get('blockchain', [])
+
+
+# Хэш транзакции: в формате узла у транзакций нет собственного идентификатора
+def tx_hash(transaction):
+    return hashlib.sha256(json.dumps(transaction, sort_keys=True).encode()).hexdigest()
+
+
+def serialize(payload):
+    """Тело ответа и его ETag."""
+    body = json.dumps(payload, sort_keys=True).encode()
+    return body, '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+class ExplorerIndex:
+    """
+    Индексы и кэш ответов эксплорера:
+      - blocks: тела ответов /block/<height> (сериализованы при добавлении),
+      - hash_index: хэш блока -> высота, для /block/<hash>,
+      - tx_index: хэш транзакции -> (высота, номер),
+      - address_index: адрес -> [(высота, номер), ...].
+    Ответы по адресам и вершине кэшируются до появления новых блоков.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.chain = []
+        self.blocks = []
+        self.hash_index = {}
+        self.tx_index = {}
+        self.address_index = {}
+        self.tx_cache = {}
+        self.address_cache = {}
+        self.tip = None
+
+    def update(self, chain):
+        """Применить цепочку узла: добавляются только новые блоки. Возвращает число новых блоков."""
+        with self.lock:
+            common = 0
+            while (common < len(self.chain) and common < len(chain)
+                   and self.chain[common].get('hash') == chain[common].get('hash')):
+                common += 1
+            if common < len(self.chain):
+                # Узел переключился на другую ветку: индексы строятся заново с точки расхождения
+                self._truncate(common)
+            for height in range(common, len(chain)):
+                self._append(height, chain[height])
+            added = len(chain) - common
+            if added or self.tip is None:
+                self.tip = serialize(self._tip_payload())
+            return added
+
+    def _truncate(self, height):
+        del self.chain[height:]
+        del self.blocks[height:]
+        self.hash_index = {h: pos for h, pos in self.hash_index.items() if pos < height}
+        self.tx_index = {h: pos for h, pos in self.tx_index.items() if pos[0] < height}
+        for address in list(self.address_index):
+            positions = [pos for pos in self.address_index[address] if pos[0] < height]
+            if positions:
+                self.address_index[address] = positions
+            else:
+                del self.address_index[address]
+        self.tx_cache.clear()
+        self.address_cache.clear()
+
+    def _append(self, height, block):
+        self.chain.append(block)
+        self.blocks.append(serialize({'height': height, 'block': block}))
+        if block.get('hash') is not None:
+            self.hash_index[block['hash']] = height
+        for i, tx in enumerate(block.get('transactions', [])):
+            self.tx_index[tx_hash(tx)] = (height, i)
+            for address in {tx.get('from'), tx.get('to')}:
+                if address is None:
+                    continue
+                self.address_index.setdefault(str(address), []).append((height, i))
+                self.address_cache.pop(str(address), None)
+
+    def _tip_payload(self):
+        if not self.chain:
+            return {'height': None, 'hash': None}
+        return {'height': len(self.chain) - 1, 'hash': self.chain[-1].get('hash'),
+                'timestamp': self.chain[-1].get('timestamp')}
+
+    def block(self, height):
+        with self.lock:
+            if 0 <= height < len(self.blocks):
+                return self.blocks[height]
+        return None
+
+    def block_by_hash(self, hash_value):
+        with self.lock:
+            height = self.hash_index.get(hash_value)
+            return None if height is None else self.blocks[height]
+
+    def transaction(self, hash_value):
+        with self.lock:
+            cached = self.tx_cache.get(hash_value)
+            if cached is None and hash_value in self.tx_index:
+                height, index = self.tx_index[hash_value]
+                block = self.chain[height]
+                cached = serialize({'tx_hash': hash_value, 'height': height, 'index': index,
+                                    'block_hash': block.get('hash'),
+                                    'transaction': block['transactions'][index]})
+                self.tx_cache[hash_value] = cached
+            return cached
+
+    def address(self, address):
+        with self.lock:
+            cached = self.address_cache.get(address)
+            if cached is None and address in self.address_index:
+                balance = 0
+                transactions = []
+                for height, index in self.address_index[address]:
+                    tx = self.chain[height]['transactions'][index]
+                    if str(tx.get('to')) == address:
+                        balance += tx.get('amount', 0)
+                    if str(tx.get('from')) == address:
+                        balance -= tx.get('amount', 0)
+                    transactions.append({'height': height, 'index': index,
+                                         'tx_hash': tx_hash(tx), 'transaction': tx})
+                cached = serialize({'address': address, 'balance': balance,
+                                    'transactions': transactions})
+                self.address_cache[address] = cached
+            return cached
+
+    def tip_response(self):
+        with self.lock:
+            return self.tip
+
+
+class ExplorerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: клиенты переиспользуют соединение
+    index = None
+
+    def do_GET(self):
+        parts = [part for part in self.path.split("?")[0].split("/") if part]
+        response, cache_control = None, "no-cache"
+        if parts == ["tip"]:
+            response = self.index.tip_response()
+        elif len(parts) == 2 and parts[0] == "block":
+            response, cache_control = self.index.block_by_hash(parts[1]), BLOCK_HASH_CACHE
+            if response is None and parts[1].isdigit():
+                response, cache_control = self.index.block(int(parts[1])), "no-cache"
+        elif len(parts) == 2 and parts[0] == "tx":
+            response = self.index.transaction(parts[1])
+        elif len(parts) == 2 and parts[0] == "address":
+            response = self.index.address(parts[1])
+
+        if response is None:
+            self.send_json(404, json.dumps({'error': 'not found'}).encode())
+            return
+        body, etag = response
+        if etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache_control)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_json(200, body, {"ETag": etag, "Cache-Control": cache_control})
+
+    def send_json(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Не печатаем каждый запрос: при сотнях читателей это узкое место
+
+
+# Функция синхронизации с узлом в отдельном потоке
+def sync_loop(index, host, port, interval, stop_event):
+    while not stop_event.is_set():
+        try:
+            added = index.update(fetch_blockchain(host, port))
+            if added:
+                print(f"Синхронизировано блоков: {added}, высота: {len(index.chain) - 1}")
+        except (OSError, ValueError) as e:
+            print("Ошибка синхронизации с узлом:", e)
+        stop_event.wait(interval)
+
+
+def start_explorer(index, port=HTTP_PORT, host="0.0.0.0"):
+    handler = type("BoundExplorerHandler", (ExplorerHandler,), {'index': index})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP/JSON эксплорер блокчейна")
+    parser.add_argument("--node-host", default=NODE_HOST)
+    parser.add_argument("--node-port", type=int, default=NODE_PORT)
+    parser.add_argument("--port", type=int, default=HTTP_PORT)
+    parser.add_argument("--interval", type=float, default=SYNC_INTERVAL)
+    args = parser.parse_args()
+
+    index = ExplorerIndex()
+    stop_event = threading.Event()
+    server = start_explorer(index, args.port)
+    print(f"Эксплорер запущен на порту {args.port}")
+    try:
+        sync_loop(index, args.node_host, args.node_port, args.interval, stop_event)
+    except KeyboardInterrupt:
+        stop_event.set()
+        server.shutdown()
@@ -0,0 +1,230 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+from percentiles import percentile
+
+# Генератор нагрузки: поток сообщений TRANSACTION на узел (blokkuru.py, nodes.py).
+# Узел читает одно сообщение на соединение и закрывает сокет после обработки,
+# поэтому каждая транзакция — отдельное соединение, а задержка принятия — время
+# до закрытия соединения узлом. Нагрузка открытая: транзакции отправляются по
+# расписанию (целевая скорость или линейный разгон), а задержка считается от
+# запланированного момента, так что очередь на стороне клиента тоже видна.
+#   python loadgen.py --rate 500 --ramp-from 50 --ramp-seconds 20 --duration 30
+
+NODE_HOST = "127.0.0.1"
+NODE_PORT = 5000
+TICK = 0.001                # Шаг планировщика (секунды)
+MAX_PRESIGNED = 20000       # Сколько подписанных транзакций готовится заранее
+MESSAGE_LIMIT = 4096        # Узел читает сообщение одним recv(4096)
+
+
+def latency_summary(samples):
+    samples = sorted(samples)
+    summary = {'count': len(samples)}
+    for name, fraction in (('p50', 0.50), ('p90', 0.90), ('p99', 0.99), ('p999', 0.999)):
+        value = percentile(samples, fraction)
+        summary[name + '_ms'] = None if value is None else round(value * 1000, 3)
+    summary['max_ms'] = round(samples[-1] * 1000, 3) if samples else None
+    summary['mean_ms'] = round(sum(samples) / len(samples) * 1000, 3) if samples else None
+    return summary
+
+
+def sent_by(elapsed, rate, ramp_from, ramp_seconds):
+    """Сколько транзакций должно быть отправлено к моменту elapsed (интеграл скорости)."""
+    if ramp_seconds <= 0:
+        return rate * elapsed
+    if elapsed < ramp_seconds:
+        return ramp_from * elapsed + (rate - ramp_from) * elapsed * elapsed / (2 * ramp_seconds)
+    return (ramp_from + rate) * ramp_seconds / 2 + rate * (elapsed - ramp_seconds)
+
+
+# Функция подготовки транзакций: подписи ставятся заранее, чтобы скорость
+# генератора не упиралась в RSA на стороне клиента
+def build_messages(count, accounts, signed, rsa_bits, rng):
+    if signed:
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "3 Апта"))
+        from keygen import generate_rsa_keypair, sign_crt
+        wallets = []
+        for _ in range(accounts):
+            public_key, _, crt = generate_rsa_keypair(rsa_bits, rng)
+            address = hashlib.sha256(f"{public_key[0]}{public_key[1]}".encode()).hexdigest()[:40]
+            wallets.append((address, public_key, crt))
+        addresses = [wallet[0] for wallet in wallets]
+    else:
+        addresses = [f"acct{i}" for i in range(accounts)]
+
+    messages = []
+    for nonce in range(count):
+        sender, receiver = rng.sample(range(accounts), 2)
+        transaction = {'from': addresses[sender], 'to': addresses[receiver],
+                       'amount': rng.randint(1, 100), 'nonce': nonce}
+        if signed:
+            _, public_key, crt = wallets[sender]
+            digest = int(hashlib.sha256(json.dumps(transaction, sort_keys=True).encode()).hexdigest(), 16)
+            transaction['public_key'] = list(public_key)
+            transaction['signature'] = sign_crt(digest % public_key[1], crt)
+        data = json.dumps({'type': 'TRANSACTION', 'transaction': transaction}).encode()
+        if len(data) > MESSAGE_LIMIT:
+            raise ValueError(f"Сообщение {len(data)} байт не помещается в recv({MESSAGE_LIMIT}) узла")
+        messages.append(data)
+    return messages
+
+
+class LoadStats:
+    def __init__(self):
+        self.latencies = []          # От запланированного момента до закрытия соединения узлом
+        self.service_latencies = []  # От начала подключения до закрытия соединения
+        self.errors = Counter()
+        self.timeline = {}           # секунда -> {'sent', 'accepted', 'errors', 'latencies'}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def second(self, elapsed):
+        return self.timeline.setdefault(int(elapsed), {'sent': 0, 'accepted': 0, 'errors': 0, 'latencies': []})
+
+
+async def send_transaction(args, data, scheduled, started, semaphore, stats):
+    loop = asyncio.get_running_loop()
+    async with semaphore:
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        connect_started = loop.time()
+        writer = None
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(args.host, args.port), args.timeout)
+            writer.write(data)
+            await writer.drain()
+            # Узел ничего не отвечает на TRANSACTION и закрывает соединение после обработки
+            await asyncio.wait_for(reader.read(), args.timeout)
+            done = loop.time()
+            stats.latencies.append(done - scheduled)
+            stats.service_latencies.append(done - connect_started)
+            bucket = stats.second(scheduled - started)
+            bucket['accepted'] += 1
+            bucket['latencies'].append(done - scheduled)
+        except asyncio.TimeoutError:
+            stats.errors['timeout'] += 1
+            stats.second(scheduled - started)['errors'] += 1
+        except OSError as e:
+            stats.errors[type(e).__name__] += 1
+            stats.second(scheduled - started)['errors'] += 1
+        finally:
+            stats.in_flight -= 1
+            if writer is not None:
+                writer.close()
+
+
+async def run_load(args, messages):
+    loop = asyncio.get_running_loop()
+    stats = LoadStats()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    tasks = set()
+    started = loop.time()
+    sent = 0
+    while True:
+        elapsed = loop.time() - started
+        if elapsed >= args.duration:
+            break
+        due = int(sent_by(elapsed, args.rate, args.ramp_from, args.ramp_seconds))
+        while sent < due:
+            data = messages[sent % len(messages)]
+            task = asyncio.create_task(
+                send_transaction(args, data, started + elapsed, started, semaphore, stats))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            stats.second(elapsed)['sent'] += 1
+            sent += 1
+        await asyncio.sleep(TICK)
+    if tasks:
+        await asyncio.wait(tasks, timeout=args.timeout * 2)
+    for task in list(tasks):
+        task.cancel()
+        stats.errors['unfinished'] += 1
+    return stats, sent, loop.time() - started
+
+
+def build_report(args, stats, sent, wall_time, prepare_time):
+    accepted = len(stats.latencies)
+    errors = sum(stats.errors.values())
+    timeline = []
+    for second in sorted(stats.timeline):
+        bucket = stats.timeline[second]
+        latencies = sorted(bucket['latencies'])
+        timeline.append({
+            'second': second,
+            'target_rate': round(sent_by(second + 1, args.rate, args.ramp_from, args.ramp_seconds)
+                                 - sent_by(second, args.rate, args.ramp_from, args.ramp_seconds), 1),
+            'sent': bucket['sent'],
+            'accepted': bucket['accepted'],
+            'errors': bucket['errors'],
+            'p50_ms': None if not latencies else round(percentile(latencies, 0.50) * 1000, 3),
+            'p99_ms': None if not latencies else round(percentile(latencies, 0.99) * 1000, 3),
+        })
+    return {
+        'meta': {
+            'target': f"{args.host}:{args.port}",
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'params': {key: value for key, value in vars(args).items() if key != "output"},
+            'prepare_sec': round(prepare_time, 3),
+        },
+        'totals': {
+            'sent': sent,
+            'accepted': accepted,
+            'errors': errors,
+            'error_rate': round(errors / sent, 4) if sent else None,
+            'errors_by_kind': dict(stats.errors),
+            'wall_time_sec': round(wall_time, 3),
+            'accepted_per_sec': round(accepted / wall_time, 2) if wall_time else None,
+            'max_in_flight': stats.max_in_flight,
+        },
+        'latency': latency_summary(stats.latencies),
+        'service_latency': latency_summary(stats.service_latencies),
+        'timeline': timeline,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Нагрузочный поток транзакций на узел сети")
+    parser.add_argument("--host", default=NODE_HOST)
+    parser.add_argument("--port", type=int, default=NODE_PORT)
+    parser.add_argument("--rate", type=float, default=100, help="Целевая скорость, транзакций/с")
+    parser.add_argument("--ramp-from", type=float, default=0, help="Начальная скорость разгона")
+    parser.add_argument("--ramp-seconds", type=float, default=0, help="Длительность линейного разгона до --rate")
+    parser.add_argument("--duration", type=float, default=10, help="Длительность отправки, секунды")
+    parser.add_argument("--concurrency", type=int, default=200, help="Максимум одновременных соединений")
+    parser.add_argument("--timeout", type=float, default=5)
+    parser.add_argument("--accounts", type=int, default=20)
+    parser.add_argument("--signed", action="store_true", help="Подписывать транзакции RSA-ключами отправителей")
+    parser.add_argument("--rsa-bits", type=int, default=1024)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Файл для JSON-отчёта (по умолчанию stdout)")
+    args = parser.parse_args()
+    if args.ramp_seconds <= 0:
+        args.ramp_from = args.rate
+
+    rng = random.Random(args.seed)
+    expected = int(sent_by(args.duration, args.rate, args.ramp_from, args.ramp_seconds)) + 1
+    prepare_started = time.perf_counter()
+    messages = build_messages(min(expected, MAX_PRESIGNED), max(2, args.accounts),
+                              args.signed, args.rsa_bits, rng)
+    prepare_time = time.perf_counter() - prepare_started
+
+    stats, sent, wall_time = asyncio.run(run_load(args, messages))
+    report = build_report(args, stats, sent, wall_time, prepare_time)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    totals = report['totals']
+    print(f"Отправлено {totals['sent']}, принято {totals['accepted']}, ошибок {totals['errors']}, "
+          f"p99 {report['latency']['p99_ms']} мс", file=sys.stderr)
@@ -0,0 +1,140 @@
+import bisect
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Метрики P2P-узла в текстовом формате Prometheus (text exposition 0.0.4).
+# Обновление метрики в обработчике — это взятие одной блокировки и пара
+# операций со словарём; форматирование текста происходит только при
+# запросе /metrics, поэтому на горячем пути узла накладные расходы малы.
+
+METRICS_PORT = 9100
+# Границы корзин гистограммы задержек обработчика (секунды)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+               for value in labels.values())
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + "}"
+
+
+class NodeMetrics:
+    """
+    Реестр метрик узла:
+      - счётчики с метками: inc(name, labels, amount),
+      - гистограммы задержек: observe(name, labels, seconds),
+      - значения, вычисляемые при выгрузке: gauge(name, help, fn).
+    Метки передаются кортежем пар ((имя, значение), ...), чтобы служить ключом словаря.
+    """
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.lock = threading.Lock()
+        self.buckets = buckets
+        self.help = {}
+        self.counters = {}    # имя -> {метки: значение}
+        self.histograms = {}  # имя -> {метки: [счётчики корзин..., +Inf, сумма]}
+        self.gauges = {}      # имя -> функция без аргументов
+        self.label_values = {}  # вид метки -> значения, получившие собственную метку
+        self.started = time.time()
+
+    def describe(self, name, text):
+        self.help[name] = text
+
+    def inc(self, name, labels=(), amount=1):
+        with self.lock:
+            series = self.counters.setdefault(name, {})
+            series[labels] = series.get(labels, 0) + amount
+
+    def limit_label(self, kind, value, limit):
+        """
+        Значение метки для данных из сети (адреса узлов и т. п.): первые limit
+        различных значений используются как есть, остальные сводятся в "other",
+        чтобы число серий метрик оставалось ограниченным.
+        """
+        with self.lock:
+            seen = self.label_values.setdefault(kind, set())
+            if value in seen or len(seen) < limit:
+                seen.add(value)
+                return str(value)
+        return "other"
+
+    def observe(self, name, labels, seconds):
+        # Номер корзины ищется до взятия блокировки
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self.lock:
+            series = self.histograms.setdefault(name, {})
+            values = series.get(labels)
+            if values is None:
+                values = series[labels] = [0] * (len(self.buckets) + 2)
+            values[index] += 1
+            values[-1] += seconds
+
+    def gauge(self, name, text, fn):
+        self.help[name] = text
+        self.gauges[name] = fn
+
+    def render(self):
+        """Все метрики в текстовом формате Prometheus."""
+        with self.lock:
+            counters = {name: dict(series) for name, series in self.counters.items()}
+            histograms = {name: {labels: list(values) for labels, values in series.items()}
+                          for name, series in self.histograms.items()}
+        lines = []
+
+        def header(name, kind):
+            if name in self.help:
+                lines.append(f"# HELP {name} {self.help[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for name in sorted(counters):
+            header(name, "counter")
+            for labels, value in sorted(counters[name].items()):
+                lines.append(f"{name}{format_labels(dict(labels))} {value}")
+        for name in sorted(histograms):
+            header(name, "histogram")
+            for labels, values in sorted(histograms[name].items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + ("+Inf",), values):
+                    cumulative += count
+                    le = bound if bound == "+Inf" else repr(float(bound))
+                    lines.append(f"{name}_bucket{format_labels({**dict(labels), 'le': le})} {cumulative}")
+                lines.append(f"{name}_sum{format_labels(dict(labels))} {values[-1]!r}")
+                lines.append(f"{name}_count{format_labels(dict(labels))} {cumulative}")
+        for name in sorted(self.gauges):
+            header(name, "gauge")
+            try:
+                lines.append(f"{name} {self.gauges[name]()}")
+            except Exception as e:  # Сломанная метрика не должна ломать всю выгрузку
+                lines.append(f"# {name}: {e}")
+        header("node_uptime_seconds", "gauge")
+        lines.append(f"node_uptime_seconds {time.time() - self.started:.3f}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    metrics = None
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.metrics.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Prometheus опрашивает каждые несколько секунд, не засоряем вывод узла
+
+
+# Функция запуска HTTP-сервера метрик (по умолчанию только на localhost)
+def start_metrics_server(metrics, port=METRICS_PORT, host="127.0.0.1"):
+    handler = type("BoundMetricsHandler", (MetricsHandler,), {'metrics': metrics})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,167 @@
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+# Профилирование работающего узла без перезапуска. На время окна:
+#   - вызовы, обёрнутые в profiler.call(label, ...), выполняются под cProfile,
+#     статистика по каждой метке копится и сбрасывается в <label>.pstats;
+#   - поток-сэмплер раз в SAMPLE_INTERVAL снимает стеки всех потоков через
+#     sys._current_frames() и пишет их в формате collapsed stacks
+#     (flamegraph.pl, speedscope, inferno).
+# Вне окна call() — это одна проверка флага и прямой вызов функции.
+
+PROFILE_DIR = "profiles"
+PROFILE_DURATION = 30     # Длительность окна по умолчанию (секунды)
+MAX_PROFILE_DURATION = 3600
+SAMPLE_INTERVAL = 0.005   # Период снятия стеков сэмплером (секунды)
+
+
+def parse_duration(value, default=PROFILE_DURATION):
+    """Длительность окна из сообщения: положительное число секунд не больше MAX_PROFILE_DURATION."""
+    if value is None:
+        return float(default)
+    if isinstance(value, bool):
+        raise ValueError("длительность должна быть числом")
+    duration = float(value)  # ValueError/TypeError для нечисловых значений
+    if not 0 < duration <= MAX_PROFILE_DURATION:  # Отсекает и NaN
+        raise ValueError(f"длительность должна быть в (0, {MAX_PROFILE_DURATION}]")
+    return duration
+
+
+def frame_name(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class NodeProfiler:
+    """
+    Переключаемый профилировщик:
+        profiler.start(duration)              # окно профилирования
+        profiler.call('handle_client', fn, *args)
+        profiler.stop()                       # досрочно; иначе по таймеру
+    Каждый sample_every-й вызов по метке попадает под cProfile. Вложенные
+    вызовы в уже профилируемом потоке учитываются во внешнем профиле; внешний
+    вызов может уточнить свою метку через relabel() (например, по типу сообщения).
+    """
+    def __init__(self, output_dir=PROFILE_DIR, sample_every=1, sample_interval=SAMPLE_INTERVAL):
+        self.output_dir = output_dir
+        self.sample_every = sample_every
+        self.sample_interval = sample_interval
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.active = False
+        self.until = None
+        self.stats = {}       # метка -> pstats.Stats
+        self.calls = Counter()
+        self.stacks = Counter()
+        self.timer = None
+        self.sampler = None
+        self.last_files = []
+
+    def start(self, duration=PROFILE_DURATION):
+        """Начать окно профилирования. Возвращает False, если окно уже открыто."""
+        duration = parse_duration(duration)
+        with self.lock:
+            if self.active:
+                return False
+            self.until = time.time() + duration
+            self.stats = {}
+            self.calls = Counter()
+            self.stacks = Counter()
+            self.sampler = threading.Thread(target=self._sample_loop, name="profiler-sampler", daemon=True)
+            self.timer = threading.Timer(duration, self.stop)
+            self.timer.daemon = True
+            # Окно открывается только когда таймер и сэмплер созданы: иначе stop() было бы нечего останавливать
+            self.active = True
+            self.sampler.start()
+            self.timer.start()
+        print(f"Профилирование включено на {duration} с")
+        return True
+
+    def stop(self):
+        """Закрыть окно и записать результаты. Возвращает список файлов."""
+        with self.lock:
+            if not self.active:
+                return []
+            self.active = False
+            timer, sampler = self.timer, self.sampler
+        if timer is not threading.current_thread():
+            timer.cancel()
+        sampler.join()
+        with self.lock:
+            self.last_files = self._dump()
+        print("Профилирование завершено:", ", ".join(self.last_files))
+        return self.last_files
+
+    def toggle(self, duration=PROFILE_DURATION):
+        if self.active:
+            self.stop()
+        else:
+            self.start(duration)
+
+    def call(self, label, fn, *args, **kwargs):
+        """Вызвать fn; во время окна — под cProfile (с учётом sample_every)."""
+        if not self.active or getattr(self.local, 'profiling', False):
+            return fn(*args, **kwargs)
+        with self.lock:
+            self.calls[label] += 1
+            sampled = self.calls[label] % self.sample_every == 0
+        if not sampled:
+            return fn(*args, **kwargs)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:  # Python 3.12+: профилировщик уже активен в другом потоке
+            return fn(*args, **kwargs)
+        self.local.profiling = True
+        self.local.label = label
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profile.disable()
+            self.local.profiling = False
+            label = self.local.label
+            with self.lock:
+                if label in self.stats:
+                    self.stats[label].add(profile)
+                else:
+                    self.stats[label] = pstats.Stats(profile)
+
+    def relabel(self, label):
+        """Сменить метку профилируемого в этом потоке вызова."""
+        if getattr(self.local, 'profiling', False):
+            self.local.label = label
+
+    def _sample_loop(self):
+        own = threading.get_ident()
+        while self.active:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(frame_name(frame))
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}"))
+                self.stacks[";".join(reversed(stack))] += 1
+            time.sleep(self.sample_interval)
+
+    def _dump(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        prefix = os.path.join(self.output_dir, time.strftime("profile-%Y%m%d-%H%M%S"))
+        files = []
+        for label, stats in self.stats.items():
+            path = f"{prefix}-{label}.pstats"
+            stats.dump_stats(path)
+            files.append(path)
+        path = prefix + ".collapsed"
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        files.append(path)
+        return files
@@ -0,0 +1,17 @@
+import math
+
+# Перцентили для отчётов бенчмарков (benchmarks/run.py) и генератора нагрузки
+# (loadgen.py): одна реализация, чтобы числа в отчётах были сравнимы.
+
+
+def percentile(samples, fraction):
+    """
+    Перцентиль по отсортированной выборке методом ближайшего ранга: элемент
+    с рангом ceil(fraction * n), то есть наименьшее значение, которого не
+    превышают не меньше доли fraction всех замеров.
+    """
+    if not samples:
+        return None
+    # Округление убирает погрешность float (0.035 * 200 = 7.000000000000001)
+    rank = math.ceil(round(fraction * len(samples), 9))
+    return samples[max(1, min(len(samples), rank)) - 1]